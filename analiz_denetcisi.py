@@ -0,0 +1,214 @@
+# analiz_denetcisi.py
+# Amaç: Takılmaya dayanıklı analiz işçi havuzu (data_loader.py 'havuz' modu).
+#
+# multiprocessing.Pool tek bir işçiyi öldürüp yeniden başlatamaz; Zemberek'i sonsuz döngüye
+# sokan tek bir kelime, pool.map'i sonsuza kadar bekletir. Bu denetçi:
+#   - Her işçiyle ayrı bir Pipe üzerinden konuşur, görevleri boşta olan işçiye sırasız dağıtır,
+#   - Her göreve kelime sayısıyla orantılı bir süre sınırı koyar,
+#   - Süresi dolan (veya çöken) işçiyi öldürüp yenisini başlatır,
+#   - Takılan görevi ikiye bölerek (bisection) sorunlu kelimeyi yalnız bırakır ve
+#     onu 'zemberek_hata' olarak kaydeder,
+#   - JVM heap büyümesini geri kazanmak için işçileri belirli sayıda görevden sonra yeniler.
+
+import sys
+import time
+import multiprocessing as mp
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# İşçi başlatma (JVM + Zemberek) art arda bu kadar kez başarısız olursa denetçi durur.
+AZAMI_BASLATMA_HATASI = 3
+
+
+def _isci_dongusu(conn, initializer: Optional[Callable], gorev_fonksiyonu: Callable):
+    """İşçi süreci: başlat, 'hazır' bildir, kapatma (None) gelene kadar görev işle."""
+    if initializer is not None:
+        initializer()
+    conn.send(('hazir', None, None))
+    while True:
+        try:
+            gorev = conn.recv()
+        except EOFError:
+            return
+        if gorev is None:
+            return
+        gorev_no, words = gorev
+        conn.send(('sonuc', gorev_no, gorev_fonksiyonu(words)))
+
+
+class _Isci:
+    """Denetçinin bir işçi süreci hakkında tuttuğu durum."""
+
+    def __init__(self, ctx, initializer, gorev_fonksiyonu):
+        self.conn, cocuk_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_isci_dongusu, args=(cocuk_conn, initializer, gorev_fonksiyonu),
+                                   daemon=True)
+        self.process.start()
+        cocuk_conn.close()
+        self.hazir = False
+        self.gorev = None          # (gorev_no, baslangic, words)
+        self.son_tarih = None      # görev süre sınırı (time.monotonic)
+        self.gorev_sayisi = 0
+
+    def oldur(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(5)
+        self.conn.close()
+
+
+class AnalizDenetcisi:
+    """
+    Kelime listelerini işçi süreçlerine dağıtır; takılan/çöken işçileri yönetir.
+    gorev_fonksiyonu(words) -> words ile aynı sırada satır listesi döndürmelidir.
+    hata_satiri(word, aciklama) -> bir kelime yalnız başına da takılırsa yazılacak satır.
+    ozet_toplayici verilirse görev sonuçları (ör. işçinin kendi dosyasına yazdığı satır sayısı)
+    ona iletilir ve analiz_et yalnızca hata satırlarını döndürür.
+    """
+
+    def __init__(self, num_workers: int, initializer: Optional[Callable], gorev_fonksiyonu: Callable,
+                 hata_satiri: Callable[[str, str], Tuple], parca_boyutu: int = 500,
+                 taban_sure: float = 10.0, kelime_suresi: float = 0.05, gorev_limiti: int = 500,
+                 ozet_toplayici: Optional[Callable] = None):
+        self.num_workers = num_workers
+        self.initializer = initializer
+        self.gorev_fonksiyonu = gorev_fonksiyonu
+        self.hata_satiri = hata_satiri
+        self.parca_boyutu = parca_boyutu
+        self.taban_sure = taban_sure
+        self.kelime_suresi = kelime_suresi
+        self.gorev_limiti = gorev_limiti
+        self.ozet_toplayici = ozet_toplayici
+
+        self._ctx = mp.get_context()
+        self._gorev_no = 0
+        self._baslatma_hatasi = 0
+        # İstatistikler (data_loader ilerleme çıktısı için)
+        self.zaman_asimi_sayisi = 0
+        self.yenilenen_isci_sayisi = 0
+        self.hatali_kelimeler: List[str] = []
+
+        self.isciler: List[_Isci] = [self._isci_baslat() for _ in range(num_workers)]
+
+    def _isci_baslat(self) -> _Isci:
+        return _Isci(self._ctx, self.initializer, self.gorev_fonksiyonu)
+
+    def _isciyi_degistir(self, isci: _Isci, oldur: bool) -> _Isci:
+        if oldur:
+            isci.oldur()
+        else:
+            # Nazik kapatma (yenileme): görev bitmiştir, kapanmasını kısa süre bekle
+            try:
+                isci.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            isci.process.join(5)
+            isci.oldur()
+        yeni = self._isci_baslat()
+        self.isciler[self.isciler.index(isci)] = yeni
+        return yeni
+
+    def pids(self) -> List[int]:
+        return [isci.process.pid for isci in self.isciler if isci.process.pid]
+
+    def analiz_et(self, words: Sequence[str]) -> List[Tuple]:
+        """words listesini analiz eder; sonuçlar girdi sırasıyla döner (bkz. ozet_toplayici)."""
+        sonuclar: List[Optional[Tuple]] = [None] * len(words)
+        bekleyen = deque((i, list(words[i:i + self.parca_boyutu]))
+                         for i in range(0, len(words), self.parca_boyutu))
+        kalan = len(bekleyen)
+        calisan: Dict[int, Tuple[int, List[str]]] = {}
+
+        while kalan:
+            # 1. Boştaki hazır işçilere görev ver
+            for isci in self.isciler:
+                if not bekleyen:
+                    break
+                if isci.hazir and isci.gorev is None:
+                    baslangic, parca = bekleyen.popleft()
+                    self._gorev_no += 1
+                    isci.gorev = (self._gorev_no, baslangic, parca)
+                    isci.son_tarih = time.monotonic() + self.taban_sure + self.kelime_suresi * len(parca)
+                    calisan[self._gorev_no] = (baslangic, parca)
+                    isci.conn.send((self._gorev_no, parca))
+
+            # 2. Bir sonuç, bir hazır bildirimi veya en yakın süre sınırını bekle
+            son_tarihler = [isci.son_tarih for isci in self.isciler if isci.gorev is not None]
+            bekleme = max(0.0, min(son_tarihler) - time.monotonic()) if son_tarihler else 1.0
+            hazir_connlar = wait([isci.conn for isci in self.isciler], timeout=bekleme)
+
+            for isci in list(self.isciler):
+                if isci.conn in hazir_connlar:
+                    try:
+                        tur, gorev_no, veri = isci.conn.recv()
+                    except (EOFError, OSError):
+                        kalan += self._isci_coktu(isci, bekleyen, calisan, sonuclar, "İşçi çöktü")
+                        continue
+                    if tur == 'hazir':
+                        isci.hazir = True
+                        self._baslatma_hatasi = 0
+                        continue
+                    baslangic, parca = calisan.pop(gorev_no)
+                    if self.ozet_toplayici is not None:
+                        self.ozet_toplayici(veri)
+                    else:
+                        sonuclar[baslangic:baslangic + len(parca)] = veri
+                    isci.gorev = None
+                    isci.son_tarih = None
+                    isci.gorev_sayisi += 1
+                    kalan -= 1
+                    if isci.gorev_sayisi >= self.gorev_limiti:
+                        # JVM heap'ini geri kazanmak için işçiyi yenile
+                        self.yenilenen_isci_sayisi += 1
+                        self._isciyi_degistir(isci, oldur=False)
+                elif isci.gorev is not None and time.monotonic() >= isci.son_tarih:
+                    self.zaman_asimi_sayisi += 1
+                    kalan += self._isci_coktu(isci, bekleyen, calisan, sonuclar, "Zaman aşımı")
+
+        if self.ozet_toplayici is not None:
+            return [satir for satir in sonuclar if satir is not None]
+        return sonuclar
+
+    def _isci_coktu(self, isci: _Isci, bekleyen: deque, calisan: Dict, sonuclar: List,
+                    aciklama: str) -> int:
+        """
+        Takılan/çöken işçiyi değiştirir ve görevini ikiye bölerek kuyruğun başına koyar.
+        Tek kelimelik görev takıldıysa kelime hata satırıyla kaydedilir.
+        Bekleyen görev sayısındaki değişimi döndürür.
+        """
+        gorev = isci.gorev
+        if gorev is None and not isci.hazir:
+            # Başlatma (JVM/Zemberek) sırasında öldü
+            self._baslatma_hatasi += 1
+            if self._baslatma_hatasi >= AZAMI_BASLATMA_HATASI:
+                self.kapat()
+                raise RuntimeError(f"İşçiler art arda {AZAMI_BASLATMA_HATASI} kez başlatılamadı.")
+        self._isciyi_degistir(isci, oldur=True)
+        if gorev is None:
+            return 0
+
+        gorev_no, baslangic, parca = gorev
+        calisan.pop(gorev_no, None)
+        if len(parca) == 1:
+            word = parca[0]
+            print(f"UYARI: '{word}' kelimesi işçiyi kilitledi/çökertti ({aciklama}); hata olarak kaydedildi.",
+                  file=sys.stderr)
+            self.hatali_kelimeler.append(word)
+            sonuclar[baslangic] = self.hata_satiri(word, aciklama)
+            return -1
+        orta = len(parca) // 2
+        # Önce küçük parçalar denensin: sorunlu kelime hızla yalnız kalır
+        bekleyen.appendleft((baslangic + orta, parca[orta:]))
+        bekleyen.appendleft((baslangic, parca[:orta]))
+        return 1
+
+    def kapat(self):
+        for isci in self.isciler:
+            try:
+                isci.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for isci in self.isciler:
+            isci.process.join(5)
+            isci.oldur()
@@ -0,0 +1,315 @@
+# analiz_deposu.py
+# Amaç: Zemberek analiz sonuçları için kompakt, rastgele erişilebilir ikili depo (.adp).
+# analysis_results.tsv'ye alternatiftir: db_loader.py doğrudan yükleyebilir, diğer araçlar
+# tek bir kelimenin analizini dosyanın tamamını okumadan bulabilir.
+#
+# Kullanım:
+#   python analiz_deposu.py donustur analysis_results.tsv -o analysis_results.adp
+#   python analiz_deposu.py donustur analiz_parcalari/*.tsv -o analysis_results.adp
+#   python analiz_deposu.py bul analysis_results.adp kitaplarım
+#   python analiz_deposu.py bilgi analysis_results.adp
+#   python db_loader.py analysis_results.adp
+#
+# Dosya yapısı:
+#   [SIHIRLI_BAYTLAR][başlık] [blok 0] [blok 1] ... [sözlükler] [blok indeksi] [son ek]
+#   - Satırlar kelimeye göre sıralı ve tekildir; her blok BLOK_SATIR_SAYISI satır içerir.
+#   - Blok (zlib): sabit genişlikli satır dizisi (SATIR) + blok kelimelerinin UTF-8 yığını.
+#   - lemma/kök, ekler, analiz kalıbı ve yöntem metinleri birer sözlükte bir kez tutulur;
+#     satırlar bunlara tamsayı kimlikle başvurur. Analiz metnindeki lemma, KALIP_LEMMA ile
+#     değiştirilerek saklanır ('[kitap:Noun] kitap:Noun+lar:A3pl' -> '[\x01:Noun] \x01:Noun+lar:A3pl'),
+#     böylece aynı ek dizilimine sahip binlerce kelime tek bir kalıbı paylaşır.
+#   - Blok indeksi her bloğun ofsetini, boyutunu ve ilk kelimesini tutar (ikili arama).
+
+import argparse
+import bisect
+import csv
+import os
+import struct
+import sys
+import time
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+SIHIRLI_BAYTLAR = b'DRLMADP1'
+UZANTI = '.adp'
+BLOK_SATIR_SAYISI = 1024
+ZLIB_SEVIYESI = 6
+KALIP_LEMMA = '\x01'
+
+# Başlık: blok satır sayısı, toplam satır
+BASLIK = struct.Struct('<IQ')
+# Satır: kelime sonu (blok yığınında), lemma, kök, ekler, analiz kalıbı, yöntem
+SATIR = struct.Struct('<IIIIIB')
+# Blok indeksi kaydı: ofset, sıkıştırılmış boyut, satır sayısı, ilk kelimenin bayt uzunluğu
+INDEKS_KAYDI = struct.Struct('<QIII')
+# Son ek: sözlükler ofseti, indeks ofseti, blok sayısı, SIHIRLI_BAYTLAR
+SON_EK = struct.Struct('<QQI8s')
+
+# Sözlükler (sırası dosyada sabittir); lemma ve kök aynı sözlüğü paylaşır
+SOZLUKLER = ('kok', 'ekler', 'kalip', 'yontem')
+
+AnalizSatiri = Tuple[str, str, str, str, str, str]
+
+
+def analiz_kalibi(analiz: str, lemma: str) -> str:
+    """Analiz metnindeki lemmayı KALIP_LEMMA ile değiştirir; geri dönüşüm kayıpsız değilse metni aynen döndürür."""
+    if not lemma or KALIP_LEMMA in analiz:
+        return analiz
+    kalip = analiz.replace(lemma, KALIP_LEMMA)
+    return kalip if kalip.replace(KALIP_LEMMA, lemma) == analiz else analiz
+
+
+def kalibi_ac(kalip: str, lemma: str) -> str:
+    return kalip.replace(KALIP_LEMMA, lemma) if KALIP_LEMMA in kalip else kalip
+
+
+class _Sozluk:
+    """Metin -> kimlik eşlemesi (kimlikler ekleme sırasıyla 0'dan başlar)."""
+
+    def __init__(self):
+        self.kimlikler: Dict[str, int] = {}
+        self.metinler: List[str] = []
+
+    def kimlik(self, metin: str) -> int:
+        k = self.kimlikler.get(metin)
+        if k is None:
+            k = self.kimlikler[metin] = len(self.metinler)
+            self.metinler.append(metin)
+        return k
+
+
+def _sozlugu_paketle(metinler: Sequence[str]) -> bytes:
+    """Sözlük: metin sayısı + sıkıştırılmış boyut + zlib('\\0' ile ayrılmış UTF-8 metinler)."""
+    veri = zlib.compress('\0'.join(metinler).encode('utf-8'), ZLIB_SEVIYESI)
+    return struct.pack('<II', len(metinler), len(veri)) + veri
+
+
+def _sozlugu_coz(tampon: bytes, konum: int) -> Tuple[List[str], int]:
+    sayi, uzunluk = struct.unpack_from('<II', tampon, konum)
+    konum += 8
+    metinler = zlib.decompress(tampon[konum:konum + uzunluk]).decode('utf-8').split('\0') if sayi else []
+    return metinler, konum + uzunluk
+
+
+class AnalizDeposuYazici:
+    """
+    Kelimeye göre sıralı ve tekil satırları .adp dosyasına yazar (bkz. tsv_donustur).
+    Bloklar doldukça diske yazılır; sözlükler ve indeks kapatılırken eklenir.
+    """
+
+    def __init__(self, path: str, blok_satir_sayisi: int = BLOK_SATIR_SAYISI):
+        self.path = path
+        self.blok_satir_sayisi = blok_satir_sayisi
+        self.sozlukler = {ad: _Sozluk() for ad in SOZLUKLER}
+        self.indeks: List[Tuple[int, int, int, bytes]] = []
+        self.toplam = 0
+        self._blok: List[AnalizSatiri] = []
+        self._son_kelime: Optional[str] = None
+        self._f = None
+
+    def __enter__(self):
+        # Yarım kalan dosya asıl adı almasın: geçici adla yaz, kapatırken atomik olarak taşı
+        self._f = open(self.path + '.tmp', 'wb')
+        self._f.write(SIHIRLI_BAYTLAR + BASLIK.pack(self.blok_satir_sayisi, 0))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self._f.close()
+            os.remove(self.path + '.tmp')
+            return False
+        self._blogu_yaz()
+        sozluk_ofseti = self._f.tell()
+        for ad in SOZLUKLER:
+            self._f.write(_sozlugu_paketle(self.sozlukler[ad].metinler))
+        indeks_ofseti = self._f.tell()
+        for ofset, boyut, sayi, ilk in self.indeks:
+            self._f.write(INDEKS_KAYDI.pack(ofset, boyut, sayi, len(ilk)) + ilk)
+        self._f.write(SON_EK.pack(sozluk_ofseti, indeks_ofseti, len(self.indeks), SIHIRLI_BAYTLAR))
+        self._f.seek(len(SIHIRLI_BAYTLAR))
+        self._f.write(BASLIK.pack(self.blok_satir_sayisi, self.toplam))
+        self._f.close()
+        os.replace(self.path + '.tmp', self.path)
+        return False
+
+    def ekle(self, row: AnalizSatiri):
+        kelime = row[0]
+        if self._son_kelime is not None and kelime <= self._son_kelime:
+            raise ValueError(f"Satırlar kelimeye göre sıralı ve tekil olmalı: '{self._son_kelime}' -> '{kelime}'")
+        self._son_kelime = kelime
+        self._blok.append(row)
+        if len(self._blok) >= self.blok_satir_sayisi:
+            self._blogu_yaz()
+
+    def _blogu_yaz(self):
+        if not self._blok:
+            return
+        kok, ekler, kalip, yontem = (self.sozlukler[ad] for ad in SOZLUKLER)
+        satirlar = bytearray()
+        yigin = bytearray()
+        for kelime, lemma, kok_metni, ek, analiz, yntm in self._blok:
+            yigin += kelime.encode('utf-8')
+            satirlar += SATIR.pack(len(yigin), kok.kimlik(lemma), kok.kimlik(kok_metni), ekler.kimlik(ek),
+                                   kalip.kimlik(analiz_kalibi(analiz, lemma)), yontem.kimlik(yntm))
+        sikistirilmis = zlib.compress(bytes(satirlar) + bytes(yigin), ZLIB_SEVIYESI)
+        self.indeks.append((self._f.tell(), len(sikistirilmis), len(self._blok), self._blok[0][0].encode('utf-8')))
+        self._f.write(sikistirilmis)
+        self.toplam += len(self._blok)
+        self._blok = []
+
+
+class AnalizDeposu:
+    """
+    .adp dosyasını okur. Yalnızca sözlükler ve blok indeksi belleğe alınır;
+    bloklar istendiğinde açılır (son açılan blok önbellekte tutulur).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, 'rb')
+        if self._f.read(len(SIHIRLI_BAYTLAR)) != SIHIRLI_BAYTLAR:
+            raise ValueError(f"{path} bir analiz deposu (.adp) dosyası değil.")
+        self.blok_satir_sayisi, self.toplam = BASLIK.unpack(self._f.read(BASLIK.size))
+        self._f.seek(-SON_EK.size, os.SEEK_END)
+        sozluk_ofseti, indeks_ofseti, blok_sayisi, sihir = SON_EK.unpack(self._f.read(SON_EK.size))
+        if sihir != SIHIRLI_BAYTLAR:
+            raise ValueError(f"{path} eksik yazılmış (son ek bulunamadı).")
+
+        self._f.seek(sozluk_ofseti)
+        tampon = self._f.read(indeks_ofseti - sozluk_ofseti)
+        konum = 0
+        self.sozlukler: Dict[str, List[str]] = {}
+        for ad in SOZLUKLER:
+            self.sozlukler[ad], konum = _sozlugu_coz(tampon, konum)
+
+        tampon = self._f.read()[:-SON_EK.size]
+        konum = 0
+        self._bloklar: List[Tuple[int, int, int]] = []
+        self._ilk_kelimeler: List[str] = []
+        for _ in range(blok_sayisi):
+            ofset, boyut, sayi, ilk_uzunluk = INDEKS_KAYDI.unpack_from(tampon, konum)
+            konum += INDEKS_KAYDI.size
+            self._ilk_kelimeler.append(tampon[konum:konum + ilk_uzunluk].decode('utf-8'))
+            konum += ilk_uzunluk
+            self._bloklar.append((ofset, boyut, sayi))
+        self._son_blok: Tuple[int, Optional[Tuple[List[str], List[tuple]]]] = (-1, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.kapat()
+        return False
+
+    def kapat(self):
+        self._f.close()
+
+    def __len__(self):
+        return self.toplam
+
+    def _blogu_oku(self, i: int) -> Tuple[List[str], List[tuple]]:
+        if self._son_blok[0] == i:
+            return self._son_blok[1]
+        ofset, boyut, sayi = self._bloklar[i]
+        self._f.seek(ofset)
+        ham = zlib.decompress(self._f.read(boyut))
+        satir_sonu = sayi * SATIR.size
+        satirlar = list(SATIR.iter_unpack(ham[:satir_sonu]))
+        yigin = ham[satir_sonu:]
+        kelimeler = []
+        bas = 0
+        for satir in satirlar:
+            kelimeler.append(yigin[bas:satir[0]].decode('utf-8'))
+            bas = satir[0]
+        self._son_blok = (i, (kelimeler, satirlar))
+        return kelimeler, satirlar
+
+    def _satir(self, kelime: str, satir: tuple) -> AnalizSatiri:
+        kok, ekler, kalip, yontem = (self.sozlukler[ad] for ad in SOZLUKLER)
+        _, lemma_id, kok_id, ekler_id, kalip_id, yontem_id = satir
+        lemma = kok[lemma_id]
+        return (kelime, lemma, kok[kok_id], ekler[ekler_id], kalibi_ac(kalip[kalip_id], lemma), yontem[yontem_id])
+
+    def bul(self, kelime: str) -> Optional[AnalizSatiri]:
+        """Kelimenin analiz satırını döndürür (yoksa None). Tek blok açılır."""
+        i = bisect.bisect_right(self._ilk_kelimeler, kelime) - 1
+        if i < 0:
+            return None
+        kelimeler, satirlar = self._blogu_oku(i)
+        j = bisect.bisect_left(kelimeler, kelime)
+        if j < len(kelimeler) and kelimeler[j] == kelime:
+            return self._satir(kelime, satirlar[j])
+        return None
+
+    def __iter__(self) -> Iterator[AnalizSatiri]:
+        for i in range(len(self._bloklar)):
+            kelimeler, satirlar = self._blogu_oku(i)
+            for kelime, satir in zip(kelimeler, satirlar):
+                yield self._satir(kelime, satir)
+
+
+# --- TSV DÖNÜŞTÜRÜCÜ ---
+
+def tsv_satirlari(tsv_paths: Iterable[str]) -> Iterator[AnalizSatiri]:
+    """TSV dosyalarındaki geçerli (6 kolonlu) satırlar."""
+    for path in tsv_paths:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.reader(f, delimiter='\t'):
+                if len(row) == 6 and row[0]:
+                    yield tuple(row)
+
+
+def tsv_donustur(tsv_paths: Sequence[str], adp_path: str, blok_satir_sayisi: int = BLOK_SATIR_SAYISI) -> int:
+    """
+    TSV'leri .adp deposuna dönüştürür. Aynı kelime birden çok kez geçerse ilki alınır
+    (db_loader'ın INSERT OR IGNORE davranışı). Satırlar sıralanmak üzere belleğe alınır.
+    """
+    satirlar: Dict[str, AnalizSatiri] = {}
+    for row in tsv_satirlari(tsv_paths):
+        satirlar.setdefault(row[0], row)
+    with AnalizDeposuYazici(adp_path, blok_satir_sayisi) as yazici:
+        for kelime in sorted(satirlar):
+            yazici.ekle(satirlar[kelime])
+    return len(satirlar)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zemberek analiz sonuçları için ikili depo (.adp) aracı.")
+    alt = parser.add_subparsers(dest='komut', required=True)
+    p = alt.add_parser('donustur', help="TSV dosyalarını .adp deposuna dönüştür")
+    p.add_argument('tsv', nargs='+')
+    p.add_argument('-o', '--cikti', default='analysis_results' + UZANTI)
+    p.add_argument('--blok', type=int, default=BLOK_SATIR_SAYISI, help="Blok başına satır sayısı")
+    p = alt.add_parser('bul', help="Kelimelerin analizini göster")
+    p.add_argument('depo')
+    p.add_argument('kelimeler', nargs='+')
+    p = alt.add_parser('bilgi', help="Depo istatistikleri")
+    p.add_argument('depo')
+    args = parser.parse_args()
+
+    if args.komut == 'donustur':
+        eksikler = [path for path in args.tsv if not os.path.exists(path)]
+        if eksikler:
+            print(f"HATA: TSV dosyası bulunamadı: {', '.join(eksikler)}", file=sys.stderr)
+            sys.exit(1)
+        start = time.time()
+        toplam = tsv_donustur(args.tsv, args.cikti, args.blok)
+        tsv_boyutu = sum(os.path.getsize(path) for path in args.tsv)
+        adp_boyutu = os.path.getsize(args.cikti)
+        print(f"-> {toplam:,} satır {args.cikti} dosyasına yazıldı ({time.time() - start:.1f} sn).")
+        print(f"-> Boyut: TSV {tsv_boyutu / 1e6:,.1f} MB -> ADP {adp_boyutu / 1e6:,.1f} MB "
+              f"(%{100 * adp_boyutu / tsv_boyutu if tsv_boyutu else 0:.0f})")
+    elif args.komut == 'bul':
+        with AnalizDeposu(args.depo) as depo:
+            for kelime in args.kelimeler:
+                row = depo.bul(kelime)
+                print('\t'.join(row) if row else f"{kelime}\t(bulunamadı)")
+    else:
+        with AnalizDeposu(args.depo) as depo:
+            print(f"Satır: {len(depo):,} | Blok: {len(depo._bloklar):,} x {depo.blok_satir_sayisi} satır")
+            for ad in SOZLUKLER:
+                print(f"Sözlük '{ad}': {len(depo.sozlukler[ad]):,} metin")
+
+
+if __name__ == '__main__':
+    main()
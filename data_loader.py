@@ -1,6 +1,6 @@
 # data_loader.py
 # Amaç: Yüksek Performanslı ve Hata Toleranslı Zemberek Yükleyici.
-# Çözüm: Multiprocessing Pool ile analiz ve sonuçları TSV dosyasına kaydetme.
+# Çözüm: Takılmaya dayanıklı işçi havuzu (analiz_denetcisi.py) (veya tek JVM + Java iş parçacıkları) ile analiz ve sonuçları TSV dosyasına kaydetme.
 # analysis_results.tsv dosyasını oluşturur.
 # Gemini (Verimli SQLite Veri Yükleme Stratejisi)
 
@@ -9,80 +9,159 @@ import glob
 import sqlite3
 import sys
 import csv
-from typing import List, Tuple
-from multiprocessing import Pool, cpu_count, current_process
+import time
+import json
+import bisect
+import hashlib
+import argparse
+import queue
+import uuid
+import functools
+from array import array
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from multiprocessing import current_process, get_context
 
-# Zemberek/Jpype kütüphaneleri
-try:
-    from jpype import startJVM, getDefaultJVMPath, JClass, JString, shutdownJVM
-except ImportError:
-    print("HATA: jpype1 kütüphanesi kurulu değil. Lütfen kontrol edin.")
-    sys.exit(1)
+import morfoloji
+import analiz_denetcisi
+import db_loader
+import lexicon_sema
+import sistem_kaynaklari
 
 # --- GLOBAL KONFİGÜRASYONLAR ---
-morphology = None
-TurkishMorphology = None
+analizci = None
+# Morfoloji arka ucu (morfoloji.py): 'oto', 'jpype', 'servis', 'python' veya 'bos'.
+# 'oto': morfoloji servisi çalışıyorsa servis, çalışmıyorsa jpype.
+# DERLEM_MORFOLOJI ortam değişkeniyle değiştirilebilir.
+MORFOLOJI_ARKA_UCU = 'oto'
 ZEMBEREK_PATH = os.path.abspath('zemberek-full.jar')
+# Her işçiye daha az RAM veriyoruz (32GB RAM için 2GB yeterli).
+# main() bunun yerine kaynak_plani() ile makineye göre seçilen heap'i kullanır.
+JVM_ARGUMANLARI = ('-ea', '-Xmx2g')
 TSV_OUTPUT_FILE = 'analysis_results.tsv'
 
+# Çıktı modu:
+#   'tsv'    : Sonuçlar TSV_OUTPUT_FILE'a yazılır, veritabanına db_loader.py ile aktarılır.
+#   'sqlite' : Sonuçlar sınırlı bir kuyrukla ayrı bir yazıcı sürecine akar ve doğrudan
+#              kelimeler tablosuna yazılır (TSV ara adımı yok). --tsv-kopya ile arşiv TSV'si de yazılır.
+#   'parca'  : 'havuz' modunda her işçi kendi TSV parça dosyasını yazar (sonuçlar ana sürece taşınmaz).
+#              Parçalar PARCA_DIZINI'nde toplanır; db_loader.py parça manifestini yükler.
+CIKTI_MODU = 'tsv'
+CIKTI_MODLARI = ('tsv', 'sqlite', 'parca')
+PARCA_DIZINI = 'analiz_parcalari'
+PARCA_MANIFESTI = os.path.join(PARCA_DIZINI, 'parcalar.manifest')
+# Yazıcı kuyruğunda bekleyebilecek en fazla batch sayısı (bellek sınırı; dolunca analiz bekler)
+YAZICI_KUYRUK_BOYUTU = 8
+
+# Analiz modu:
+#   'havuz'   : N işçi süreci, her birinde ayrı JVM ve ayrı Zemberek sözlüğü (JVM_ARGUMANLARI ile)
+#   'tek_jvm' : Ana süreçte tek JVM ve tek TurkishMorphology; batch'ler Java tarafında
+#               tüm çekirdekleri kullanan bir iş parçacığı havuzuyla analiz edilir.
+ANALIZ_MODU = 'havuz'
+ANALIZ_MODLARI = ('havuz', 'tek_jvm')
+# Tek JVM tüm iş parçacıklarına hizmet ettiği için tek bir (daha büyük) heap yeterlidir
+TEK_JVM_ARGUMANLARI = ('-ea', '-Xmx4g')
+
+# 'havuz' modu denetçisi (analiz_denetcisi.py):
+# Görev boyutu (kelime). Küçük görevler takılan kelimenin hızla yalnız bırakılmasını sağlar.
+ISCI_GOREV_BOYUTU = 500
+# Görev süre sınırı = GOREV_TABAN_SURESI + KELIME_ZAMAN_ASIMI * kelime sayısı (saniye)
+GOREV_TABAN_SURESI = 10.0
+KELIME_ZAMAN_ASIMI = 0.05
+# Her işçi bu kadar görevden sonra yenilenir (JVM heap büyümesine karşı)
+ISCI_GOREV_LIMITI = 500
+
+# Kaynak planı (kaynak_plani): işçi sayısı ve JVM heap'i CPU sayısı ve /proc/meminfo'dan seçilir.
+# Kullanılabilir belleğin (MemAvailable) analize ayrılabilecek oranı
+BELLEK_PAYI = 0.8
+# 'havuz' modunda işçi başına heap (MB) ve bellek azsa inilebilecek en düşük heap
+ISCI_HEAP_MB = 2048
+ISCI_MIN_HEAP_MB = 1024
+# JVM'nin heap dışı yükü (metaspace, JIT, iş parçacıkları) + işçinin Python süreci (MB)
+JVM_EK_BELLEK_MB = 512
+# 'tek_jvm' modunda heap sınırları (MB)
+TEK_JVM_MIN_HEAP_MB = 2048
+TEK_JVM_MAX_HEAP_MB = 16384
+
+# Uyarlamalı batch boyutu (BatchAyarlayici): her batch yaklaşık HEDEF_BATCH_SURESI sürsün
+BATCH_BOYUTU = 5000
+HEDEF_BATCH_SURESI = 3.0
+MIN_BATCH_BOYUTU = 1000
+MAX_BATCH_BOYUTU = 100000
+# KelimeIndeksi özetleri, üst bitlerine göre ortalama bu kadar özetlik kovalarda sıralanır
+# (geçici Python int listesi en fazla bir kova kadar özet tutar)
+INDEKS_KOVA_BOYUTU = 1 << 17
+
 # --- ZEMBEREK İŞÇİ FONKSİYONLARI ---
 
-def zemberek_pool_worker_init():
+# 'parca' çıktısında işçinin kendi parça dosyası
+parca_dosyasi = None
+parca_csv = None
+
+def zemberek_pool_worker_init(jvm_args: Optional[Tuple[str, ...]] = None):
     """
     Bu fonksiyon, her işçi süreci (worker) başladığında YALNIZCA BİR KEZ çalışır.
-    JVM'yi başlatır ve Zemberek'i belleğe yükler (Tek seferlik maliyet).
+    Morfoloji arka ucunu (jpype için JVM + Zemberek) belleğe yükler (Tek seferlik maliyet).
     """
-    global morphology, TurkishMorphology
+    global analizci
     
     try:
-        # Her işçiye daha az RAM veriyoruz (32GB RAM için 2GB yeterli)
-        startJVM(getDefaultJVMPath(), '-ea', f'-Djava.class.path={ZEMBEREK_PATH}', '-Xmx2g') 
-        TurkishMorphology = JClass('zemberek.morphology.TurkishMorphology')
-        morphology = TurkishMorphology.createWithDefaults()
+        analizci = morfoloji.analizci_olustur(varsayilan=MORFOLOJI_ARKA_UCU,
+                                              jar_path=ZEMBEREK_PATH, jvm_args=jvm_args or JVM_ARGUMANLARI)
         # print(f"-> İşçi {current_process().pid}: Zemberek Hazır.") # Gürültüyü azaltmak için kapatıldı
     except Exception as e:
         print(f"-> İşçi {current_process().pid}: JVM/Zemberek Başlatma Hatası: {e}", file=sys.stderr)
         sys.exit(1)
 
-def format_morphemes(analysis):
-    """Ekleri (iyor-um) formatında çıkarır."""
-    morpheme_data_list = analysis.getMorphemeDataList()
-    if morpheme_data_list.size() <= 1: 
-        return ""
-    surface_forms = [str(morpheme_data_list.get(i).surface) for i in range(1, morpheme_data_list.size())]
-    return f"({'-'.join(surface_forms)})"
+def tsv_satiri(word: str, sonuc) -> Tuple:
+    """Analizci sonucunu TSV satırına çevirir. Tanınmayan kelime de kaydedilir."""
+    if sonuc is None:
+        return (word, word, "", "", "", "zemberek")
+    return sonuc
 
 def analyze_single_word(word: str) -> Tuple:
     """
     Her kelimeyi analiz eder (İşçi Pool'u tarafından tekrar tekrar kullanılır).
     """
-    global morphology
-    
-    if morphology is None:
+    if analizci is None:
         return (word, "", "", "", "HATA: JVM başlatılamadı", "zemberek_hata")
 
-    try:
-        j_word = JString(word)
-        analysis = morphology.analyze(j_word) 
-        results = analysis.getAnalysisResults()
-        
-        if results.isEmpty():
-            return (word, word, "", "", "", "zemberek")
-        
-        best_result = results.get(0)
-        
-        lemma = str(best_result.getLemmas()[0])
-        kok = str(best_result.getStems()[0])
-        ekler = format_morphemes(best_result)
-        analiz_tam = str(best_result.formatLong())
-        yontem = "zemberek"
-        
-        # TSV'ye yazılacak format: kelime, lemma, kok, ekler, analiz, yontem
-        return (word, lemma, kok, ekler, analiz_tam, yontem)
+    # Analiz sırasında takılma/çökme yaşanırsa, hata analizci içinde yakalanır (yontem: zemberek_hata).
+    # TSV'ye yazılacak format: kelime, lemma, kok, ekler, analiz, yontem
+    return tsv_satiri(word, analizci.analyze(word))
 
-    except Exception as e:
-        # Analiz sırasında takılma/çökme yaşanırsa, hata yakalanır ve atlanır.
-        return (word, word, "", "", f"HATA: Analiz Hatası ({e})", "zemberek_hata")
+def analyze_word_batch(words: List[str]) -> List[Tuple]:
+    """
+    Bir kelime grubunu tek analyze_batch çağrısıyla analiz eder.
+    jpype arka ucunda grup, Java'ya tek bir String[] olarak gider (kelime başına JNI geçişi yok).
+    """
+    if analizci is None:
+        return [(word, "", "", "", "HATA: JVM başlatılamadı", "zemberek_hata") for word in words]
+
+    return [tsv_satiri(word, sonuc) for word, sonuc in zip(words, analizci.analyze_batch(words))]
+
+def zemberek_parca_isci_init(parca_dizini: str, jvm_args: Optional[Tuple[str, ...]] = None):
+    """'parca' çıktısı: Zemberek'i yükler ve işçiye özel bir parça dosyası açar."""
+    global parca_dosyasi, parca_csv
+    zemberek_pool_worker_init(jvm_args)
+    # Parça, yayımlanana (ana süreç .part uzantısını kaldırana) kadar .part adıyla yazılır
+    yol = os.path.join(parca_dizini, f"isci_{os.getpid()}_{uuid.uuid4().hex[:8]}.tsv.part")
+    parca_dosyasi = open(yol, 'a', encoding='utf-8', newline='')
+    parca_csv = csv.writer(parca_dosyasi, delimiter='\t', quoting=csv.QUOTE_MINIMAL)
+
+def analyze_word_batch_to_shard(words: List[str]) -> Tuple[str, int, int]:
+    """
+    Grubu analiz edip satırları işçinin parça dosyasına yazar.
+    Ana sürece sadece (parça yolu, satır sayısı, geçerli dosya sonu) döner; satırlar taşınmaz.
+    """
+    rows = analyze_word_batch(words)
+    parca_csv.writerows(rows)
+    parca_dosyasi.flush()
+    os.fsync(parca_dosyasi.fileno())
+    return parca_dosyasi.name, len(rows), os.fstat(parca_dosyasi.fileno()).st_size
+
+def zaman_asimi_satiri(word: str, aciklama: str) -> Tuple:
+    """İşçiyi kilitleyen/çökerten kelime için TSV satırı."""
+    return (word, "", "", "", f"HATA: {aciklama}", "zemberek_hata")
 
 # --- VERİTABANI YÖNETİMİ ---
 
@@ -94,7 +173,7 @@ class DBManager:
     def setup_database(self):
         """SQLite veritabanı tablolarını oluşturur/günceller."""
         print(f"-> Veritabanı {self.db_path} ve tablolar oluşturuluyor/güncelleniyor...")
-        script = """
+        script = f"""
             CREATE TABLE IF NOT EXISTS kelimeler (
                 id INTEGER PRIMARY KEY,
                 kelime TEXT NOT NULL UNIQUE,
@@ -105,6 +184,7 @@ class DBManager:
                 yontem TEXT,
                 aciklama TEXT,
                 onay INTEGER DEFAULT 0,
+                {lexicon_sema.kok_kolonlari_tanimi()},
                 CHECK (LENGTH(kelime) > 0)
             );
         """
@@ -150,57 +230,501 @@ class DBManager:
             raise
 
 
+# --- KAYNAK PLANI VE UYARLAMALI BATCH ---
+
+class KaynakPlani(NamedTuple):
+    isci_sayisi: int          # 'havuz': işçi süreci, 'tek_jvm': Java iş parçacığı sayısı
+    heap_mb: int              # 'havuz': işçi başına, 'tek_jvm': tek JVM'nin heap'i
+    jvm_args: Tuple[str, ...]
+
+def kaynak_plani(mod: str, isci_sayisi: Optional[int] = None, heap_mb: Optional[int] = None) -> KaynakPlani:
+    """
+    CPU sayısı ve kullanılabilir bellekten (/proc/meminfo) işçi sayısı ve JVM heap'ini seçer.
+    'havuz' modunda her işçi ayrı bir JVM olduğu için işçi sayısı belleğe sığacak kadar sınırlanır.
+    isci_sayisi / heap_mb verilirse o değerler kullanılır.
+    """
+    cpu = sistem_kaynaklari.cpu_sayisi()
+    butce = sistem_kaynaklari.kullanilabilir_bellek_mb() * BELLEK_PAYI
+
+    if mod == 'tek_jvm':
+        if heap_mb is None:
+            heap_mb = int(min(max(butce - JVM_EK_BELLEK_MB, TEK_JVM_MIN_HEAP_MB), TEK_JVM_MAX_HEAP_MB)) \
+                if butce else 4096
+        isci_sayisi = isci_sayisi or cpu
+    else:
+        if heap_mb is None:
+            heap_mb = ISCI_HEAP_MB
+            if butce and butce < ISCI_HEAP_MB + JVM_EK_BELLEK_MB:
+                # Tek işçi bile sığmıyor: heap'i küçült
+                heap_mb = int(max(butce - JVM_EK_BELLEK_MB, ISCI_MIN_HEAP_MB))
+        if isci_sayisi is None:
+            if butce:
+                isci_sayisi = max(1, min(cpu, int(butce // (heap_mb + JVM_EK_BELLEK_MB))))
+            else:
+                # Bellek okunamadı (/proc yok): eski sabit değer
+                isci_sayisi = min(cpu, 6)
+    return KaynakPlani(isci_sayisi, heap_mb, ('-ea', f'-Xmx{heap_mb}m'))
+
+
+class BatchAyarlayici:
+    """
+    Batch boyutunu ölçülen batch süresine göre ayarlar: her batch yaklaşık hedef_sure sürer.
+    Küçük batch'lerde işçiler batch sonlarında boşta bekler, çok büyük batch'ler ise bellek ve
+    ilerleme/devam ayrıntısını kaybettirir.
+    """
+
+    def __init__(self, baslangic: int = BATCH_BOYUTU, hedef_sure: float = HEDEF_BATCH_SURESI,
+                 en_az: int = MIN_BATCH_BOYUTU, en_cok: int = MAX_BATCH_BOYUTU):
+        self.boyut = baslangic
+        self.hedef_sure = hedef_sure
+        self.en_az = en_az
+        self.en_cok = en_cok
+        self.olcum_sayisi = 0
+
+    def guncelle(self, kelime_sayisi: int, sure: float):
+        self.olcum_sayisi += 1
+        # İlk batch (JVM ısınması) ve chunk sonundaki kısmi batch'ler ölçüme katılmaz
+        if self.olcum_sayisi == 1 or sure <= 0 or kelime_sayisi < self.boyut:
+            return
+        hedef = kelime_sayisi / sure * self.hedef_sure
+        # Ani sıçramaları yumuşat; tek adımda en fazla 2 kat değiştir
+        yeni = min(max(0.5 * self.boyut + 0.5 * hedef, self.boyut / 2), self.boyut * 2)
+        self.boyut = int(min(max(yeni, self.en_az), self.en_cok))
+
+
+# --- ANALİZ MOTORU ---
+
+class AnalizMotoru:
+    """
+    Kelime batch'lerini seçilen moda göre analiz eder (bkz. ANALIZ_MODU).
+    Bütün chunk'lar için bir kez açılır; JVM'ler her chunk'ta yeniden başlatılmaz.
+    """
+
+    def __init__(self, mod: str = ANALIZ_MODU, num_processes: int = 1, parca_dizini: Optional[str] = None,
+                 jvm_args: Optional[Tuple[str, ...]] = None):
+        if mod not in ANALIZ_MODLARI:
+            raise ValueError(f"Geçersiz analiz modu: {mod} (geçerli: {', '.join(ANALIZ_MODLARI)})")
+        self.mod = mod
+        self.num_processes = num_processes
+        self.jvm_args = jvm_args or (TEK_JVM_ARGUMANLARI if mod == 'tek_jvm' else JVM_ARGUMANLARI)
+        self.denetci = None
+        # parca_dizini verilirse ('havuz' modunda) işçiler sonuçları kendi parça dosyalarına yazar
+        self.parca_dizini = parca_dizini if mod == 'havuz' else None
+        self.parca_ofsetleri = {}
+
+    def __enter__(self):
+        global analizci
+        # Eksik kütüphane/JAR durumunda işçiler sürekli çöküp yeniden başlamasın: önce ana süreçte denetle
+        morfoloji.arka_ucu_denetle('jpype' if self.mod == 'tek_jvm' else None, MORFOLOJI_ARKA_UCU, ZEMBEREK_PATH)
+        if self.mod == 'havuz':
+            print(f"-> {self.num_processes} adet paralel Zemberek işçisi (worker) başlatılıyor "
+                  f"({' '.join(self.jvm_args)}). (Bu birkaç saniye sürecek)...")
+            if self.parca_dizini:
+                initializer = functools.partial(zemberek_parca_isci_init, self.parca_dizini, self.jvm_args)
+                gorev, ozet_toplayici = analyze_word_batch_to_shard, self._parca_ozeti
+            else:
+                initializer = functools.partial(zemberek_pool_worker_init, self.jvm_args)
+                gorev, ozet_toplayici = analyze_word_batch, None
+            self.denetci = analiz_denetcisi.AnalizDenetcisi(
+                self.num_processes, initializer, gorev, zaman_asimi_satiri,
+                parca_boyutu=ISCI_GOREV_BOYUTU, taban_sure=GOREV_TABAN_SURESI,
+                kelime_suresi=KELIME_ZAMAN_ASIMI, gorev_limiti=ISCI_GOREV_LIMITI,
+                ozet_toplayici=ozet_toplayici)
+        else:
+            print(f"-> Tek JVM başlatılıyor ({self.num_processes} Java iş parçacığı, {' '.join(self.jvm_args)})...")
+            analizci = morfoloji.analizci_olustur('jpype', jar_path=ZEMBEREK_PATH, jvm_args=self.jvm_args,
+                                                  thread_sayisi=self.num_processes)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.denetci is not None:
+            self.denetci.kapat()
+            if self.denetci.zaman_asimi_sayisi or self.denetci.yenilenen_isci_sayisi:
+                print(f"-> Denetçi: {self.denetci.zaman_asimi_sayisi} zaman aşımı, "
+                      f"{len(self.denetci.hatali_kelimeler)} hatalı kelime, "
+                      f"{self.denetci.yenilenen_isci_sayisi} işçi yenilemesi.")
+        if self.parca_dizini:
+            # İşçiler kapandı: parçaları son bildirilen konuma kesip yayımla. Öldürülen işçinin
+            # bildirilmemiş (yeniden analiz edilmiş) satırları böylece iki kez yazılmaz.
+            for part_path in glob.glob(os.path.join(self.parca_dizini, 'isci_*.tsv.part')):
+                parcayi_yayimla(part_path, self.parca_ofsetleri.get(part_path, 0))
+        return False
+
+    def _parca_ozeti(self, ozet: Tuple[str, int, int]):
+        part_path, _, ofset = ozet
+        self.parca_ofsetleri[part_path] = max(ofset, self.parca_ofsetleri.get(part_path, 0))
+
+    def analiz_et(self, word_batch: List[str]) -> List[Tuple]:
+        """
+        Bir batch'i analiz eder; sonuçlar girdi sırasıyla TSV satırları olarak döner.
+        Parça çıktısında satırları işçiler yazar; yalnızca ana sürecin yazması gereken
+        hata satırları (işçiyi kilitleyen kelimeler) döner.
+        """
+        if self.denetci is None:
+            return analyze_word_batch(word_batch)
+        # Batch, ISCI_GOREV_BOYUTU'luk görevlere bölünüp boştaki işçilere dağıtılır; her görev işçide
+        # tek bir toplu analiz çağrısıdır (kelime başına görev/JNI geçişi yok).
+        # Bir işçi süre sınırını aşarsa öldürülür, görevi ikiye bölünerek yeniden denenir ve
+        # takılmaya yol açan kelime 'zemberek_hata' olarak yazılır.
+        return self.denetci.analiz_et(word_batch)
+
+    def bellek_mb(self) -> float:
+        """Ana süreç ve (varsa) tüm işçi süreçlerinin toplam fiziksel bellek kullanımı."""
+        pids = [os.getpid()]
+        if self.denetci is not None:
+            pids.extend(self.denetci.pids())
+        return sistem_kaynaklari.toplam_rss_mb(pids)
+
+
+# --- KALDIĞI YERDEN DEVAM (RESUME) ---
+
+class KelimeIndeksi:
+    """
+    Daha önce analiz edilmiş kelimelerin kompakt indeksi.
+    Her kelime 8 baytlık blake2b özetiyle sıralı bir dizide tutulur (2M kelime ~16 MB);
+    üyelik kontrolü ikili arama ile yapılır. Kurulum sırasında en fazla ~iki dizi boyu
+    (2M kelime ~32 MB) ve bir sıralama parçası kadar ek bellek kullanılır.
+    """
+
+    def __init__(self, ozetler: Iterable[int]):
+        self._ozetler = self._sirala(array('Q', ozetler))
+
+    @staticmethod
+    def _sirala(ozetler: array) -> array:
+        """
+        Özet dizisini sıralar ve tekrarları atar. sorted(set(...)) gibi tüm özetleri Python int
+        nesnelerine (özet başına ~40 bayt) çevirmemek için özetler üst bitlerine göre kovalara
+        dağıtılır (özetler düzgün dağılımlıdır) ve kovalar sırayla sıralanıp eklenir.
+        """
+        bit = (len(ozetler) // INDEKS_KOVA_BOYUTU).bit_length()
+        kaydirma = 64 - bit
+        kovalar = [array('Q') for _ in range(1 << bit)]
+        for h in ozetler:
+            kovalar[h >> kaydirma].append(h)
+        del ozetler[:]
+        sirali = array('Q')
+        for i, kova in enumerate(kovalar):
+            sirali.extend(sorted(set(kova)))
+            kovalar[i] = None
+        return sirali
+
+    @staticmethod
+    def ozet(word: str) -> int:
+        return int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+
+    def __len__(self):
+        return len(self._ozetler)
+
+    def __contains__(self, word: str) -> bool:
+        h = self.ozet(word)
+        i = bisect.bisect_left(self._ozetler, h)
+        return i < len(self._ozetler) and self._ozetler[i] == h
+
+    @classmethod
+    def olustur(cls, tsv_path=TSV_OUTPUT_FILE, db_path: Optional[str] = None) -> 'KelimeIndeksi':
+        """
+        TSV'nin (veya TSV parça listesinin) ilk kolonundaki ve istenirse kelimeler tablosundaki
+        kelimelerden indeks kurar.
+        """
+        ozet = cls.ozet
+        tsv_paths = [tsv_path] if isinstance(tsv_path, str) else list(tsv_path or [])
+
+        def kelimeler():
+            for path in tsv_paths:
+                if not os.path.exists(path):
+                    continue
+                with open(path, 'r', encoding='utf-8', newline='') as f:
+                    for line in f:
+                        if line.startswith('"'):
+                            # csv tarafından tırnaklanmış nadir kelime: tam ayrıştır
+                            yield next(csv.reader([line], delimiter='\t'))[0]
+                        else:
+                            yield line.split('\t', 1)[0]
+            if db_path and os.path.exists(db_path):
+                with sqlite3.connect(db_path) as conn:
+                    for (word,) in conn.execute("SELECT kelime FROM kelimeler"):
+                        yield word
+
+        return cls(ozet(word) for word in kelimeler())
+
+
+def tsv_kuyrugunu_onar(tsv_path: str = TSV_OUTPUT_FILE) -> int:
+    """
+    Çökme anında yarım yazılmış son satırı TSV'den keser (sonraki ekleme bozuk satıra yapışmasın).
+    Kesilen bayt sayısını döndürür.
+    """
+    if not os.path.exists(tsv_path):
+        return 0
+    with open(tsv_path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return 0
+        # Son satır sonunu geriye doğru ara
+        pos = size
+        while pos > 0:
+            step = min(pos, 1 << 16)
+            f.seek(pos - step)
+            block = f.read(step)
+            nl = block.rfind(b'\n')
+            if nl >= 0:
+                pos = pos - step + nl + 1
+                break
+            pos -= step
+        if pos < size:
+            f.truncate(pos)
+        return size - pos
+
+
+def tamamlanma_isareti_yolu(chunk_file: str) -> str:
+    return chunk_file + '.tamam'
+
+
+def chunk_tamamlandi_mi(chunk_file: str) -> bool:
+    """Chunk için geçerli (dosya değişmemiş) bir tamamlanma işareti var mı?"""
+    try:
+        with open(tamamlanma_isareti_yolu(chunk_file), 'r', encoding='utf-8') as f:
+            isaret = json.load(f)
+        st = os.stat(chunk_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    return isaret.get('size') == st.st_size and isaret.get('mtime') == st.st_mtime
+
+def chunk_tamamlandi_isaretle(chunk_file: str, kelime_sayisi: int):
+    """Chunk'ın TSV'ye eksiksiz yazıldığını kaydeder (atomik yazma)."""
+    st = os.stat(chunk_file)
+    isaret_yolu = tamamlanma_isareti_yolu(chunk_file)
+    with open(isaret_yolu + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'size': st.st_size, 'mtime': st.st_mtime, 'kelime_sayisi': kelime_sayisi,
+                   'tarih': time.strftime('%Y-%m-%d %H:%M:%S')}, f)
+    os.replace(isaret_yolu + '.tmp', isaret_yolu)
+
+
+# --- PARÇA (SHARD) DOSYALARI ---
+
+def parcayi_yayimla(part_path: str, ofset: Optional[int] = None):
+    """
+    '.part' parça dosyasını (verilirse) ofsete keser, yarım kalmış son satırı temizler ve
+    '.part' uzantısını atomik olarak kaldırır (yayımlanmış parçalar hep tam satırlardan oluşur).
+    """
+    if ofset is not None:
+        with open(part_path, 'rb+') as f:
+            f.truncate(ofset)
+    tsv_kuyrugunu_onar(part_path)
+    if os.path.getsize(part_path) == 0:
+        # Hiç satır yazmadan kapanan/öldürülen işçinin boş parçası
+        os.remove(part_path)
+        return
+    os.replace(part_path, part_path[:-len('.part')])
+
+def parcalari_kurtar(parca_dizini: str = PARCA_DIZINI) -> int:
+    """Çöken bir önceki çalışmadan kalan '.part' dosyalarını yayımlar (tam satırlar geçerli sonuçlardır)."""
+    kalanlar = glob.glob(os.path.join(parca_dizini, '*.tsv.part'))
+    for part_path in kalanlar:
+        parcayi_yayimla(part_path)
+    return len(kalanlar)
+
+def parcalari_listele(parca_dizini: str = PARCA_DIZINI) -> List[str]:
+    return sorted(glob.glob(os.path.join(parca_dizini, '*.tsv')))
+
+def parca_manifestini_yaz(parca_dizini: str = PARCA_DIZINI, manifest_path: str = PARCA_MANIFESTI) -> int:
+    """Yayımlanmış parçaların listesini db_loader.py için manifest dosyasına yazar (atomik)."""
+    parcalar = parcalari_listele(parca_dizini)
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+        for part_path in parcalar:
+            f.write(os.path.relpath(part_path, os.path.dirname(manifest_path)) + '\n')
+    os.replace(manifest_path + '.tmp', manifest_path)
+    return len(parcalar)
+
+
+# --- SONUÇ YAZICILARI ---
+
+class TsvYazici:
+    """Sonuçları TSV_OUTPUT_FILE'a ekler (veritabanına db_loader.py ile aktarılır)."""
+
+    def __init__(self, tsv_path: str = TSV_OUTPUT_FILE):
+        self.tsv_path = tsv_path
+        self.tsvfile = None
+
+    def __enter__(self):
+        # 'a': append modu. Program çökerse --devam ile yeniden başlatıldığında TSV'deki kelimeler atlanır.
+        self.tsvfile = open(self.tsv_path, 'a', encoding='utf-8', newline='')
+        self.tsv_writer = csv.writer(self.tsvfile, delimiter='\t', quoting=csv.QUOTE_MINIMAL)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tsvfile.close()
+        return False
+
+    def yaz(self, rows: List[Tuple]):
+        self.tsv_writer.writerows(rows)
+
+    def chunk_bitti(self, chunk_file: str, kelime_sayisi: int):
+        # İşaret ancak veriler diske ulaştıktan sonra yazılır
+        self.tsvfile.flush()
+        os.fsync(self.tsvfile.fileno())
+        chunk_tamamlandi_isaretle(chunk_file, kelime_sayisi)
+
+
+class ParcaYazici(TsvYazici):
+    """
+    'parca' çıktısı: satırları işçiler kendi parça dosyalarına yazar; ana süreç yalnızca kendisine dönen
+    satırları (hata satırları; 'tek_jvm' modunda tüm satırlar) kendi parça dosyasına yazar.
+    """
+
+    def __init__(self, parca_dizini: str = PARCA_DIZINI):
+        super().__init__(os.path.join(parca_dizini, f"ana_{os.getpid()}_{uuid.uuid4().hex[:8]}.tsv.part"))
+
+    def __exit__(self, exc_type, exc, tb):
+        super().__exit__(exc_type, exc, tb)
+        parcayi_yayimla(self.tsv_path)
+        return False
+
+
+class SqliteYazici:
+    """
+    Sonuçları sınırlı bir kuyruk üzerinden ayrı bir yazıcı sürecine (db_loader.kuyruktan_yukle) gönderir;
+    yazıcı, db_loader ile aynı PRAGMA'larla büyük işlemler halinde kelimeler tablosuna yazar.
+    guncelle=True ise var olan kelimelerin değişen analizleri güncellenir (db_loader.UPSERT_SQL).
+    """
+
+    def __init__(self, db_path: str, tsv_kopya: Optional[str] = None, guncelle: bool = False):
+        self.db_path = db_path
+        self.tsv_kopya = tsv_kopya
+        self.guncelle = guncelle
+        self.process = None
+
+    def __enter__(self):
+        ctx = get_context()
+        self.kuyruk = ctx.Queue(maxsize=YAZICI_KUYRUK_BOYUTU)
+        self.process = ctx.Process(target=db_loader.kuyruktan_yukle,
+                                   args=(self.kuyruk, self.db_path, self.tsv_kopya, chunk_tamamlandi_isaretle,
+                                         self.guncelle))
+        self.process.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._gonder(None)
+            self.process.join()
+        else:
+            self.process.terminate()
+            self.process.join()
+        if exc_type is None and self.process.exitcode != 0:
+            raise RuntimeError(f"SQLite yazıcı süreci hata ile sonlandı (çıkış kodu {self.process.exitcode}).")
+        return False
+
+    def _gonder(self, mesaj):
+        # Kuyruk doluysa bekle; yazıcı süreci ölmüşse sonsuza kadar bekleme
+        while True:
+            try:
+                self.kuyruk.put(mesaj, timeout=1)
+                return
+            except queue.Full:
+                if not self.process.is_alive():
+                    raise RuntimeError(f"SQLite yazıcı süreci beklenmedik şekilde sonlandı "
+                                       f"(çıkış kodu {self.process.exitcode}).")
+
+    def yaz(self, rows: List[Tuple]):
+        self._gonder(('satirlar', rows))
+
+    def chunk_bitti(self, chunk_file: str, kelime_sayisi: int):
+        # Tamamlanma işaretini yazıcı, chunk'ın son satırlarını commit ettikten sonra yazar
+        self._gonder(('isaret', (chunk_file, kelime_sayisi)))
+
+
 # --- ANA İŞ AKIŞI ---
 
-def process_chunk_and_load(chunk_file: str, num_processes: int, batch_size: int = 5000):
+def process_chunk_and_load(chunk_file: str, motor: AnalizMotoru, yazici, batch_size: int = BATCH_BOYUTU,
+                           mevcut: Optional[KelimeIndeksi] = None, ayarlayici: Optional[BatchAyarlayici] = None,
+                           db_path: Optional[str] = None):
+    """Bir chunk'ı analiz edip yazıcıya verir. ayarlayici verilirse batch boyutu ölçülen süreye göre değişir."""
     
     # 1. Kelimeleri Oku
     with open(chunk_file, 'r', encoding='utf-8') as f:
         words = [line.strip() for line in f if line.strip()]
         
+    print(f"\n--- 📂 {chunk_file} işleniyor. Toplam {len(words)} kelime bulundu. ---")
+    if mevcut is not None:
+        # Devam modu: daha önce analiz edilmiş kelimeleri yeniden gönderme
+        onceki = len(words)
+        words = [word for word in words if word not in mevcut]
+        print(f"-> Devam modu: {onceki - len(words)} kelime zaten analiz edilmiş, {len(words)} kelime kaldı.")
+    if db_path:
+        # kelimeler tablosunda zaten bulunan kelimeler analiz edilmez (INSERT OR IGNORE zaten atardı)
+        onceki = len(words)
+        start = time.time()
+        words = db_loader.veritabaninda_olmayanlar(db_path, words)
+        print(f"-> Ön eleme: {onceki - len(words)} kelime {db_path} içinde zaten var, "
+              f"{len(words)} kelime analiz edilecek ({time.time() - start:.1f} sn).")
     total_words = len(words)
-    print(f"\n--- 📂 {chunk_file} işleniyor. Toplam {total_words} kelime bulundu. ---")
-    
-    print(f"-> {num_processes} adet paralel Zemberek işçisi (worker) başlatılıyor. (Bu birkaç saniye sürecek)...")
     
     total_processed = 0
+    peak_memory = 0.0
+    batch_num = 0
+    start_time = time.time()
     
-    # TSV dosyasına veriyi yazmak için aç
-    # 'a': append modu. Eğer program çökerse, yeniden başlarken kaldığı yerden devam edebilir.
-    with open(TSV_OUTPUT_FILE, 'a', encoding='utf-8', newline='') as tsvfile:
-        tsv_writer = csv.writer(tsvfile, delimiter='\t', quoting=csv.QUOTE_MINIMAL)
+    # 2. Kelimeleri batch'ler halinde analiz motoruna gönder ve sonuçları yazıcıya (TSV veya SQLite) ver
+    while total_processed < total_words:
+        size = ayarlayici.boyut if ayarlayici else batch_size
+        word_batch = words[total_processed:total_processed + size]
+        batch_num += 1
+        batch_start = time.time()
+        
+        analyzed_data = motor.analiz_et(word_batch)
+        
+        # 3. Yazma (TSV: ana süreç, SQLite: kuyruk üzerinden yazıcı süreci, parça: işçiler + hata satırları)
+        yazici.yaz(analyzed_data)
+        
+        batch_time = time.time() - batch_start
+        if ayarlayici:
+            ayarlayici.guncelle(len(word_batch), batch_time)
+        total_processed += len(word_batch)
+        peak_memory = max(peak_memory, motor.bellek_mb())
+        
+        # İlerleme Takibi
+        print(f"[{chunk_file}] İlerleme: {total_processed} kelime işlendi. Batch {batch_num} "
+              f"({len(word_batch)} kelime, {batch_time:.1f} sn) yazıldı.") 
 
-        # 2. Pool'u Başlat (JVM'ler bu aşamada yüklenir)
-        with Pool(processes=num_processes, initializer=zemberek_pool_worker_init) as pool:
-            
-            # 3. Kelimeleri batch'ler halinde pool'a gönder ve sonuçları TSV'ye yaz
-            
-            for i in range(0, total_words, batch_size):
-                word_batch = words[i:i + batch_size]
-                batch_num = i // batch_size + 1
-                
-                # Paralel Analiz: pool.map ile tüm batch'i gönder
-                # Eğer bir worker kilitlenirse, pool.map tüm sonuçları bekler.
-                # Bu yüzden Zemberek kilitlenmelerini analyze_single_word içinde yakaladık.
-                analyzed_data = pool.map(analyze_single_word, word_batch)
-                
-                # 4. TSV Dosyasına Yazma (Ana süreç)
-                tsv_writer.writerows(analyzed_data)
-                
-                total_processed += len(analyzed_data)
-                
-                # İlerleme Takibi
-                print(f"[{chunk_file}] İlerleme: {total_processed} kelime işlendi. Batch {batch_num} TSV'ye yazıldı.") 
+    yazici.chunk_bitti(chunk_file, total_processed)
                 
+    elapsed = time.time() - start_time
     print(f"--- ✅ {chunk_file} işlenmesi tamamlandı. Toplam {total_processed} kelime analiz edildi. ---")
+    print(f"    Mod: {motor.mod} | Süre: {elapsed:.1f} sn | "
+          f"Hız: {total_processed / elapsed if elapsed else 0:,.0f} kelime/sn | Tepe bellek: {peak_memory:,.0f} MB")
+    print(f"    İşçi/iş parçacığı: {motor.num_processes} | JVM: {' '.join(motor.jvm_args)} | "
+          f"Batch: {batch_num} adet, ort. {total_processed // batch_num if batch_num else 0} kelime"
+          + (f", sonraki {ayarlayici.boyut}" if ayarlayici else ""))
 
-def main():
+def main(mod: str = ANALIZ_MODU, devam: bool = False, db_kontrol: bool = False,
+         cikti: str = CIKTI_MODU, tsv_kopya: bool = False, isci: Optional[int] = None,
+         heap_mb: Optional[int] = None, sabit_batch: Optional[int] = None, yeniden_analiz: bool = False):
     print("--- Türkçe Leksikon Veritabanı Yükleyici (Optimal TSV Yöntemi) ---")
+    if yeniden_analiz and db_kontrol:
+        print("HATA: --db-kontrol tablodaki kelimeleri atlar, --yeniden-analiz ise onları yeniden analiz eder; "
+              "birlikte kullanılamaz.", file=sys.stderr)
+        sys.exit(1)
     
-    # Kullanılabilir CPU çekirdek sayınızın bir kısmı kullanılır (32GB RAM için 6 uygun bir başlangıçtır)
-    num_processes = min(cpu_count(), 6) 
-    print(f"Sistem CPU Sayısı: {cpu_count()}. Kullanılan İşçi Sayısı: {num_processes}.")
+    # İşçi sayısı ve JVM heap'i makinenin CPU ve kullanılabilir belleğine göre seçilir
+    # ('havuz' modunda her işçi ayrı bir JVM'dir; tek_jvm tüm çekirdekleri iş parçacıklarıyla kullanır).
+    plan = kaynak_plani(mod, isci, heap_mb)
+    num_processes = plan.isci_sayisi
+    print(f"Sistem CPU Sayısı: {sistem_kaynaklari.cpu_sayisi()}. "
+          f"Kullanılabilir bellek: {sistem_kaynaklari.kullanilabilir_bellek_mb():,.0f} MB. Analiz modu: {mod}. "
+          f"Kullanılan İşçi Sayısı: {num_processes}. JVM heap: {plan.heap_mb} MB"
+          + (" (işçi başına)." if mod == 'havuz' else "."))
+    if sabit_batch:
+        ayarlayici = None
+        print(f"-> Sabit batch boyutu: {sabit_batch}")
+    else:
+        # Her işçiye batch başına en az iki görev düşsün ki batch sonlarında işçiler boşta kalmasın
+        ayarlayici = BatchAyarlayici(en_az=max(MIN_BATCH_BOYUTU, num_processes * ISCI_GOREV_BOYUTU * 2))
+        ayarlayici.boyut = max(ayarlayici.boyut, ayarlayici.en_az)
     
+    # Java toplu analiz yardımcısını işçiler başlamadan bir kez derle
+    if mod == 'tek_jvm' or (os.environ.get('DERLEM_MORFOLOJI') or MORFOLOJI_ARKA_UCU) in ('jpype', 'oto'):
+        morfoloji.java_yardimcisini_derle(ZEMBEREK_PATH)
+
     db_manager = DBManager(db_path='lexicon.db')
     db_manager.setup_database() 
 
@@ -211,10 +735,68 @@ def main():
         print("HATA: 'chunk_?.txt' formatında dosya bulunamadı.")
         return
 
-    for chunk_file in chunk_files:
-        process_chunk_and_load(chunk_file, num_processes, batch_size=5000)
+    if cikti == 'parca':
+        os.makedirs(PARCA_DIZINI, exist_ok=True)
+        kurtarilan = parcalari_kurtar(PARCA_DIZINI)
+        if kurtarilan:
+            print(f"-> Önceki çalışmadan kalan {kurtarilan} parça dosyası yayımlandı.")
+
+    mevcut = None
+    if devam:
+        # Tamamlanmış chunk'lar tamamen atlanır; yarıda kalan chunk'ta sadece eksik kelimeler analiz edilir.
+        tamamlananlar = [c for c in chunk_files if chunk_tamamlandi_mi(c)]
+        chunk_files = [c for c in chunk_files if c not in tamamlananlar]
+        print(f"-> Devam modu: {len(tamamlananlar)} chunk tamamlanmış, {len(chunk_files)} chunk işlenecek.")
+        if not chunk_files:
+            print("-> İşlenecek chunk kalmadı.")
+            return
+        kesilen = tsv_kuyrugunu_onar(TSV_OUTPUT_FILE)
+        if kesilen:
+            print(f"-> TSV sonundaki yarım satır ({kesilen} bayt) kesildi.")
+        start = time.time()
+        if cikti == 'sqlite' and yeniden_analiz:
+            # Tablo zaten tüm eski kelimeleri içerir; ondan kurulan indeks her kelimeyi atlatırdı.
+            # Yalnızca tamamlanma işaretleri kullanılır: yarıda kalan chunk baştan analiz edilir
+            # (UPSERT, analizi değişmeyen satırları yeniden yazmaz).
+            mevcut = None
+            print("-> Yeniden analiz: yarıda kalan chunk'lar baştan analiz edilecek.")
+        elif cikti == 'sqlite':
+            # Sonuçlar doğrudan veritabanına yazıldığı için kaynak kelimeler tablosudur
+            mevcut = KelimeIndeksi.olustur(None, db_manager.db_path)
+        elif cikti == 'parca':
+            mevcut = KelimeIndeksi.olustur(parcalari_listele(PARCA_DIZINI), db_manager.db_path if db_kontrol else None)
+        else:
+            mevcut = KelimeIndeksi.olustur(TSV_OUTPUT_FILE, db_manager.db_path if db_kontrol else None)
+        if mevcut is not None:
+            print(f"-> {len(mevcut):,} kelimelik indeks oluşturuldu ({time.time() - start:.1f} sn).")
+
+    if cikti == 'sqlite':
+        print(f"-> Çıktı: doğrudan {db_manager.db_path} (kelimeler)"
+              + (f" + arşiv {TSV_OUTPUT_FILE}" if tsv_kopya else ""))
+        # Yeniden analizde var olan kelimelerin değişen analizleri güncellenir
+        yazici = SqliteYazici(db_manager.db_path, TSV_OUTPUT_FILE if tsv_kopya else None, guncelle=yeniden_analiz)
+    elif cikti == 'parca':
+        print(f"-> Çıktı: {PARCA_DIZINI}/ altında işçi başına parça dosyaları")
+        yazici = ParcaYazici(PARCA_DIZINI)
+    else:
+        yazici = TsvYazici(TSV_OUTPUT_FILE)
+
+    with yazici, AnalizMotoru(mod, num_processes, parca_dizini=PARCA_DIZINI if cikti == 'parca' else None,
+                              jvm_args=plan.jvm_args) as motor:
+        for chunk_file in chunk_files:
+            process_chunk_and_load(chunk_file, motor, yazici, batch_size=sabit_batch or BATCH_BOYUTU,
+                                   mevcut=mevcut, ayarlayici=ayarlayici,
+                                   db_path=None if yeniden_analiz else db_manager.db_path)
+
+    if cikti == 'sqlite':
+        lexicon_sema.veritabani_indekslerini_olustur(db_manager.db_path, ['kelimeler'])
+
+    if cikti == 'parca':
+        parca_sayisi = parca_manifestini_yaz(PARCA_DIZINI, PARCA_MANIFESTI)
+        print(f"-> {parca_sayisi} parça dosyası {PARCA_MANIFESTI} manifestine yazıldı. "
+              f"Yükleme: python db_loader.py {PARCA_MANIFESTI}")
 
-    # 2. Analiz tamamlandıktan sonra TSV'den veritabanına yükleme işlemini db_loader.py ile yapacağız.
+    # 2. 'tsv' çıktısında, analiz tamamlandıktan sonra TSV'den veritabanına yükleme işlemini db_loader.py ile yapacağız.
     # total_imported = db_manager.import_tsv_to_db()
 
     print(f"\n\n🎉 TÜM İŞLEMLER BAŞARIYLA TAMAMLANDI!")
@@ -222,4 +804,24 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="chunk_*.txt dosyalarını Zemberek ile analiz edip TSV'ye yazar.")
+    parser.add_argument('--mod', choices=ANALIZ_MODLARI, default=ANALIZ_MODU,
+                        help="havuz: süreç başına bir JVM, tek_jvm: tek JVM + Java iş parçacıkları")
+    parser.add_argument('--devam', action='store_true',
+                        help="Tamamlanmış chunk'ları ve TSV'de zaten bulunan kelimeleri atla")
+    parser.add_argument('--db-kontrol', action='store_true',
+                        help="--devam ile birlikte: kelimeler tablosunda bulunan kelimeleri de atla")
+    parser.add_argument('--cikti', choices=CIKTI_MODLARI, default=CIKTI_MODU,
+                        help="tsv: analysis_results.tsv (db_loader.py ile yüklenir), sqlite: doğrudan kelimeler tablosu, "
+                             "parca: işçi başına TSV parça dosyaları")
+    parser.add_argument('--tsv-kopya', action='store_true',
+                        help="--cikti sqlite ile birlikte: sonuçları arşiv için TSV'ye de yaz")
+    parser.add_argument('--isci', type=int, help="İşçi/iş parçacığı sayısı (varsayılan: CPU ve belleğe göre)")
+    parser.add_argument('--heap-mb', type=int, help="JVM heap'i, MB ('havuz' modunda işçi başına)")
+    parser.add_argument('--batch', type=int, help="Sabit batch boyutu (varsayılan: süreye göre uyarlamalı)")
+    parser.add_argument('--yeniden-analiz', action='store_true',
+                        help="kelimeler tablosunda zaten bulunan kelimeleri de analiz et (ön elemeyi kapat); "
+                             "--cikti sqlite ile değişen analizler güncellenir")
+    args = parser.parse_args()
+    main(args.mod, devam=args.devam, db_kontrol=args.db_kontrol, cikti=args.cikti, tsv_kopya=args.tsv_kopya,
+         isci=args.isci, heap_mb=args.heap_mb, sabit_batch=args.batch, yeniden_analiz=args.yeniden_analiz)
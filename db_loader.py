@@ -4,18 +4,54 @@
 
 import sqlite3
 import csv
+import glob
 import os
 import sys
 import time
+import argparse
+import unicodedata
+from collections import deque
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import analiz_deposu
+import lexicon_bolum
+import lexicon_sema
+import sistem_kaynaklari
 
 # --- KONFİGÜRASYON ---
 DATABASE_NAME = 'lexicon.db'
 TSV_INPUT_FILE = 'analysis_results.tsv'
 BATCH_SIZE = 50000 # Tek seferde veritabanına yazılacak maksimum satır sayısı
+# Kelime, lemma, kök, ekler, analiz, yöntem
+INSERT_SQL = "INSERT OR IGNORE INTO kelimeler (kelime, lemma, kok, ekler, analiz, yontem) VALUES (?, ?, ?, ?, ?, ?)"
+# Güncelleme modu (--guncelle): kelime zaten varsa analiz kolonları yalnızca değişmişse yazılır.
+# Elle girilen aciklama ve onay kolonlarına dokunulmaz; aynı analiz tekrar yüklenince hiçbir satır yazılmaz.
+GUNCELLEME_CUMLESI = """
+    ON CONFLICT(kelime) DO UPDATE SET
+        lemma = excluded.lemma, kok = excluded.kok, ekler = excluded.ekler,
+        analiz = excluded.analiz, yontem = excluded.yontem
+    WHERE (lemma, kok, ekler, analiz, yontem)
+          IS NOT (excluded.lemma, excluded.kok, excluded.ekler, excluded.analiz, excluded.yontem)
+"""
+UPSERT_SQL = ("INSERT INTO kelimeler (kelime, lemma, kok, ekler, analiz, yontem) VALUES (?, ?, ?, ?, ?, ?)"
+              + GUNCELLEME_CUMLESI)
+
+# Aşamalı toplu yükleme (--toplu, bkz. import_tsv_to_db_toplu) ayarları
+TOPLU_CACHE_KB = 512 * 1024          # PRAGMA cache_size (KB)
+TOPLU_MMAP_BOYUTU = 1024 ** 3        # PRAGMA mmap_size (bayt)
+# Aşama tablosu ve sıralama için: 'DEFAULT' diskte geçici dosya kullanır. 'MEMORY' (--bellekte)
+# daha hızlıdır ama TSV'nin tamamını RAM'de tutar.
+TOPLU_TEMP_STORE = 'DEFAULT'
+
+# Paralel TSV ayrıştırma (--isci): dosya, satır sonlarına hizalanmış bu boyuttaki bayt aralıklarına bölünür
+ARALIK_BOYUTU = 16 * 1024 * 1024
+# Hatalı satırlardan ilk bu kadarı ayrıntılı yazdırılır (hepsi sayılır)
+HATALI_SATIR_GOSTERIM_LIMITI = 20
 
 def setup_database(db_path: str):
     """SQLite veritabanı tablolarını (sadece kelimeler tablosunu) oluşturur/günceller."""
-    script = """
+    script = f"""
         CREATE TABLE IF NOT EXISTS kelimeler (
             id INTEGER PRIMARY KEY,
             kelime TEXT NOT NULL UNIQUE,
@@ -26,6 +62,7 @@ def setup_database(db_path: str):
             yontem TEXT,
             aciklama TEXT,
             onay INTEGER DEFAULT 0,
+            {lexicon_sema.kok_kolonlari_tanimi()},
             CHECK (LENGTH(kelime) > 0)
         );
     """
@@ -37,64 +74,334 @@ def setup_database(db_path: str):
         print(f"Veritabanı kurulum hatası: {e}")
         sys.exit(1)
 
-def import_tsv_to_db(db_path: str, tsv_path: str):
-    """TSV dosyasındaki verileri toplu (BATCH) olarak veritabanına yükler."""
+def yukleme_ayarlarini_uygula(conn: sqlite3.Connection):
+    """Toplu yükleme için PRAGMA ayarları (db_loader ve data_loader'ın SQLite yazıcısı ortak kullanır)."""
+    # YÜKSEK PERFORMANS AYARLARI
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")
+    # YÜKSEK PERFORMANS AYARLARI SONU
+
+class DegisiklikSayaci:
+    """
+    Yüklemeden önceki duruma göre eklenen, güncellenen ve değişmeyen satır sayılarını hesaplar.
+    Eklenenler kelimeler'in satır sayısındaki artıştır. Güncellenenler, analiz kolonlarındaki
+    değişiklikleri sayan geçici (TEMP, yalnızca bu bağlantıda) bir tetikleyiciyle sayılır:
+    conn.total_changes diğer tetikleyicilerin (kelime_fts, sozluk_kuyrugu) yazdıklarını da içerir,
+    cursor.rowcount ise görünüme (lexicon_normal.py) INSTEAD OF tetikleyicileriyle yazılırken 0'dır.
+    kelimeler bir görünümse güncelleme sayılmaz: görünüme UPSERT yapılamaz, yalnızca ekleme olur.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.ilk_satir = self._satir_sayisi()
+        tur = conn.execute("SELECT type FROM main.sqlite_master WHERE name = 'kelimeler'").fetchone()
+        self.gorunum = tur is not None and tur[0] == 'view'
+        if not self.gorunum:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS kelimeler_degisiklik (guncellenen INTEGER NOT NULL)")
+            conn.execute("DELETE FROM temp.kelimeler_degisiklik")
+            conn.execute("INSERT INTO temp.kelimeler_degisiklik VALUES (0)")
+            conn.execute("""
+                CREATE TEMP TRIGGER IF NOT EXISTS kelimeler_degisiklik_say
+                AFTER UPDATE OF lemma, kok, ekler, analiz, yontem ON main.kelimeler
+                BEGIN
+                    UPDATE kelimeler_degisiklik SET guncellenen = guncellenen + 1;
+                END
+            """)
+
+    def _satir_sayisi(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM kelimeler").fetchone()[0]
+
+    def ozet(self, islenen: int) -> Tuple[int, int, int]:
+        """(eklenen, güncellenen, değişmeyen); islenen, gönderilen satır sayısıdır. Sayılar negatif olmaz."""
+        eklenen = max(self._satir_sayisi() - self.ilk_satir, 0)
+        guncellenen = 0
+        if not self.gorunum:
+            guncellenen = self.conn.execute("SELECT guncellenen FROM temp.kelimeler_degisiklik").fetchone()[0]
+        return eklenen, guncellenen, max(islenen - eklenen - guncellenen, 0)
+
+    def yazdir(self, islenen: int):
+        eklenen, guncellenen, degismeyen = self.ozet(islenen)
+        print(f"-> Eklenen: {eklenen}, güncellenen: {guncellenen}, değişmeyen/atlanan: {degismeyen}")
+
+def kuyruktan_yukle(kuyruk, db_path: str, tsv_kopya: str = None, isaretle=None, guncelle: bool = False):
+    """
+    Yazıcı süreci: kuyruktan gelen analiz sonuçlarını doğrudan kelimeler tablosuna yazar (TSV ara adımı yok).
+    Mesajlar:
+      ('satirlar', [(kelime, lemma, kok, ekler, analiz, yontem), ...])
+      ('isaret', args) -> bekleyen satırlar commit edilir, ardından isaretle(*args) çağrılır
+      None             -> son commit ve çıkış
+    tsv_kopya verilirse satırlar arşiv için ayrıca bu TSV dosyasına eklenir.
+    guncelle=True ise mevcut kelimelerin değişen analizleri güncellenir (UPSERT_SQL).
+    """
+    start_time = time.time()
+    sql = UPSERT_SQL if guncelle else INSERT_SQL
+    total_imported = 0
+    bekleyen = 0
+    conn = sqlite3.connect(db_path)
+    yukleme_ayarlarini_uygula(conn)
+    sayac = DegisiklikSayaci(conn)
+    tsv_file = open(tsv_kopya, 'a', encoding='utf-8', newline='') if tsv_kopya else None
+    tsv_writer = csv.writer(tsv_file, delimiter='\t', quoting=csv.QUOTE_MINIMAL) if tsv_file else None
+    try:
+        while True:
+            mesaj = kuyruk.get()
+            if mesaj is None:
+                break
+            tur, veri = mesaj
+            if tur == 'satirlar':
+                conn.executemany(sql, veri)
+                if tsv_writer is not None:
+                    tsv_writer.writerows(veri)
+                bekleyen += len(veri)
+                total_imported += len(veri)
+                if bekleyen >= BATCH_SIZE:
+                    # Büyük işlemler: her BATCH_SIZE satırda bir commit
+                    conn.commit()
+                    bekleyen = 0
+            elif tur == 'isaret':
+                conn.commit()
+                bekleyen = 0
+                if tsv_file is not None:
+                    tsv_file.flush()
+                    os.fsync(tsv_file.fileno())
+                if isaretle is not None:
+                    isaretle(*veri)
+        conn.commit()
+        print(f"-> SQLite yazıcısı: {total_imported} satır gönderildi, "
+              f"{time.time() - start_time:.2f} saniye.")
+        sayac.yazdir(total_imported)
+    finally:
+        conn.close()
+        if tsv_file is not None:
+            tsv_file.close()
+
+def veritabaninda_olmayanlar(db_path: str, words: Iterable[str]) -> List[str]:
+    """
+    words içinden kelimeler tablosunda bulunmayanları (girdi sırasıyla) döndürür.
+    Kelimeler geçici bir tabloya yüklenip kelimeler.kelime UNIQUE indeksiyle birleştirilir;
+    analizden önce çağrılarak zaten yüklenmiş kelimeler için JVM zamanı harcanmaz.
+    """
+    words = list(words)
+    if not words or not os.path.exists(db_path):
+        return words
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TEMP TABLE aday_kelimeler (sira INTEGER PRIMARY KEY, kelime TEXT NOT NULL)")
+        conn.executemany("INSERT INTO temp.aday_kelimeler (kelime) VALUES (?)", ((word,) for word in words))
+        cursor = conn.execute("""
+            SELECT a.kelime FROM temp.aday_kelimeler a
+            WHERE NOT EXISTS (SELECT 1 FROM kelimeler k WHERE k.kelime = a.kelime)
+            ORDER BY a.sira
+        """)
+        return [row[0] for row in cursor]
+    except sqlite3.OperationalError:
+        # kelimeler tablosu henüz yok
+        return words
+    finally:
+        conn.close()
+
+def tsv_dosyalarini_coz(kaynak: str) -> List[str]:
+    """
+    Yükleme kaynağını dosya listesine çevirir:
+      - glob deseni (ör. 'analiz_parcalari/*.tsv'),
+      - .manifest dosyası (satır başına bir parça; yollar manifestin dizinine göredir),
+      - tek bir TSV dosyası veya analiz deposu (.adp, bkz. analiz_deposu.py).
+    """
+    if glob.has_magic(kaynak):
+        return sorted(glob.glob(kaynak))
+    if kaynak.endswith('.manifest') and os.path.exists(kaynak):
+        dizin = os.path.dirname(kaynak)
+        with open(kaynak, 'r', encoding='utf-8') as f:
+            return [os.path.join(dizin, line.strip()) for line in f if line.strip()]
+    return [kaynak]
+
+# --- SATIR OKUMA, DOĞRULAMA VE PARALEL AYRIŞTIRMA ---
+
+def satiri_dogrula(row: List[str]) -> Optional[List[str]]:
+    """
+    Satır 6 sütun içermelidir: kelime, lemma, kök, ekler, analiz, yöntem.
+    Alanların kenar boşlukları atılır, kelime NFC biçimine getirilir (UNIQUE eşleşmesi için).
+    Geçersiz satırda None döner; dosya errors='replace' ile okunduğundan geçersiz UTF-8 baytları
+    U+FFFD olarak gelir ve bunu içeren satır da geçersizdir.
+    """
+    if len(row) != 6:
+        return None
+    row = [alan.strip() for alan in row]
+    if not row[0] or any('\ufffd' in alan for alan in row):
+        return None
+    if not unicodedata.is_normalized('NFC', row[0]):
+        row[0] = unicodedata.normalize('NFC', row[0])
+    return row
+
+class HataliSatirlar:
+    """Atlanan satırları dosya ve satır numarasıyla raporlar (sessizce atlamak yerine)."""
+
+    def __init__(self, limit: int = HATALI_SATIR_GOSTERIM_LIMITI):
+        self.limit = limit
+        self.sayi = 0
+
+    def ekle(self, path: str, satir_no: int, ham: str):
+        self.sayi += 1
+        if self.sayi <= self.limit:
+            print(f"UYARI: Hatalı satır atlandı: {path}:{satir_no}: {ham[:120]!r}", file=sys.stderr)
+
+    def ozet(self):
+        if self.sayi:
+            gosterilen = f" (ilk {self.limit} tanesi yukarıda)" if self.sayi > self.limit else ""
+            print(f"-> Toplam {self.sayi} hatalı satır atlandı{gosterilen}.")
+
+def dosya_satirlari(path: str, hatalilar: Optional[HataliSatirlar] = None) -> Iterator[List[str]]:
+    """Bir TSV dosyasının veya analiz deposunun (.adp) geçerli satırları."""
+    if path.endswith(analiz_deposu.UZANTI):
+        with analiz_deposu.AnalizDeposu(path) as depo:
+            yield from depo
+        return
+    # Geçersiz UTF-8 baytları tüm yüklemeyi durdurmasın: satır hatalı satır olarak raporlanır
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        reader = csv.reader(f, delimiter='\t')
+        for row in reader:
+            gecerli = satiri_dogrula(row)
+            if gecerli is None:
+                if hatalilar is not None:
+                    hatalilar.ekle(path, reader.line_num, '\t'.join(row))
+                continue
+            yield gecerli
+
+def bayt_araliklari(path: str, aralik_boyutu: int = ARALIK_BOYUTU) -> List[Tuple[int, int]]:
+    """Dosyayı, her biri tam satırlardan oluşan (satır sonlarına hizalı) bayt aralıklarına böler."""
+    boyut = os.path.getsize(path)
+    araliklar = []
+    with open(path, 'rb') as f:
+        bas = 0
+        while bas < boyut:
+            f.seek(min(bas + aralik_boyutu, boyut))
+            f.readline()   # Aralık sonunu bir sonraki satır başına kaydır
+            son = min(f.tell(), boyut)
+            araliklar.append((bas, son))
+            bas = son
+    return araliklar
+
+def _araligi_ayristir(gorev: Tuple[str, int, int]) -> Tuple[List[List[str]], List[Tuple[int, str]], int]:
+    """
+    İşçi: bir bayt aralığını ayrıştırıp doğrular.
+    (geçerli satırlar, [(aralık içi satır no, ham satır)], aralıktaki satır sayısı) döndürür.
+    Not: tırnak içinde satır sonu içeren alanlar (Zemberek çıktısında olmaz) aralık sınırında bölünebilir.
+    """
+    path, bas, son = gorev
+    with open(path, 'rb') as f:
+        f.seek(bas)
+        veri = f.read(son - bas)
+    lines = veri.decode('utf-8', errors='replace').split('\n')
+    if lines and lines[-1] == '':
+        lines.pop()
+    gecerliler = []
+    hatalilar = []
+    reader = csv.reader(lines, delimiter='\t')
+    for row in reader:
+        gecerli = satiri_dogrula(row)
+        if gecerli is None:
+            hatalilar.append((reader.line_num, '\t'.join(row)))
+        else:
+            gecerliler.append(gecerli)
+    return gecerliler, hatalilar, len(lines)
+
+def paralel_dosya_satirlari(path: str, pool, isci_sayisi: int,
+                            hatalilar: Optional[HataliSatirlar] = None) -> Iterator[List[str]]:
+    """
+    TSV'yi bayt aralıklarına bölüp işçilere ayrıştırtır; satırlar dosya sırasıyla döner.
+    Bellek sınırlı kalsın diye aynı anda en fazla 2 x işçi sayısı aralık işlenir.
+    """
+    araliklar = iter(bayt_araliklari(path))
+    bekleyen = deque()
+    satir_ofseti = 0   # Önceki aralıklardaki satır sayısı (dosya genelinde satır numarası için)
+    for bas, son in araliklar:
+        bekleyen.append(pool.apply_async(_araligi_ayristir, ((path, bas, son),)))
+        if len(bekleyen) >= 2 * isci_sayisi:
+            break
+    while bekleyen:
+        gecerliler, hatali_satirlar, satir_sayisi = bekleyen.popleft().get()
+        sonraki = next(araliklar, None)
+        if sonraki is not None:
+            bekleyen.append(pool.apply_async(_araligi_ayristir, ((path,) + sonraki,)))
+        if hatalilar is not None:
+            for yerel_no, ham in hatali_satirlar:
+                hatalilar.ekle(path, satir_ofseti + yerel_no, ham)
+        satir_ofseti += satir_sayisi
+        yield from gecerliler
+
+def satir_gruplari(tsv_paths: List[str], isci_sayisi: int = 1,
+                   hatalilar: Optional[HataliSatirlar] = None) -> Iterator[List[List[str]]]:
+    """
+    Kaynak dosyaların geçerli satırlarını BATCH_SIZE'lık gruplar halinde verir.
+    isci_sayisi > 1 ise TSV'ler işçi süreçlerinde paralel ayrıştırılır; yazma tek süreçte (çağıranda) kalır.
+    """
+    pool = Pool(isci_sayisi) if isci_sayisi > 1 else None
+    try:
+        current_batch = []
+        for path in tsv_paths:
+            if pool is not None and not path.endswith(analiz_deposu.UZANTI):
+                rows = paralel_dosya_satirlari(path, pool, isci_sayisi, hatalilar)
+            else:
+                rows = dosya_satirlari(path, hatalilar)
+            for row in rows:
+                current_batch.append(row)
+                if len(current_batch) >= BATCH_SIZE:
+                    yield current_batch
+                    current_batch = []
+        if current_batch:
+            yield current_batch
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+def varsayilan_isci_sayisi() -> int:
+    """Ayrıştırma işçisi sayısı: bir çekirdek yazıcıya (ana süreç) kalır; tek çekirdekte seri ayrıştırma."""
+    return min(max(1, sistem_kaynaklari.cpu_sayisi() - 1), 8)
+
+def import_tsv_to_db(db_path: str, tsv_path: str, isci_sayisi: int = 1, guncelle: bool = False):
+    """
+    TSV dosyasındaki (veya glob/manifest ile verilen parça dosyalarındaki) verileri toplu (BATCH) olarak veritabanına yükler.
+    isci_sayisi > 1 ise ayrıştırma/doğrulama işçi süreçlerinde yapılır; veritabanına yalnızca bu süreç yazar.
+    guncelle=True ise var olan kelimelerin yalnızca analizi değişmiş olanları güncellenir (aciklama/onay korunur);
+    aynı kelime kaynakta birden çok kez geçerse son satır geçerli olur.
+    """
     
-    if not os.path.exists(tsv_path):
-        print(f"\nHATA: TSV dosyası ({tsv_path}) bulunamadı.")
+    tsv_paths = tsv_dosyalarini_coz(tsv_path)
+    eksikler = [p for p in tsv_paths if not os.path.exists(p)]
+    if not tsv_paths or eksikler:
+        print(f"\nHATA: TSV dosyası ({', '.join(eksikler) or tsv_path}) bulunamadı.")
         return 0
     
-    print(f"\n-> '{tsv_path}' dosyasından veritabanına toplu yükleme başlatılıyor...")
+    print(f"\n-> '{tsv_path}' ({len(tsv_paths)} dosya) kaynağından veritabanına toplu yükleme başlatılıyor...")
     start_time = time.time()
     total_imported = 0
     batch_count = 0
+    hatalilar = HataliSatirlar()
     
-    sql = "INSERT OR IGNORE INTO kelimeler (kelime, lemma, kok, ekler, analiz, yontem) VALUES (?, ?, ?, ?, ?, ?)"
+    sql = UPSERT_SQL if guncelle else INSERT_SQL
     
     try:
         # 1. Veritabanı bağlantısını aç ve PRAGMA ayarlarını uygula (Sizin keşfettiğiniz kritik adım)
         with sqlite3.connect(db_path) as conn:
             cursor = conn.cursor()
+            yukleme_ayarlarini_uygula(conn)
+            sayac = DegisiklikSayaci(conn)
             
-            # YÜKSEK PERFORMANS AYARLARI
-            cursor.execute("PRAGMA journal_mode = WAL")
-            cursor.execute("PRAGMA synchronous = OFF") 
-            # YÜKSEK PERFORMANS AYARLARI SONU
-            
-            current_batch = []
-            
-            # 2. TSV dosyasını satır satır oku
-            with open(tsv_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f, delimiter='\t')
-                
-                for row in reader:
-                    # Satır 6 sütun içermelidir: kelime, lemma, kök, ekler, analiz, yöntem
-                    if len(row) != 6:
-                         # Hatalı satırı atla
-                         continue
-                         
-                    current_batch.append(row)
-                    
-                    if len(current_batch) >= BATCH_SIZE:
-                        # Batch büyüklüğüne ulaştık: Veritabanına yaz
-                        cursor.executemany(sql, current_batch)
-                        conn.commit()
-                        
-                        total_imported += len(current_batch)
-                        batch_count += 1
-                        print(f"-> Batch {batch_count}: {total_imported} satır yüklendi. ({time.time() - start_time:.2f} sn)")
-                        current_batch = []
-            
-            # 3. Kalan veriyi yükle (Son batch)
-            if current_batch:
+            # 2. TSV dosyalarını ayrıştır (paralel olabilir) ve doğrulanmış satırları batch'ler halinde yaz
+            for current_batch in satir_gruplari(tsv_paths, isci_sayisi, hatalilar):
                 cursor.executemany(sql, current_batch)
                 conn.commit()
+                
                 total_imported += len(current_batch)
                 batch_count += 1
-                print(f"-> Batch {batch_count} (Son): {total_imported} satır yüklendi. ({time.time() - start_time:.2f} sn)")
+                print(f"-> Batch {batch_count}: {total_imported} satır yüklendi. ({time.time() - start_time:.2f} sn)")
+
+            hatalilar.ozet()
+            print(f"\n-> Veritabanına toplam {total_imported} satır gönderildi.")
+            sayac.yazdir(total_imported)
 
         end_time = time.time()
-        print(f"\n-> Veritabanına toplam {total_imported} satır başarıyla eklendi/güncellendi.")
         print(f"-> İşlem süresi: {end_time - start_time:.2f} saniye.")
         
         return total_imported
@@ -107,19 +414,153 @@ def import_tsv_to_db(db_path: str, tsv_path: str):
         print(f"\nGenel Aktarım Hatası: {e}")
         sys.exit(1)
 
+def import_tsv_to_db_toplu(db_path: str, tsv_path: str, isci_sayisi: int = 1, guncelle: bool = False,
+                           bellekte: bool = False):
+    """
+    Aşamalı toplu yükleme (milyonlarca satır için):
+      1. Satırlar indekssiz, kısıtsız geçici bir aşama tablosuna yazılır (B-tree araması yok),
+      2. Tek bir INSERT OR IGNORE ... SELECT ... ORDER BY kelime, rowid ile kelime sırasıyla
+         kelimeler tablosuna aktarılır: UNIQUE indeksine ekleme sıralı olur (rastgele sayfa bölünmesi yok)
+         ve aynı kelimenin tekrarları, ilk satırın hemen ardından gelip yok sayılır,
+      3. kelimeler tablosunun ikincil indeksleri aktarımdan önce kaldırılıp sonra yeniden kurulur.
+    Hepsi tek bir işlemdedir. Aynı kelime birden çok kez geçerse ilk satır alınır; tabloda zaten
+    bulunan kelimeler değişmez (import_tsv_to_db ile aynı sonuç).
+    Ayrıştırma, import_tsv_to_db'deki gibi isci_sayisi kadar süreçle yapılabilir.
+    guncelle=True ise aktarım INSERT ... ON CONFLICT DO UPDATE ile yapılır: yalnızca analizi değişen
+    kelimeler yazılır ve aynı kelimenin tekrarlarında son satır geçerli olur.
+    bellekte=True ise aşama tablosu diskteki geçici dosya yerine RAM'de tutulur.
+    """
+    tsv_paths = tsv_dosyalarini_coz(tsv_path)
+    eksikler = [p for p in tsv_paths if not os.path.exists(p)]
+    if not tsv_paths or eksikler:
+        print(f"\nHATA: TSV dosyası ({', '.join(eksikler) or tsv_path}) bulunamadı.")
+        return 0
+
+    print(f"\n-> '{tsv_path}' ({len(tsv_paths)} dosya) kaynağından aşamalı toplu yükleme başlatılıyor...")
+    start_time = time.time()
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        yukleme_ayarlarini_uygula(conn)
+        conn.execute(f"PRAGMA cache_size = -{TOPLU_CACHE_KB}")
+        conn.execute(f"PRAGMA mmap_size = {TOPLU_MMAP_BOYUTU}")
+        conn.execute(f"PRAGMA temp_store = {'MEMORY' if bellekte else TOPLU_TEMP_STORE}")
+
+        conn.execute("BEGIN")
+        # 1. Aşama tablosu: kısıt ve indeks yok
+        conn.execute("DROP TABLE IF EXISTS temp.kelimeler_asama")
+        conn.execute("CREATE TEMP TABLE kelimeler_asama (kelime TEXT, lemma TEXT, kok TEXT, ekler TEXT, analiz TEXT, yontem TEXT)")
+        asama_sql = "INSERT INTO temp.kelimeler_asama VALUES (?, ?, ?, ?, ?, ?)"
+        total_read = 0
+        hatalilar = HataliSatirlar()
+        for current_batch in satir_gruplari(tsv_paths, isci_sayisi, hatalilar):
+            conn.executemany(asama_sql, current_batch)
+            total_read += len(current_batch)
+        hatalilar.ozet()
+        t_asama = time.time()
+        print(f"-> Aşama tablosuna {total_read} satır yazıldı. ({t_asama - start_time:.2f} sn)")
+
+        # 2. İkincil indeksleri kaldır (UNIQUE kısıtının otomatik indeksi kalır; sql IS NULL)
+        indeksler = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'kelimeler' AND sql IS NOT NULL"
+        ).fetchall()
+        for name, _ in indeksler:
+            conn.execute(f'DROP INDEX "{name}"')
+
+        # 3. Sırala + tekilleştir + aktar (tek sıralama; rowid ikinci anahtar olduğu için ilk geçen satır kalır,
+        #    güncelleme modunda ise sonraki tekrarlar öncekinin üzerine yazar)
+        sayac = DegisiklikSayaci(conn)
+        if guncelle:
+            # "WHERE true": SELECT'ten sonra gelen ON CONFLICT'in ayrıştırılabilmesi için gerekli
+            conn.execute(f"""
+                INSERT INTO kelimeler (kelime, lemma, kok, ekler, analiz, yontem)
+                SELECT kelime, lemma, kok, ekler, analiz, yontem FROM temp.kelimeler_asama
+                WHERE true ORDER BY kelime, rowid
+                {GUNCELLEME_CUMLESI}
+            """)
+        else:
+            conn.execute("""
+                INSERT OR IGNORE INTO kelimeler (kelime, lemma, kok, ekler, analiz, yontem)
+                SELECT kelime, lemma, kok, ekler, analiz, yontem FROM temp.kelimeler_asama
+                ORDER BY kelime, rowid
+            """)
+        total_imported, guncellenen, degismeyen = sayac.ozet(total_read)
+        t_aktarim = time.time()
+        print(f"-> kelimeler tablosuna {total_imported} yeni satır aktarıldı, {guncellenen} satır güncellendi, "
+              f"{degismeyen} satır değişmedi/atlandı. ({t_aktarim - t_asama:.2f} sn)")
+
+        # 4. İkincil indeksleri yeniden kur
+        for _, sql in indeksler:
+            conn.execute(sql)
+        if indeksler:
+            print(f"-> {len(indeksler)} ikincil indeks yeniden kuruldu. ({time.time() - t_aktarim:.2f} sn)")
+
+        conn.execute("DROP TABLE temp.kelimeler_asama")
+        conn.execute("COMMIT")
+    except sqlite3.Error as e:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        print(f"\nKRİTİK VERİTABANI HATASI: {e}")
+        print("Hata, aşamalı toplu yükleme sırasında oluştu; değişiklikler geri alındı.")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    print(f"\n-> Veritabanına toplam {total_imported} satır başarıyla eklendi.")
+    print(f"-> İşlem süresi: {time.time() - start_time:.2f} saniye.")
+    return total_imported
+
 # --- ANA FONKSİYON ---
 
-def main():
+def main(kaynak: str = TSV_INPUT_FILE, toplu: bool = False, isci: int = 1, guncelle: bool = False, bolum: int = 0,
+         bellekte: bool = False):
     print("--- Türkçe Leksikon Veritabanı Aktarıcı (TSV -> SQLite Batching) ---")
+
+    # Bölümlü yükleme: her bölüme ayrı bir yazıcı süreci (bkz. lexicon_bolum.py)
+    if bolum:
+        try:
+            if not lexicon_bolum.bolumlere_yukle(kaynak, lexicon_bolum.BOLUM_DIZINI, bolum, isci, guncelle):
+                sys.exit(1)
+        except (ValueError, RuntimeError) as e:
+            print(f"HATA: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\n🎉 AKTARIM İŞLEMİ TAMAMLANDI! (tek dosyada birleştirmek için: python lexicon_bolum.py birlestir)")
+        return
     
     # 1. Veritabanı yapısını hazırla
     setup_database(DATABASE_NAME)
 
     # 2. Aktarımı başlat
-    import_tsv_to_db(DATABASE_NAME, TSV_INPUT_FILE)
+    if toplu:
+        import_tsv_to_db_toplu(DATABASE_NAME, kaynak, isci, guncelle, bellekte)
+    else:
+        import_tsv_to_db(DATABASE_NAME, kaynak, isci, guncelle)
+
+    # 3. Sorgu indekslerini (kok, lemma) kur ve istatistikleri güncelle
+    lexicon_sema.veritabani_indekslerini_olustur(DATABASE_NAME, ['kelimeler'])
 
     print("\n🎉 AKTARIM İŞLEMİ TAMAMLANDI!")
 
 if __name__ == "__main__":
-    import time
-    main()
+    parser = argparse.ArgumentParser(description="Zemberek analiz sonuçlarını (TSV) kelimeler tablosuna aktarır.")
+    parser.add_argument('kaynak', nargs='?', default=TSV_INPUT_FILE,
+                        help="TSV dosyası, glob deseni ('analiz_parcalari/*.tsv') veya .manifest dosyası")
+    parser.add_argument('--toplu', action='store_true',
+                        help="Aşamalı toplu yükleme: indekssiz aşama tablosu + sıralı tek aktarım (büyük dosyalar için)")
+    parser.add_argument('--bellekte', action='store_true',
+                        help="--toplu ile: aşama tablosunu diskteki geçici dosya yerine RAM'de tut "
+                             "(daha hızlı, ama TSV'nin tamamı belleğe sığmalı)")
+    parser.add_argument('--isci', type=int, default=varsayilan_isci_sayisi(),
+                        help="TSV ayrıştırma işçi sayısı (1: seri; varsayılan: çekirdek sayısı - 1)")
+    parser.add_argument('--guncelle', action='store_true',
+                        help="Var olan kelimelerin değişen analizlerini güncelle (aciklama/onay korunur); "
+                             "varsayılan: var olan kelimeleri atla")
+    parser.add_argument('--bolum', type=int, default=0,
+                        help=f"N > 0: lexicon.db yerine {lexicon_bolum.BOLUM_DIZINI}/ altındaki N bölüm "
+                             "veritabanına paralel yazıcılarla yükle (bkz. lexicon_bolum.py)")
+    args = parser.parse_args()
+    if args.bolum and (args.toplu or args.bolum > lexicon_bolum.EN_FAZLA_BOLUM):
+        print(f"HATA: --bolum 1 ile {lexicon_bolum.EN_FAZLA_BOLUM} arasında olmalı ve --toplu ile birlikte kullanılamaz.",
+              file=sys.stderr)
+        sys.exit(1)
+    main(args.kaynak, toplu=args.toplu, isci=max(1, args.isci), guncelle=args.guncelle, bolum=max(0, args.bolum),
+         bellekte=args.bellekte)
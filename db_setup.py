@@ -1,5 +1,7 @@
 import sqlite3
 
+import lexicon_sema
+
 DATABASE_NAME = 'lexicon.db'
 
 def create_tables():
@@ -26,7 +28,8 @@ def create_tables():
     ''')
 
     # 2. Kelimeler Tablosu
-    cursor.execute('''
+    # kok_detay/kok_tipi: analizin '[detay:tip]' kısmı, yüklemede hesaplanıp saklanır (sozluk_initializer.py)
+    cursor.execute(f'''
         CREATE TABLE IF NOT EXISTS kelimeler (
             id INTEGER PRIMARY KEY,
             kelime TEXT NOT NULL UNIQUE,
@@ -36,9 +39,13 @@ def create_tables():
             analiz TEXT,
             yontem TEXT, -- zemberek, manuel, baska_arac, vb.
             aciklama TEXT,
-            onay INTEGER DEFAULT 0
+            onay INTEGER DEFAULT 0,
+            {lexicon_sema.kok_kolonlari_tanimi()}
         );
     ''')
+
+    # 3. Sorgu indeksleri (sozluk.detay, kelimeler.kok, kelimeler.lemma; bkz. lexicon_sema.py)
+    lexicon_sema.indeksleri_olustur(conn, analiz=False)
     
     conn.commit()
     conn.close()
@@ -0,0 +1,112 @@
+# db_yukleme_benchmark.py
+# Amaç: db_loader.py yükleme yöntemlerini (batch INSERT OR IGNORE / aşamalı toplu yükleme)
+# aynı büyük TSV üzerinde karşılaştırmak.
+#
+# Kullanım:
+#   python db_yukleme_benchmark.py                        (3 milyon satırlık sentetik TSV üretir)
+#   python db_yukleme_benchmark.py --satir 5000000 --ikincil-indeks
+#   python db_yukleme_benchmark.py --tsv analysis_results.tsv
+#   python db_yukleme_benchmark.py --isci 4              (paralel ayrıştırmayı da ölç)
+#
+# Sentetik TSV, gerçek dağılıma benzer şekilde sırasız kelimeler ve ~%2 tekrar içerir.
+
+import argparse
+import contextlib
+import csv
+import functools
+import hashlib
+import io
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+import db_loader
+
+HARFLER = 'abcçdefgğhıijklmnoöprsştuüvyz'
+EKLER = [('lar', 'A3pl'), ('ler', 'A3pl'), ('ım', 'P1sg'), ('da', 'Loc'), ('dan', 'Abl'),
+         ('ı', 'Acc'), ('ın', 'Gen'), ('la', 'Ins'), ('ki', 'Rel'), ('dır', 'Cop')]
+
+
+def sentetik_tsv_yaz(path: str, satir_sayisi: int, tohum: int = 42):
+    """Zemberek çıktısına benzeyen sentetik analiz satırları yazar."""
+    rnd = random.Random(tohum)
+    kokler = [''.join(rnd.choice(HARFLER) for _ in range(rnd.randint(3, 9))) for _ in range(satir_sayisi // 20 + 1)]
+    onceki = []
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, delimiter='\t', quoting=csv.QUOTE_MINIMAL)
+        for i in range(satir_sayisi):
+            if onceki and rnd.random() < 0.02:
+                # Tekrar eden kelime (farklı parçalardan gelen aynı kelime)
+                writer.writerow(rnd.choice(onceki))
+                continue
+            kok = rnd.choice(kokler)
+            ekler = rnd.sample(EKLER, rnd.randint(0, 3))
+            kelime = kok + ''.join(e for e, _ in ekler) + str(i % 97)
+            analiz = f"[{kok}:Noun] {kok}:Noun" + ''.join(f"+{e}:{t}" for e, t in ekler)
+            row = (kelime, kok, kok, f"({'-'.join(e for e, _ in ekler)})" if ekler else "", analiz, 'zemberek')
+            writer.writerow(row)
+            if len(onceki) < 10000:
+                onceki.append(row)
+
+
+def tablo_ozeti(db_path: str) -> str:
+    """Sonuçların aynı olduğunu doğrulamak için kelimeler tablosunun özeti."""
+    h = hashlib.blake2b(digest_size=8)
+    with sqlite3.connect(db_path) as conn:
+        for row in conn.execute("SELECT kelime, lemma, kok, ekler, analiz, yontem FROM kelimeler ORDER BY kelime"):
+            h.update('\t'.join(row).encode('utf-8'))
+    return h.hexdigest()
+
+
+def yontemi_olc(yontem, tsv_path: str, db_path: str, ikincil_indeks: bool) -> float:
+    # Yükleyicilerin ilerleme çıktısı bastırılır
+    with contextlib.redirect_stdout(io.StringIO()):
+        db_loader.setup_database(db_path)
+        if ikincil_indeks:
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_kelimeler_lemma ON kelimeler(lemma)")
+        t0 = time.perf_counter()
+        yontem(db_path, tsv_path)
+        return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="db_loader.py yükleme yöntemlerinin karşılaştırması.")
+    parser.add_argument('--tsv', help="Kullanılacak TSV (verilmezse sentetik TSV üretilir)")
+    parser.add_argument('--satir', type=int, default=3_000_000, help="Sentetik TSV satır sayısı")
+    parser.add_argument('--ikincil-indeks', action='store_true', help="kelimeler(lemma) üzerinde ikincil indeks ekle")
+    parser.add_argument('--isci', type=int, default=1,
+                        help="1'den büyükse aşamalı yükleme bu kadar ayrıştırma işçisiyle de ölçülür")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='db_benchmark_', dir='.') as dizin:
+        tsv_path = args.tsv
+        if not tsv_path:
+            tsv_path = os.path.join(dizin, 'sentetik.tsv')
+            t0 = time.perf_counter()
+            sentetik_tsv_yaz(tsv_path, args.satir)
+            print(f"-> {args.satir:,} satırlık sentetik TSV üretildi ({time.perf_counter() - t0:.1f} sn, "
+                  f"{os.path.getsize(tsv_path) / 1e6:,.0f} MB).")
+
+        yontemler = [('batch (INSERT OR IGNORE)', db_loader.import_tsv_to_db),
+                     ('aşamalı toplu (--toplu)', db_loader.import_tsv_to_db_toplu)]
+        if args.isci > 1:
+            yontemler.append((f'aşamalı toplu, {args.isci} işçi',
+                              functools.partial(db_loader.import_tsv_to_db_toplu, isci_sayisi=args.isci)))
+        sonuclar = []
+        for ad, yontem in yontemler:
+            db_path = os.path.join(dizin, f"{len(sonuclar)}.db")
+            sure = yontemi_olc(yontem, tsv_path, db_path, args.ikincil_indeks)
+            sonuclar.append((ad, sure, tablo_ozeti(db_path), os.path.getsize(db_path)))
+
+        print(f"\n{'Yöntem':<26} {'Süre':>9} {'DB boyutu':>11}")
+        for ad, sure, _, boyut in sonuclar:
+            print(f"{ad:<26} {sure:>8.1f}s {boyut / 1e6:>8,.0f} MB")
+        ayni = len({ozet for _, _, ozet, _ in sonuclar}) == 1
+        print(f"\nSonuç tabloları {'aynı' if ayni else 'FARKLI!'}.")
+
+
+if __name__ == '__main__':
+    main()
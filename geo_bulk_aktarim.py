@@ -2,27 +2,16 @@ import sqlite3
 import json
 from typing import List, Dict, Any
 
+import lexicon_sema
+import turkce
+
 # ⚠️ Değişkenleri Kendi Dosya Yollarınızla Ayarlayın
 SQLITE_DB_YOLU = "lexicon.db"  # Veritabanı dosyanızın yolu
 JSON_DOSYA_YOLU = "cografi_adres_sozluk.json" # Oluşturulan JSON dosyanızın yolu
 
 def turkce_kucult(metin: str) -> str:
-    """Türkçe karakterleri koruyarak metni küçük harfe çevirir."""
-    # Türkçe harf dönüşümleri (Önce büyük harf/noktasız harfleri dönüştür)
-    metin = metin.replace("İ", "i")
-    metin = metin.replace("I", "ı")
-
-    # Geri kalan Türkçe karakterleri küçük harfe çevirme
-    metin = metin.replace("Ç", "ç")
-    metin = metin.replace("Ö", "ö")
-    metin = metin.replace("Ş", "ş")
-    metin = metin.replace("Ü", "ü")
-    metin = metin.replace("Ğ", "ğ")
-
-    # Son olarak, standart küçük harf çevrimini yap
-    metin = metin.lower()
-
-    return metin
+    """Türkçe karakterleri koruyarak metni küçük harfe çevirir (bkz. turkce.py)."""
+    return turkce.kucult(metin)
 
 def json_verilerini_islem_ve_aktar_bulk():
     """JSON dosyasını okur, veritabanını kontrol eder, verileri bellekte toplar ve toplu (BULK) aktarım yapar."""
@@ -40,7 +29,7 @@ def json_verilerini_islem_ve_aktar_bulk():
     conn = None
     try:
         # 2. Veritabanı Bağlantısı ve WAL Modu
-        conn = sqlite3.connect(SQLITE_DB_YOLU)
+        conn = turkce.baglan(SQLITE_DB_YOLU)
         cursor = conn.cursor()
         
         # WAL modu, okuma/yazma çakışmalarını azaltarak performansı artırır.
@@ -48,6 +37,9 @@ def json_verilerini_islem_ve_aktar_bulk():
         cursor.execute("PRAGMA synchronous = OFF") 
         print("✅ SQLite bağlantısı WAL modunda yapılandırıldı.")
 
+        # UPDATE ... WHERE detay = ? her satır için tabloyu taramasın
+        lexicon_sema.indeksleri_olustur(conn, ['sozluk'], analiz=False)
+
         # 3. Mevcut Veritabanı Durumunu Belleğe Çekme (Hızlı Kontrol İçin)
         cursor.execute("SELECT detay, anlam FROM sozluk")
         db_kayitlari = {row[0]: row[1] for row in cursor.fetchall()}
@@ -0,0 +1,130 @@
+package derlem;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+
+import zemberek.morphology.TurkishMorphology;
+import zemberek.morphology.analysis.SingleAnalysis;
+
+/**
+ * Zemberek toplu analiz yardımcısı (morfoloji.py JPype arka ucu tarafından kullanılır).
+ *
+ * Python tarafı bir String[] dizisini tek çağrıyla gönderir; sonuç, kelime başına bir
+ * satırdan oluşan tek bir String olarak döner. Böylece kelime başına onlarca
+ * Python/Java geçişi yerine batch başına tek geçiş yapılır.
+ *
+ * Satır biçimi (girdi sırasıyla, her satır '\n' ile biter):
+ *   +\tlemma\tkok\tekler\tanaliz   analiz bulundu
+ *   -                              Zemberek kelimeyi tanımadı
+ *   !\thata mesajı                 analiz sırasında hata oluştu
+ *
+ * analyzeBatchParallel, tek JVM ve tek TurkishMorphology örneğini paylaşan bir
+ * iş parçacığı havuzuyla çalışır (data_loader.py 'tek_jvm' modu).
+ */
+public final class BatchAnalizci {
+
+    private static ExecutorService executor;
+    private static int executorThreads;
+
+    private BatchAnalizci() {
+    }
+
+    private static synchronized ExecutorService executor(int threads) {
+        if (executor == null || executorThreads != threads) {
+            if (executor != null) {
+                executor.shutdown();
+            }
+            executor = Executors.newFixedThreadPool(threads, r -> {
+                Thread t = new Thread(r, "derlem-analiz");
+                t.setDaemon(true);
+                return t;
+            });
+            executorThreads = threads;
+        }
+        return executor;
+    }
+
+    /**
+     * Diziyi threads adet dilime böler, dilimleri paralel analiz eder ve sonuçları
+     * girdi sırasıyla birleştirir. Çıktı biçimi analyzeBatch ile aynıdır.
+     */
+    public static String analyzeBatchParallel(TurkishMorphology morphology, String[] words, int threads)
+            throws InterruptedException, ExecutionException {
+        if (threads <= 1 || words.length < threads * 16) {
+            return analyzeBatch(morphology, words);
+        }
+        int sliceSize = (words.length + threads - 1) / threads;
+        List<Future<StringBuilder>> parts = new ArrayList<>(threads);
+        ExecutorService pool = executor(threads);
+        for (int start = 0; start < words.length; start += sliceSize) {
+            final int from = start;
+            final int to = Math.min(words.length, start + sliceSize);
+            parts.add(pool.submit(() -> {
+                StringBuilder sb = new StringBuilder((to - from) * 96);
+                for (int i = from; i < to; i++) {
+                    appendAnalysis(sb, morphology, words[i]);
+                }
+                return sb;
+            }));
+        }
+        StringBuilder all = new StringBuilder(words.length * 96);
+        for (Future<StringBuilder> part : parts) {
+            all.append(part.get());
+        }
+        return all.toString();
+    }
+
+    public static String analyzeBatch(TurkishMorphology morphology, String[] words) {
+        StringBuilder sb = new StringBuilder(words.length * 96);
+        for (String word : words) {
+            appendAnalysis(sb, morphology, word);
+        }
+        return sb.toString();
+    }
+
+    static void appendAnalysis(StringBuilder sb, TurkishMorphology morphology, String word) {
+        try {
+            List<SingleAnalysis> results = morphology.analyze(word).getAnalysisResults();
+            if (results.isEmpty()) {
+                sb.append("-\n");
+                return;
+            }
+            SingleAnalysis best = results.get(0);
+            sb.append("+\t").append(clean(best.getLemmas().get(0)))
+              .append('\t').append(clean(best.getStems().get(0)))
+              .append('\t').append(formatMorphemes(best))
+              .append('\t').append(clean(best.formatLong()))
+              .append('\n');
+        } catch (Exception e) {
+            sb.append("!\t").append(clean(e.toString())).append('\n');
+        }
+    }
+
+    /** Ekleri (iyor-um) formatında çıkarır (morfoloji.JPypeAnalizci.format_morphemes ile aynı). */
+    static String formatMorphemes(SingleAnalysis analysis) {
+        List<SingleAnalysis.MorphemeData> morphemes = analysis.getMorphemeDataList();
+        if (morphemes.size() <= 1) {
+            return "";
+        }
+        StringBuilder sb = new StringBuilder("(");
+        for (int i = 1; i < morphemes.size(); i++) {
+            if (i > 1) {
+                sb.append('-');
+            }
+            sb.append(clean(morphemes.get(i).surface));
+        }
+        return sb.append(')').toString();
+    }
+
+    /** Alan ayırıcılarını (tab, satır sonu) boşluğa çevirir. */
+    static String clean(String s) {
+        if (s.indexOf('\t') < 0 && s.indexOf('\n') < 0 && s.indexOf('\r') < 0) {
+            return s;
+        }
+        return s.replace('\t', ' ').replace('\n', ' ').replace('\r', ' ');
+    }
+}
@@ -0,0 +1,194 @@
+# kelime_arama.py
+# Amaç: kelimeler tablosunda önek, sonek ve alt dizgi aramaları (LIKE '%...' tam taramaları yerine).
+#
+# İsteğe bağlı iki yapı kurulur (kur / kaldir):
+#   - kelimeler.kelime_ters : kelimenin tersi + indeksi; "-laştırmak ile bitenler" bir önek aralık
+#                             sorgusuna dönüşür ("kamrıtşal" ile başlayan tersler),
+#   - kelime_fts            : kelime kolonu üzerinde FTS5 trigram indeksi (harici içerik = kelimeler);
+#                             3 ve daha uzun karakterli alt dizgiler indeksten bulunur.
+# İkisi de tetikleyicilerle güncel tutulur; tetikleyiciler yalnızca SQL kullandığı için
+# db_loader.py, mini_loader.py veya sqlite3 komut satırı gibi her istemcinin eklemeleri de işlenir.
+# Önek aramaları için ek yapı gerekmez (kelime UNIQUE indeksi).
+#
+# Kullanım:
+#   python kelime_arama.py kur
+#   python kelime_arama.py sonek laştırmak --limit 50
+#   python kelime_arama.py icerir ğğ
+#   python kelime_arama.py onek kitap
+#   python kelime_arama.py kaldir
+#
+# Not: Milyonlarca satırlık toplu yüklemelerde tetikleyiciler her satırda çalışır; çok büyük
+# yüklemelerden önce 'kaldir', sonra 'kur' (toplu yeniden oluşturma) daha hızlıdır.
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from typing import List
+
+# --- KONFİGÜRASYON ---
+DATABASE_NAME = 'lexicon.db'
+VARSAYILAN_LIMIT = 100
+TRIGRAM_UZUNLUGU = 3   # FTS5 trigram indeksi bu uzunluktan kısa alt dizgileri bulamaz
+
+# Kelimenin tersi (SQLite'ta reverse() yok; özyinelemeli CTE ile, yalnızca SQL)
+TERS_IFADESI = """(WITH RECURSIVE t(i, s) AS (
+        SELECT length({k}), '' UNION ALL SELECT i - 1, s || substr({k}, i, 1) FROM t WHERE i > 0
+    ) SELECT s FROM t WHERE i = 0)"""
+
+TETIKLEYICILER = f"""
+    CREATE TRIGGER IF NOT EXISTS kelimeler_ters_ekle AFTER INSERT ON kelimeler
+    BEGIN
+        UPDATE kelimeler SET kelime_ters = {TERS_IFADESI.format(k='NEW.kelime')} WHERE id = NEW.id;
+        INSERT INTO kelime_fts (rowid, kelime) VALUES (NEW.id, NEW.kelime);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS kelimeler_ters_guncelle AFTER UPDATE OF kelime ON kelimeler
+    BEGIN
+        UPDATE kelimeler SET kelime_ters = {TERS_IFADESI.format(k='NEW.kelime')} WHERE id = NEW.id;
+        INSERT INTO kelime_fts (kelime_fts, rowid, kelime) VALUES ('delete', OLD.id, OLD.kelime);
+        INSERT INTO kelime_fts (rowid, kelime) VALUES (NEW.id, NEW.kelime);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS kelimeler_ters_sil AFTER DELETE ON kelimeler
+    BEGIN
+        INSERT INTO kelime_fts (kelime_fts, rowid, kelime) VALUES ('delete', OLD.id, OLD.kelime);
+    END;
+"""
+TETIKLEYICI_ADLARI = ('kelimeler_ters_ekle', 'kelimeler_ters_guncelle', 'kelimeler_ters_sil')
+
+
+def kurulu_mu(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'kelime_fts'").fetchone() is not None
+
+
+def _ters_kolonu_var_mi(conn: sqlite3.Connection) -> bool:
+    return any(row[1] == 'kelime_ters' for row in conn.execute("PRAGMA table_info(kelimeler)"))
+
+
+def kur(conn: sqlite3.Connection):
+    """kelime_ters kolonunu/indeksini ve FTS5 trigram indeksini toplu olarak doldurur, tetikleyicileri kurar."""
+    tur = conn.execute("SELECT type FROM sqlite_master WHERE name = 'kelimeler'").fetchone()
+    if tur is None or tur[0] != 'table':
+        raise sqlite3.OperationalError("kelimeler bir tablo değil (normalleştirilmiş şemada arama indeksi kurulmaz)")
+    start_time = time.time()
+    if not _ters_kolonu_var_mi(conn):
+        conn.execute("ALTER TABLE kelimeler ADD COLUMN kelime_ters TEXT")
+    # Toplu doldurma Python'da (CTE'den hızlı); sonraki eklemeleri tetikleyiciler işler
+    conn.create_function('tersine', 1, lambda s: s[::-1] if s is not None else None, deterministic=True)
+    conn.execute("UPDATE kelimeler SET kelime_ters = tersine(kelime) WHERE kelime_ters IS NOT tersine(kelime)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_kelimeler_ters ON kelimeler(kelime_ters)")
+    t_ters = time.time()
+    print(f"-> kelime_ters kolonu ve indeksi hazır. ({t_ters - start_time:.2f} sn)")
+
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS kelime_fts
+        USING fts5(kelime, content = 'kelimeler', content_rowid = 'id', tokenize = 'trigram case_sensitive 1')
+    """)
+    conn.execute("INSERT INTO kelime_fts (kelime_fts) VALUES ('rebuild')")
+    print(f"-> FTS5 trigram indeksi oluşturuldu. ({time.time() - t_ters:.2f} sn)")
+    conn.executescript(TETIKLEYICILER)
+    conn.commit()
+
+
+def kaldir(conn: sqlite3.Connection):
+    """Tetikleyicileri, FTS5 tablosunu ve kelime_ters indeksini kaldırır (kolon boş bırakılır)."""
+    for ad in TETIKLEYICI_ADLARI:
+        conn.execute(f"DROP TRIGGER IF EXISTS {ad}")
+    conn.execute("DROP TABLE IF EXISTS kelime_fts")
+    conn.execute("DROP INDEX IF EXISTS idx_kelimeler_ters")
+    if _ters_kolonu_var_mi(conn):
+        conn.execute("UPDATE kelimeler SET kelime_ters = NULL WHERE kelime_ters IS NOT NULL")
+    conn.commit()
+
+
+def _onek_araligi(onek: str):
+    """onek ile başlayan metinlerin [alt, üst) aralığı (BINARY sıralama = kod noktası sırası)."""
+    return onek, onek[:-1] + chr(ord(onek[-1]) + 1)
+
+
+def onek_ara(conn: sqlite3.Connection, onek: str, limit: int = VARSAYILAN_LIMIT) -> List[str]:
+    """onek ile başlayan kelimeler (kelime UNIQUE indeksinde aralık taraması)."""
+    alt, ust = _onek_araligi(onek)
+    return [row[0] for row in conn.execute(
+        "SELECT kelime FROM kelimeler WHERE kelime >= ? AND kelime < ? ORDER BY kelime LIMIT ?", (alt, ust, limit))]
+
+
+def sonek_ara(conn: sqlite3.Connection, sonek: str, limit: int = VARSAYILAN_LIMIT) -> List[str]:
+    """sonek ile biten kelimeler (kelime_ters indeksinde aralık taraması; kurulu değilse tam tarama)."""
+    if not _ters_kolonu_var_mi(conn) or not kurulu_mu(conn):
+        print("UYARI: Arama indeksi kurulu değil, tam tarama yapılıyor (python kelime_arama.py kur).",
+              file=sys.stderr)
+        return [row[0] for row in conn.execute(
+            "SELECT kelime FROM kelimeler WHERE substr(kelime, -?) = ? LIMIT ?", (len(sonek), sonek, limit))]
+    alt, ust = _onek_araligi(sonek[::-1])
+    return [row[0] for row in conn.execute(
+        "SELECT kelime FROM kelimeler WHERE kelime_ters >= ? AND kelime_ters < ? ORDER BY kelime_ters LIMIT ?",
+        (alt, ust, limit))]
+
+
+def _glob_kacis(metin: str) -> str:
+    """GLOB özel karakterlerini ([, *, ?) köşeli parantezle kaçırır."""
+    return ''.join(f'[{c}]' if c in '[*?' else c for c in metin)
+
+
+def icerik_ara(conn: sqlite3.Connection, parca: str, limit: int = VARSAYILAN_LIMIT) -> List[str]:
+    """parca'yı içeren kelimeler (3+ karakterde FTS5 trigram indeksi; daha kısa parçada tam tarama)."""
+    if len(parca) >= TRIGRAM_UZUNLUGU and kurulu_mu(conn):
+        return [row[0] for row in conn.execute(
+            "SELECT kelime FROM kelime_fts WHERE kelime GLOB ? LIMIT ?", (f'*{_glob_kacis(parca)}*', limit))]
+    if kurulu_mu(conn):
+        print(f"UYARI: {TRIGRAM_UZUNLUGU} karakterden kısa parça trigram indeksinden aranamaz, tam tarama yapılıyor.",
+              file=sys.stderr)
+    return [row[0] for row in conn.execute(
+        "SELECT kelime FROM kelimeler WHERE instr(kelime, ?) > 0 LIMIT ?", (parca, limit))]
+
+
+ARAMALAR = {'onek': onek_ara, 'sonek': sonek_ara, 'icerir': icerik_ara}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="kelimeler tablosunda önek/sonek/alt dizgi araması.")
+    parser.add_argument('--db', default=DATABASE_NAME, help="Veritabanı dosyası")
+    alt = parser.add_subparsers(dest='komut', required=True)
+    alt.add_parser('kur', help="kelime_ters kolonu + FTS5 trigram indeksi ve tetikleyicileri kur")
+    alt.add_parser('kaldir', help="Arama indekslerini ve tetikleyicilerini kaldır")
+    for komut, yardim in (('onek', "Bu önekle başlayan kelimeler"), ('sonek', "Bu sonekle biten kelimeler"),
+                          ('icerir', "Bu parçayı içeren kelimeler")):
+        p = alt.add_parser(komut, help=yardim)
+        p.add_argument('metin')
+        p.add_argument('--limit', type=int, default=VARSAYILAN_LIMIT)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"HATA: Veritabanı '{args.db}' bulunamadı.", file=sys.stderr)
+        sys.exit(1)
+
+    if args.komut in ('kur', 'kaldir'):
+        with sqlite3.connect(args.db) as conn:
+            try:
+                kur(conn) if args.komut == 'kur' else kaldir(conn)
+            except sqlite3.Error as e:
+                print(f"HATA: {e}", file=sys.stderr)
+                sys.exit(1)
+        print("-> Tamamlandı.")
+        return
+
+    if not args.metin:
+        print("HATA: Aranacak metin boş olamaz.", file=sys.stderr)
+        sys.exit(1)
+    conn = sqlite3.connect(f"file:{args.db}?mode=ro", uri=True)
+    try:
+        t0 = time.perf_counter()
+        sonuclar = ARAMALAR[args.komut](conn, args.metin, args.limit)
+        sure = time.perf_counter() - t0
+    finally:
+        conn.close()
+    for kelime in sonuclar:
+        print(kelime)
+    print(f"-> {len(sonuclar)} kelime ({sure * 1000:.1f} ms).", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
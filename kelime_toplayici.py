@@ -4,6 +4,8 @@ import re
 import sys
 from pathlib import Path
 
+import turkce
+
 # Gerekli kütüphaneler için pip ile kurulum:
 # pip install python-docx ebooklib beautifulsoup4 PyPDF2 tqdm
 # Grok ile hazırlandı
@@ -39,7 +41,7 @@ print(f"{len(existing_words):,} kelime zaten mevcut.")
 WORD_PATTERN = re.compile(r"\b[a-zA-ZçÇğĞıİöÖşŞüÜ]{2,}\b")
 
 def temizle_kelime(kelime: str) -> str:
-    kelime = kelime.lower()
+    kelime = turkce.kucult(kelime)  # str.lower(): 'I' -> 'i', 'İ' -> 'i̇' olurdu
     # Sadece harfleri bırak, - ile birleşik kelimelere izin ver (örneğin: "yarı-automatic")
     kelime = re.sub(r"[^a-zçğıöşü-]", "", kelime)
     return kelime
@@ -103,13 +105,14 @@ def main():
     for dosya in tqdm(dosyalar, desc="İşleniyor"):
         dosya_oku_ve_kelimeleri_ekle(dosya)
 
-    # Dosya boyut kontrolü (GitHub önerisi: <50 MB)
+    # Türkçe alfabetik sıra (ç, ğ, ı, ö, ş, ü z'den sonra değil, yerlerinde)
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        for kelime in sorted(existing_words):
+        for kelime in sorted(existing_words, key=turkce.sirala_anahtari):
             f.write(kelime + "\n")
 
     boyut_mb = OUTPUT_FILE.stat().st_size / (1024 * 1024)
     print(f"\nİşlem tamamlandı! Toplam {len(existing_words):,} benzersiz kelime.")
+    # Dosya boyut kontrolü (GitHub önerisi: <50 MB)
     print(f"kelimeler.txt boyutu: {boyut_mb:.2f} MB")
 
     if boyut_mb > 50:
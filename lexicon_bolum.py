@@ -0,0 +1,315 @@
+# lexicon_bolum.py
+# Amaç: Büyük yüklemelerde kelimeler tablosunu N bölüm veritabanına paralel yazmak.
+# SQLite bir veritabanına aynı anda tek yazıcıya izin verir; lexicon.db'ye paralel yükleme
+# yazıcıda sıraya girer. Burada her kelime, kelimenin özetine (crc32) göre tek bir bölüme
+# düşer ve her bölüm dosyasına yalnızca kendi yazıcı süreci yazar; yükleme hızı (çekirdek
+# sayısı yettiği sürece) bölüm sayısıyla artar.
+#
+#   lexicon_bolumleri/
+#     bolumler.json      bölüm sayısı ve bölümleme şekli (yükleme ve okuma aynı dağılımı kullanır)
+#     bolum_00.db ...    her biri db_loader.py şemasında bir kelimeler tablosu
+#
+# BolumluLexicon bölümleri ATTACH ile tek bağlantıda açar ve hepsini birleştiren geçici bir
+# 'kelimeler' görünümü (+ bolum kolonu) sunar. 'birlestir' bölümleri tek bir veritabanına
+# (varsayılan lexicon.db) kelime sırasıyla aktarır.
+#
+# Kullanım:
+#   python lexicon_bolum.py yukle analysis_results.tsv --bolum 4
+#   python db_loader.py analysis_results.tsv --bolum 4          (aynısı)
+#   python lexicon_bolum.py bul kitaplar evler
+#   python lexicon_bolum.py sorgu "SELECT yontem, COUNT(*) FROM kelimeler GROUP BY yontem"
+#   python lexicon_bolum.py bilgi
+#   python lexicon_bolum.py birlestir -o lexicon.db --sil
+#
+# Not: SQLite en fazla EN_FAZLA_BOLUM veritabanı ATTACH edebilir (SQLITE_MAX_ATTACHED).
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+import queue
+import zlib
+from multiprocessing import Pool, Process, Queue
+from typing import List, Optional, Tuple
+
+import db_loader
+import lexicon_sema
+
+# --- KONFİGÜRASYON ---
+DATABASE_NAME = 'lexicon.db'
+BOLUM_DIZINI = 'lexicon_bolumleri'
+TANIM_DOSYASI = 'bolumler.json'
+BOLUMLEME = 'crc32'
+VARSAYILAN_BOLUM_SAYISI = 4
+EN_FAZLA_BOLUM = 10
+# Yazıcı başına kuyrukta bekleyebilecek en fazla grup (ayrıştırma yazıcılardan hızlıysa bellek şişmesin)
+KUYRUK_BOYUTU = 4
+# Kuyruk doluyken yazıcının hâlâ çalışıp çalışmadığı bu aralıkla (sn) denetlenir
+KUYRUK_DENETIM_ARALIGI = 1
+# Yükleme bitince yazıcının son commit'i için en fazla bu kadar (sn) beklenir; sonra sonlandırılır
+YAZICI_BEKLEME_SURESI = 600
+KOLONLAR = 'kelime, lemma, kok, ekler, analiz, yontem, aciklama, onay'
+
+
+def bolum_no(kelime: str, bolum_sayisi: int) -> int:
+    """Kelimenin bölümü (süreçler ve çalıştırmalar arasında kararlı özet)."""
+    return zlib.crc32(kelime.encode('utf-8')) % bolum_sayisi
+
+
+def bolum_yollari(dizin: str, bolum_sayisi: int) -> List[str]:
+    return [os.path.join(dizin, f"bolum_{i:02d}.db") for i in range(bolum_sayisi)]
+
+
+def bolum_sayisini_oku(dizin: str) -> int:
+    """bolumler.json'daki bölüm sayısı; dizin bölümlenmiş değilse FileNotFoundError."""
+    with open(os.path.join(dizin, TANIM_DOSYASI), 'r', encoding='utf-8') as f:
+        tanim = json.load(f)
+    if tanim.get('bolumleme') != BOLUMLEME:
+        raise ValueError(f"{dizin}: desteklenmeyen bölümleme '{tanim.get('bolumleme')}'.")
+    return tanim['bolum_sayisi']
+
+
+def bolumleri_hazirla(dizin: str, bolum_sayisi: int) -> List[str]:
+    """
+    Bölüm veritabanlarını ve tanım dosyasını oluşturur. Dizin daha önce farklı sayıda bölümle
+    oluşturulduysa ValueError (kelimeler başka bölümlere düşer, UNIQUE kısıtı işlemez).
+    """
+    os.makedirs(dizin, exist_ok=True)
+    try:
+        mevcut = bolum_sayisini_oku(dizin)
+    except FileNotFoundError:
+        mevcut = None
+    if mevcut is not None and mevcut != bolum_sayisi:
+        raise ValueError(f"'{dizin}' {mevcut} bölümle oluşturulmuş; {bolum_sayisi} bölüme yüklenemez "
+                         f"(önce 'birlestir' veya başka bir --dizin).")
+    yollar = bolum_yollari(dizin, bolum_sayisi)
+    for path in yollar:
+        db_loader.setup_database(path)
+    with open(os.path.join(dizin, TANIM_DOSYASI), 'w', encoding='utf-8') as f:
+        json.dump({'bolum_sayisi': bolum_sayisi, 'bolumleme': BOLUMLEME}, f)
+    return yollar
+
+
+def _bolumu_indeksle(path: str) -> List[str]:
+    return lexicon_sema.veritabani_indekslerini_olustur(path, ['kelimeler'])
+
+
+def _gonder(kuyruk: Queue, yazici: Process, path: str, mesaj):
+    """Kuyruk doluysa bekler; bölüm yazıcısı ölmüşse (disk dolu, kilitli veritabanı) sonsuza kadar beklemez."""
+    while True:
+        try:
+            kuyruk.put(mesaj, timeout=KUYRUK_DENETIM_ARALIGI)
+            return
+        except queue.Full:
+            if not yazici.is_alive():
+                raise RuntimeError(f"Bölüm yazıcısı beklenmedik şekilde sonlandı: {path} "
+                                   f"(çıkış kodu {yazici.exitcode}).")
+
+
+def bolumlere_yukle(kaynak: str, dizin: str = BOLUM_DIZINI, bolum_sayisi: int = VARSAYILAN_BOLUM_SAYISI,
+                    isci_sayisi: int = 1, guncelle: bool = False) -> int:
+    """
+    Kaynak TSV/.adp satırlarını bölümlere yükler: ayrıştırma bu süreçte (isci_sayisi > 1 ise
+    işçilerde), yazma her bölüm için ayrı bir db_loader.kuyruktan_yukle sürecinde yapılır.
+    Gönderilen satır sayısını döndürür.
+    """
+    tsv_paths = db_loader.tsv_dosyalarini_coz(kaynak)
+    eksikler = [p for p in tsv_paths if not os.path.exists(p)]
+    if not tsv_paths or eksikler:
+        print(f"HATA: Kaynak dosya ({', '.join(eksikler) or kaynak}) bulunamadı.", file=sys.stderr)
+        return 0
+    yollar = bolumleri_hazirla(dizin, bolum_sayisi)
+
+    print(f"\n-> '{kaynak}' ({len(tsv_paths)} dosya) {bolum_sayisi} bölüme yükleniyor ({dizin})...")
+    start_time = time.time()
+    kuyruklar = [Queue(KUYRUK_BOYUTU) for _ in yollar]
+    yazicilar = [Process(target=db_loader.kuyruktan_yukle, args=(kuyruk, path, None, None, guncelle))
+                 for kuyruk, path in zip(kuyruklar, yollar)]
+    for yazici in yazicilar:
+        yazici.start()
+
+    toplam = 0
+    hatalilar = db_loader.HataliSatirlar()
+    try:
+        for grup in db_loader.satir_gruplari(tsv_paths, isci_sayisi, hatalilar):
+            kovalar = [[] for _ in yollar]
+            for row in grup:
+                kovalar[bolum_no(row[0], bolum_sayisi)].append(row)
+            for kuyruk, yazici, path, kova in zip(kuyruklar, yazicilar, yollar, kovalar):
+                if kova:
+                    _gonder(kuyruk, yazici, path, ('satirlar', kova))
+            toplam += len(grup)
+    finally:
+        for kuyruk, yazici, path in zip(kuyruklar, yazicilar, yollar):
+            try:
+                _gonder(kuyruk, yazici, path, None)
+            except RuntimeError:
+                pass   # Ölen yazıcı aşağıda çıkış koduyla raporlanır
+        for yazici, path in zip(yazicilar, yollar):
+            yazici.join(YAZICI_BEKLEME_SURESI)
+            if yazici.is_alive():
+                print(f"UYARI: Bölüm yazıcısı {YAZICI_BEKLEME_SURESI} sn içinde bitmedi, sonlandırılıyor: {path}",
+                      file=sys.stderr)
+                yazici.terminate()
+                yazici.join()
+    hatalilar.ozet()
+    basarisizlar = [path for path, yazici in zip(yollar, yazicilar) if yazici.exitcode != 0]
+    if basarisizlar:
+        raise RuntimeError(f"Bölüm yazıcısı hata ile sonlandı: {', '.join(basarisizlar)}")
+    print(f"-> {toplam} satır {bolum_sayisi} bölüme yazıldı ({time.time() - start_time:.2f} sn).")
+
+    # Bölümlerin kok/lemma indeksleri de paralel kurulur
+    t0 = time.time()
+    with Pool(min(bolum_sayisi, max(1, isci_sayisi))) as pool:
+        pool.map(_bolumu_indeksle, yollar)
+    print(f"-> Bölüm indeksleri hazır ({time.time() - t0:.2f} sn).")
+    return toplam
+
+
+class BolumluLexicon:
+    """
+    Bölüm veritabanlarını tek bağlantıda ATTACH eder (b0, b1, ...). self.conn üzerinde
+    'kelimeler' geçici görünümü tüm bölümleri (bolum kolonuyla) birleştirir; kelime = ? gibi
+    koşullar her bölümün indeksine iner. bul() kelimenin bölümüne doğrudan gider.
+    """
+
+    def __init__(self, dizin: str = BOLUM_DIZINI, salt_okunur: bool = True):
+        self.dizin = dizin
+        self.bolum_sayisi = bolum_sayisini_oku(dizin)
+        if self.bolum_sayisi > EN_FAZLA_BOLUM:
+            raise ValueError(f"{self.bolum_sayisi} bölüm ATTACH sınırını ({EN_FAZLA_BOLUM}) aşıyor.")
+        self.yollar = bolum_yollari(dizin, self.bolum_sayisi)
+        kip = 'ro' if salt_okunur else 'rw'
+        self.conn = sqlite3.connect(':memory:', uri=True)
+        for i, path in enumerate(self.yollar):
+            self.conn.execute(f"ATTACH DATABASE ? AS b{i}", (f"file:{os.path.abspath(path)}?mode={kip}",))
+        birlesim = "\nUNION ALL\n".join(f"SELECT {i} AS bolum, * FROM b{i}.kelimeler" for i in range(self.bolum_sayisi))
+        self.conn.execute(f"CREATE TEMP VIEW kelimeler AS {birlesim}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.kapat()
+        return False
+
+    def kapat(self):
+        self.conn.close()
+
+    def bul(self, kelime: str) -> Optional[Tuple]:
+        """Kelimenin satırı (kelime, lemma, kok, ekler, analiz, yontem) veya None."""
+        i = bolum_no(kelime, self.bolum_sayisi)
+        return self.conn.execute(f"SELECT kelime, lemma, kok, ekler, analiz, yontem FROM b{i}.kelimeler "
+                                 f"WHERE kelime = ?", (kelime,)).fetchone()
+
+    def satir_sayilari(self) -> List[int]:
+        return [self.conn.execute(f"SELECT COUNT(*) FROM b{i}.kelimeler").fetchone()[0]
+                for i in range(self.bolum_sayisi)]
+
+
+def birlestir(dizin: str = BOLUM_DIZINI, hedef: str = DATABASE_NAME, guncelle: bool = False) -> int:
+    """
+    Bölümleri hedef veritabanının kelimeler tablosuna kelime sırasıyla tek işlemde aktarır
+    (hedefte olan kelimeler atlanır; guncelle=True ise değişen analizleri güncellenir).
+    Eklenen satır sayısını döndürür.
+    """
+    bolum_sayisi = bolum_sayisini_oku(dizin)
+    yollar = bolum_yollari(dizin, bolum_sayisi)
+    db_loader.setup_database(hedef)
+    start_time = time.time()
+    conn = sqlite3.connect(hedef, isolation_level=None)
+    try:
+        db_loader.yukleme_ayarlarini_uygula(conn)
+        for i, path in enumerate(yollar):
+            conn.execute(f"ATTACH DATABASE ? AS b{i}", (path,))
+        kaynak = " UNION ALL ".join(f"SELECT {KOLONLAR} FROM b{i}.kelimeler" for i in range(bolum_sayisi))
+        sayac = db_loader.DegisiklikSayaci(conn)
+        toplam = sum(conn.execute(f"SELECT COUNT(*) FROM b{i}.kelimeler").fetchone()[0] for i in range(bolum_sayisi))
+        conn.execute("BEGIN")
+        if guncelle:
+            # 'WHERE true': ON CONFLICT'in SELECT'in JOIN sözdizimiyle karışmaması için gerekli
+            conn.execute(f"INSERT INTO kelimeler ({KOLONLAR}) SELECT * FROM ({kaynak}) WHERE true "
+                         f"ORDER BY kelime {db_loader.GUNCELLEME_CUMLESI}")
+        else:
+            conn.execute(f"INSERT OR IGNORE INTO kelimeler ({KOLONLAR}) SELECT * FROM ({kaynak}) ORDER BY kelime")
+        conn.execute("COMMIT")
+        eklenen = sayac.ozet(toplam)[0]
+        print(f"-> {bolum_sayisi} bölümden {toplam} satır '{hedef}' veritabanına aktarıldı "
+              f"({time.time() - start_time:.2f} sn).")
+        sayac.yazdir(toplam)
+        for i in range(bolum_sayisi):
+            conn.execute(f"DETACH DATABASE b{i}")
+    finally:
+        conn.close()
+    lexicon_sema.veritabani_indekslerini_olustur(hedef, ['kelimeler'])
+    return eklenen
+
+
+def bolumleri_sil(dizin: str):
+    """Bölüm veritabanlarını (WAL/SHM dosyalarıyla) ve tanım dosyasını siler."""
+    for path in bolum_yollari(dizin, bolum_sayisini_oku(dizin)):
+        for ek in ('', '-wal', '-shm'):
+            if os.path.exists(path + ek):
+                os.remove(path + ek)
+    os.remove(os.path.join(dizin, TANIM_DOSYASI))
+    if not os.listdir(dizin):
+        os.rmdir(dizin)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="kelimeler tablosunu bölüm veritabanlarına paralel yükleme aracı.")
+    parser.add_argument('--dizin', default=BOLUM_DIZINI, help="Bölüm veritabanlarının dizini")
+    alt = parser.add_subparsers(dest='komut', required=True)
+    p = alt.add_parser('yukle', help="TSV/.adp kaynağını bölümlere yükle")
+    p.add_argument('kaynak', nargs='?', default=db_loader.TSV_INPUT_FILE)
+    p.add_argument('--bolum', type=int, default=VARSAYILAN_BOLUM_SAYISI, help="Bölüm (yazıcı süreç) sayısı")
+    p.add_argument('--isci', type=int, default=db_loader.varsayilan_isci_sayisi(), help="TSV ayrıştırma işçi sayısı")
+    p.add_argument('--guncelle', action='store_true', help="Var olan kelimelerin değişen analizlerini güncelle")
+    p = alt.add_parser('bul', help="Kelimelerin satırlarını göster")
+    p.add_argument('kelimeler', nargs='+')
+    p = alt.add_parser('sorgu', help="Birleşik 'kelimeler' görünümü üzerinde salt okunur SQL çalıştır")
+    p.add_argument('sql')
+    alt.add_parser('bilgi', help="Bölüm başına satır sayıları")
+    p = alt.add_parser('birlestir', help="Bölümleri tek veritabanında birleştir")
+    p.add_argument('-o', '--cikti', default=DATABASE_NAME)
+    p.add_argument('--guncelle', action='store_true', help="Hedefte olan kelimelerin değişen analizlerini güncelle")
+    p.add_argument('--sil', action='store_true', help="Birleştirdikten sonra bölüm veritabanlarını sil")
+    args = parser.parse_args()
+
+    try:
+        if args.komut == 'yukle':
+            if not 1 <= args.bolum <= EN_FAZLA_BOLUM:
+                print(f"HATA: --bolum 1 ile {EN_FAZLA_BOLUM} arasında olmalı.", file=sys.stderr)
+                sys.exit(1)
+            bolumlere_yukle(args.kaynak, args.dizin, args.bolum, max(1, args.isci), args.guncelle)
+        elif args.komut == 'birlestir':
+            birlestir(args.dizin, args.cikti, args.guncelle)
+            if args.sil:
+                bolumleri_sil(args.dizin)
+                print(f"-> '{args.dizin}' bölümleri silindi.")
+        else:
+            with BolumluLexicon(args.dizin) as lexicon:
+                if args.komut == 'bul':
+                    for kelime in args.kelimeler:
+                        row = lexicon.bul(kelime)
+                        print('\t'.join(v or '' for v in row) if row else f"{kelime}\t(bulunamadı)")
+                elif args.komut == 'sorgu':
+                    for row in lexicon.conn.execute(args.sql):
+                        print('\t'.join('' if v is None else str(v) for v in row))
+                else:
+                    sayilar = lexicon.satir_sayilari()
+                    for i, (path, sayi) in enumerate(zip(lexicon.yollar, sayilar)):
+                        print(f"Bölüm {i}: {sayi:,} satır ({os.path.getsize(path) / 1e6:,.1f} MB)")
+                    print(f"Toplam: {sum(sayilar):,} satır, {lexicon.bolum_sayisi} bölüm")
+    except FileNotFoundError:
+        print(f"HATA: '{args.dizin}' bölümlenmiş bir dizin değil ({TANIM_DOSYASI} yok).", file=sys.stderr)
+        sys.exit(1)
+    except (ValueError, RuntimeError, sqlite3.Error) as e:
+        print(f"HATA: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
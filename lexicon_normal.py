@@ -0,0 +1,291 @@
+# lexicon_normal.py
+# Amaç: kelimeler tablosunun normalleştirilmiş (tamsayı anahtarlı) alternatif şeması ve
+# lexicon.db'den bu şemaya geçiş aracı.
+#
+# kelimeler tablosu her satırda lemma, kök, ek zinciri, yöntem ve uzun analiz metnini
+# tekrar tekrar metin olarak saklar. Normalleştirilmiş şemada:
+#   - kokler           : lemma ve kök metinleri (ortak sözlük),
+#   - ek_zincirleri    : ekler kolonu ('(lar-ım-da)' gibi),
+#   - analiz_kaliplari : analiz metni, içindeki lemma analiz_deposu.KALIP_LEMMA ile değiştirilerek
+#                        ('[\x01:Noun] \x01:Noun+lar:A3pl'); aynı ek dizilimli binlerce kelime tek kalıbı paylaşır,
+#   - yontemler        : yöntem adları,
+#   - kelime_kayitlari : kelime + bu tablolara tamsayı kimlikler + aciklama/onay.
+# 'kelimeler' adında bir görünüm (view) eski kolon düzenini aynen sunar; INSTEAD OF tetikleyicileri
+# sayesinde görünüme INSERT/UPDATE/DELETE yapan betikler (ör. mini_loader.py) değişmeden çalışır.
+# (Görünümlerde ON CONFLICT DO UPDATE desteklenmez: db_loader --guncelle normal şemada çalışmaz.)
+#
+# Kullanım:
+#   python lexicon_normal.py donustur                       (lexicon.db -> lexicon_normal.db)
+#   python lexicon_normal.py donustur eski.db -o yeni.db
+#   python lexicon_normal.py olc lexicon.db lexicon_normal.db   (boyut ve GROUP BY kök süresi)
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+import lexicon_sema
+
+# --- KONFİGÜRASYON ---
+KAYNAK_DB = 'lexicon.db'
+HEDEF_DB = 'lexicon_normal.db'
+
+# Metinleri tekilleştiren sözlük tabloları
+SOZLUK_TABLOLARI = ('kokler', 'ek_zincirleri', 'analiz_kaliplari', 'yontemler')
+
+# Analiz metninden kalıp: lemma KALIP_LEMMA (char(1)) ile değiştirilir (analiz_deposu.analiz_kalibi'nin SQL hali).
+# {a}: analiz ifadesi, {l}: lemma ifadesi
+KALIP_IFADESI = """CASE WHEN {l} IS NOT NULL AND {l} <> '' AND {a} IS NOT NULL AND instr({a}, char(1)) = 0
+                       THEN replace({a}, {l}, char(1)) ELSE {a} END"""
+# Kalıptan analiz metni (analiz_deposu.kalibi_ac)
+ANALIZ_IFADESI = "CASE WHEN instr(p.metin, char(1)) > 0 THEN replace(p.metin, char(1), l.metin) ELSE p.metin END"
+
+SEMA = f"""
+    CREATE TABLE IF NOT EXISTS kokler (id INTEGER PRIMARY KEY, metin TEXT NOT NULL UNIQUE);
+    CREATE TABLE IF NOT EXISTS ek_zincirleri (id INTEGER PRIMARY KEY, metin TEXT NOT NULL UNIQUE);
+    CREATE TABLE IF NOT EXISTS analiz_kaliplari (id INTEGER PRIMARY KEY, metin TEXT NOT NULL UNIQUE);
+    CREATE TABLE IF NOT EXISTS yontemler (id INTEGER PRIMARY KEY, metin TEXT NOT NULL UNIQUE);
+
+    CREATE TABLE IF NOT EXISTS kelime_kayitlari (
+        id INTEGER PRIMARY KEY,
+        kelime TEXT NOT NULL UNIQUE,
+        lemma_id INTEGER REFERENCES kokler(id),
+        kok_id INTEGER REFERENCES kokler(id),
+        ekler_id INTEGER REFERENCES ek_zincirleri(id),
+        kalip_id INTEGER REFERENCES analiz_kaliplari(id),
+        yontem_id INTEGER REFERENCES yontemler(id),
+        aciklama TEXT,
+        onay INTEGER DEFAULT 0,
+        CHECK (LENGTH(kelime) > 0)
+    );
+    CREATE INDEX IF NOT EXISTS idx_kelime_kayitlari_kok ON kelime_kayitlari(kok_id);
+    CREATE INDEX IF NOT EXISTS idx_kelime_kayitlari_lemma ON kelime_kayitlari(lemma_id);
+
+    -- Eski kolon düzeni (db_setup.py / db_loader.py'deki kelimeler tablosu)
+    CREATE VIEW IF NOT EXISTS kelimeler AS
+    SELECT w.id, w.kelime, l.metin AS lemma, k.metin AS kok, e.metin AS ekler,
+           {ANALIZ_IFADESI} AS analiz, y.metin AS yontem, w.aciklama, w.onay
+    FROM kelime_kayitlari w
+    LEFT JOIN kokler l ON l.id = w.lemma_id
+    LEFT JOIN kokler k ON k.id = w.kok_id
+    LEFT JOIN ek_zincirleri e ON e.id = w.ekler_id
+    LEFT JOIN analiz_kaliplari p ON p.id = w.kalip_id
+    LEFT JOIN yontemler y ON y.id = w.yontem_id;
+"""
+
+# Görünüme yazma: önce sözlük kayıtları (varsa atlanır), sonra kimliklerle satır.
+# Dıştaki INSERT OR IGNORE (db_loader.INSERT_SQL), tetikleyici içindeki INSERT'lere de uygulanır;
+# {kosul}: INSERT'te kelime zaten varsa (satır yok sayılacaksa) sözlüğe yetim kayıt eklenmesin diye.
+_SOZLUKLERE_EKLE = f"""
+    INSERT OR IGNORE INTO kokler (metin) SELECT NEW.lemma WHERE NEW.lemma IS NOT NULL {{kosul}};
+    INSERT OR IGNORE INTO kokler (metin) SELECT NEW.kok WHERE NEW.kok IS NOT NULL {{kosul}};
+    INSERT OR IGNORE INTO ek_zincirleri (metin) SELECT NEW.ekler WHERE NEW.ekler IS NOT NULL {{kosul}};
+    INSERT OR IGNORE INTO analiz_kaliplari (metin)
+        SELECT {KALIP_IFADESI.format(a='NEW.analiz', l='NEW.lemma')} WHERE NEW.analiz IS NOT NULL {{kosul}};
+    INSERT OR IGNORE INTO yontemler (metin) SELECT NEW.yontem WHERE NEW.yontem IS NOT NULL {{kosul}};
+"""
+_YENI_KELIME = "AND NOT EXISTS (SELECT 1 FROM kelime_kayitlari WHERE kelime = NEW.kelime)"
+_KIMLIKLER = f"""
+    (SELECT id FROM kokler WHERE metin = NEW.lemma),
+    (SELECT id FROM kokler WHERE metin = NEW.kok),
+    (SELECT id FROM ek_zincirleri WHERE metin = NEW.ekler),
+    (SELECT id FROM analiz_kaliplari WHERE metin = {KALIP_IFADESI.format(a='NEW.analiz', l='NEW.lemma')}),
+    (SELECT id FROM yontemler WHERE metin = NEW.yontem)
+"""
+TETIKLEYICILER = f"""
+    CREATE TRIGGER IF NOT EXISTS kelimeler_ekle INSTEAD OF INSERT ON kelimeler
+    BEGIN
+        {_SOZLUKLERE_EKLE.format(kosul=_YENI_KELIME)}
+        INSERT INTO kelime_kayitlari (id, kelime, lemma_id, kok_id, ekler_id, kalip_id, yontem_id, aciklama, onay)
+        VALUES (NEW.id, NEW.kelime, {_KIMLIKLER}, NEW.aciklama, COALESCE(NEW.onay, 0));
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS kelimeler_guncelle INSTEAD OF UPDATE ON kelimeler
+    BEGIN
+        {_SOZLUKLERE_EKLE.format(kosul='')}
+        UPDATE kelime_kayitlari
+        SET (kelime, lemma_id, kok_id, ekler_id, kalip_id, yontem_id, aciklama, onay) =
+            (NEW.kelime, {_KIMLIKLER}, NEW.aciklama, NEW.onay)
+        WHERE id = OLD.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS kelimeler_sil INSTEAD OF DELETE ON kelimeler
+    BEGIN
+        DELETE FROM kelime_kayitlari WHERE id = OLD.id;
+    END;
+"""
+
+
+def semayi_kur(conn: sqlite3.Connection):
+    """Normalleştirilmiş tabloları, kelimeler görünümünü ve tetikleyicilerini kurar."""
+    conn.executescript(SEMA + TETIKLEYICILER)
+
+
+def _diger_tablolari_kopyala(conn: sqlite3.Connection) -> int:
+    """
+    kelimeler dışındaki tabloları (sozluk vb.) şema ve indeksleriyle aynen kopyalar.
+    Sanal tablolar (kelime_arama.py'nin kelime_fts indeksi gibi) ve gölge tabloları kopyalanmaz:
+    içerikleri eski kelimeler tablosuna aittir; arama indeksleri hedefte yeniden kurulmalıdır.
+    """
+    sanal = [ad for (ad,) in conn.execute(
+        "SELECT name FROM kaynak.sqlite_master WHERE type = 'table' AND sql LIKE 'CREATE VIRTUAL TABLE%'")]
+    tablolar = [(ad, sql) for ad, sql in conn.execute("""
+        SELECT name, sql FROM kaynak.sqlite_master
+        WHERE type = 'table' AND name NOT LIKE 'sqlite_%' AND name <> 'kelimeler'
+    """).fetchall() if not any(ad == s or ad.startswith(s + '_') for s in sanal)]
+    if sanal:
+        print(f"-> Sanal tablolar kopyalanmadı (hedefte yeniden kurulmalı): {', '.join(sanal)}")
+    for ad, sql in tablolar:
+        conn.execute(sql)
+        conn.execute(f'INSERT INTO main."{ad}" SELECT * FROM kaynak."{ad}"')
+        for (indeks_sql,) in conn.execute(
+                "SELECT sql FROM kaynak.sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                (ad,)).fetchall():
+            conn.execute(indeks_sql)
+    return len(tablolar)
+
+
+def donustur(kaynak_db: str, hedef_db: str):
+    """kaynak_db'deki kelimeler tablosunu (ve diğer tabloları) normalleştirilmiş hedef_db'ye aktarır."""
+    if not os.path.exists(kaynak_db):
+        print(f"HATA: Kaynak veritabanı '{kaynak_db}' bulunamadı.", file=sys.stderr)
+        sys.exit(1)
+    if os.path.exists(hedef_db):
+        print(f"HATA: Hedef veritabanı '{hedef_db}' zaten var; üzerine yazılmaz.", file=sys.stderr)
+        sys.exit(1)
+
+    start_time = time.time()
+    gecici = hedef_db + '.tmp'
+    if os.path.exists(gecici):
+        os.remove(gecici)
+    conn = sqlite3.connect(gecici, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("ATTACH DATABASE ? AS kaynak", (kaynak_db,))
+        semayi_kur(conn)   # executescript bekleyen işlemi commit ettiği için BEGIN'den önce
+        conn.execute("BEGIN")
+
+        # 1. Sözlükler (metne göre sıralı: kimlikler sıralı, UNIQUE indeksi sıralı dolar)
+        conn.execute("""
+            INSERT INTO kokler (metin)
+            SELECT lemma FROM kaynak.kelimeler WHERE lemma IS NOT NULL
+            UNION SELECT kok FROM kaynak.kelimeler WHERE kok IS NOT NULL
+            ORDER BY 1
+        """)
+        conn.execute("INSERT INTO ek_zincirleri (metin) SELECT DISTINCT ekler FROM kaynak.kelimeler "
+                     "WHERE ekler IS NOT NULL ORDER BY 1")
+        conn.execute(f"INSERT INTO analiz_kaliplari (metin) SELECT DISTINCT {KALIP_IFADESI.format(a='analiz', l='lemma')} "
+                     "FROM kaynak.kelimeler WHERE analiz IS NOT NULL ORDER BY 1")
+        conn.execute("INSERT INTO yontemler (metin) SELECT DISTINCT yontem FROM kaynak.kelimeler "
+                     "WHERE yontem IS NOT NULL ORDER BY 1")
+        t_sozluk = time.time()
+        sayilar = {ad: conn.execute(f"SELECT COUNT(*) FROM {ad}").fetchone()[0] for ad in SOZLUK_TABLOLARI}
+        print("-> Sözlükler: " + ", ".join(f"{ad} {n:,}" for ad, n in sayilar.items())
+              + f" ({t_sozluk - start_time:.2f} sn)")
+
+        # 2. Kelime kayıtları (id'ler korunur)
+        conn.execute(f"""
+            INSERT INTO kelime_kayitlari (id, kelime, lemma_id, kok_id, ekler_id, kalip_id, yontem_id, aciklama, onay)
+            SELECT w.id, w.kelime, l.id, k.id, e.id, p.id, y.id, w.aciklama, w.onay
+            FROM kaynak.kelimeler w
+            LEFT JOIN kokler l ON l.metin = w.lemma
+            LEFT JOIN kokler k ON k.metin = w.kok
+            LEFT JOIN ek_zincirleri e ON e.metin = w.ekler
+            LEFT JOIN analiz_kaliplari p ON p.metin = {KALIP_IFADESI.format(a='w.analiz', l='w.lemma')}
+            LEFT JOIN yontemler y ON y.metin = w.yontem
+            ORDER BY w.id
+        """)
+        kelime_sayisi = conn.execute("SELECT COUNT(*) FROM kelime_kayitlari").fetchone()[0]
+        t_kelime = time.time()
+        print(f"-> {kelime_sayisi:,} kelime aktarıldı. ({t_kelime - t_sozluk:.2f} sn)")
+
+        # 3. Diğer tablolar (sozluk vb.) ve bunların sorgu indeksleri
+        diger = _diger_tablolari_kopyala(conn)
+        if diger:
+            print(f"-> {diger} tablo daha aynen kopyalandı.")
+        conn.execute("COMMIT")
+        lexicon_sema.indeksleri_olustur(conn, analiz=False)
+
+        # 4. Doğrulama: görünüm, kaynak tabloyla satır satır aynı olmalı
+        kaynak_sayisi = conn.execute("SELECT COUNT(*) FROM kaynak.kelimeler").fetchone()[0]
+        farkli = abs(kaynak_sayisi - kelime_sayisi) + conn.execute("""
+            SELECT COUNT(*) FROM (
+                SELECT id, kelime, lemma, kok, ekler, analiz, yontem, aciklama, onay FROM kaynak.kelimeler
+                EXCEPT
+                SELECT id, kelime, lemma, kok, ekler, analiz, yontem, aciklama, onay FROM main.kelimeler
+            )
+        """).fetchone()[0]
+        if farkli:
+            raise RuntimeError(f"Doğrulama başarısız: {farkli} satır görünümde farklı.")
+        conn.execute("DETACH DATABASE kaynak")
+        conn.execute("ANALYZE")
+        conn.execute("VACUUM")
+    except (sqlite3.Error, RuntimeError) as e:
+        conn.close()
+        os.remove(gecici)
+        print(f"KRİTİK HATA: Dönüştürme başarısız oldu: {e}", file=sys.stderr)
+        sys.exit(1)
+    conn.close()
+    os.replace(gecici, hedef_db)
+
+    print(f"-> Doğrulama: kelimeler görünümü kaynak tabloyla aynı.")
+    print(f"-> {kaynak_db} ({os.path.getsize(kaynak_db) / 1e6:,.1f} MB) -> "
+          f"{hedef_db} ({os.path.getsize(hedef_db) / 1e6:,.1f} MB), "
+          f"{time.time() - start_time:.2f} saniye.")
+
+
+def _sure(conn: sqlite3.Connection, sql: str, tekrar: int = 3) -> float:
+    """Sorgunun en iyi süresi (sn), sonuçlar tamamen okunarak."""
+    en_iyi = float('inf')
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        conn.execute(sql).fetchall()
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi
+
+
+def olc(duz_db: str, normal_db: str):
+    """Düz ve normalleştirilmiş veritabanlarının boyutunu ve köke göre gruplama süresini karşılaştırır."""
+    for path in (duz_db, normal_db):
+        if not os.path.exists(path):
+            print(f"HATA: Veritabanı '{path}' bulunamadı.", file=sys.stderr)
+            sys.exit(1)
+    with sqlite3.connect(duz_db) as duz, sqlite3.connect(normal_db) as normal:
+        olcumler = (
+            ('GROUP BY kök', _sure(duz, "SELECT kok, COUNT(*) FROM kelimeler GROUP BY kok"),
+             _sure(normal, "SELECT k.metin, n FROM (SELECT kok_id, COUNT(*) AS n FROM kelime_kayitlari "
+                           "GROUP BY kok_id) g LEFT JOIN kokler k ON k.id = g.kok_id")),
+            ('GROUP BY lemma', _sure(duz, "SELECT lemma, COUNT(*) FROM kelimeler GROUP BY lemma"),
+             _sure(normal, "SELECT k.metin, n FROM (SELECT lemma_id, COUNT(*) AS n FROM kelime_kayitlari "
+                           "GROUP BY lemma_id) g LEFT JOIN kokler k ON k.id = g.lemma_id")),
+            ('tüm satırlar (görünüm)', _sure(duz, "SELECT * FROM kelimeler", 1),
+             _sure(normal, "SELECT * FROM kelimeler", 1)),
+        )
+    print(f"{'':<24} {'düz':>10} {'normal':>10}")
+    print(f"{'Dosya boyutu (MB)':<24} {os.path.getsize(duz_db) / 1e6:>10,.1f} {os.path.getsize(normal_db) / 1e6:>10,.1f}")
+    for ad, t_duz, t_normal in olcumler:
+        print(f"{ad + ' (sn)':<24} {t_duz:>10.3f} {t_normal:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="kelimeler tablosunun normalleştirilmiş şeması ve geçiş aracı.")
+    alt = parser.add_subparsers(dest='komut', required=True)
+    p = alt.add_parser('donustur', help="Düz kelimeler tablosunu normalleştirilmiş veritabanına aktar")
+    p.add_argument('kaynak', nargs='?', default=KAYNAK_DB)
+    p.add_argument('-o', '--cikti', default=HEDEF_DB)
+    p = alt.add_parser('olc', help="Düz ve normal veritabanlarının boyut/sorgu süresi karşılaştırması")
+    p.add_argument('duz', nargs='?', default=KAYNAK_DB)
+    p.add_argument('normal', nargs='?', default=HEDEF_DB)
+    args = parser.parse_args()
+
+    if args.komut == 'donustur':
+        donustur(args.kaynak, args.cikti)
+    else:
+        olc(args.duz, args.normal)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+# lexicon_sema.py
+# Amaç: lexicon.db için ihtiyaç duyulan ikincil indeksleri tek yerde tanımlamak, toplu
+# yüklemelerden sonra kurmak (+ ANALYZE) ve bilinen sorguların plana göre tam tablo
+# taraması yapmadığını EXPLAIN QUERY PLAN ile denetlemek.
+#
+# Kullanım:
+#   python lexicon_sema.py                 (eksik indeksleri kur + ANALYZE)
+#   python lexicon_sema.py --kontrol       (indeksleri kurmadan yalnızca sorgu planlarını denetle)
+#   python lexicon_sema.py baska.db --kontrol --esik 0
+#
+# --kontrol, büyük bir tabloyu (satır sayısı >= --esik) tarayan sorgu bulursa 1 ile çıkar.
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import time
+from typing import Iterable, List, Optional
+
+import turkce
+
+# --- KONFİGÜRASYON ---
+DATABASE_NAME = 'lexicon.db'
+
+# (indeks adı, tablo, kolonlar). UNIQUE kısıtlarının otomatik indeksleri burada yer almaz:
+# sozluk.kok aramaları UNIQUE(kok, tip, koken) indeksini kullanır, ayrı bir kok indeksi gerekmez.
+INDEKSLER = (
+    ('idx_kelimeler_kok', 'kelimeler', ('kok',)),
+    ('idx_kelimeler_lemma', 'kelimeler', ('lemma',)),
+    ('idx_sozluk_detay', 'sozluk', ('detay',)),   # geo_bulk_aktarim.py: UPDATE ... WHERE detay = ?
+    # Büyük/küçük harf duyarsız detay araması (yalnızca yerleşik SQL fonksiyonları; bkz. turkce.py)
+    ('idx_sozluk_detay_kucuk', 'sozluk', (turkce.sql_kucult('detay'),)),
+)
+
+# analiz metninin başındaki '[detay:tip]' kısmından türetilen kolonlar (sozluk_initializer.py
+# sozluk'u bunlardan artımlı olarak günceller). Analizi bu biçimde olmayan satırlarda NULL'dır.
+KOK_KOLONLARI = (
+    ('kok_detay', "CASE WHEN substr(analiz, 1, 1) = '[' AND instr(analiz, ']') > instr(analiz, ':') "
+                  "AND instr(analiz, ':') > 0 THEN substr(analiz, 2, instr(analiz, ':') - 2) END"),
+    ('kok_tipi', "CASE WHEN substr(analiz, 1, 1) = '[' AND instr(analiz, ']') > instr(analiz, ':') "
+                 "AND instr(analiz, ':') > 0 "
+                 "THEN substr(analiz, instr(analiz, ':') + 1, instr(analiz, ']') - instr(analiz, ':') - 1) END"),
+)
+
+# Betiklerin çalıştırdığı sorgular: (ad, SQL, taranmaması gereken tablo adları/takma adları).
+# Parametreler EXPLAIN QUERY PLAN için NULL ile bağlanır.
+BILINEN_SORGULAR = (
+    ('kelime arama', "SELECT * FROM kelimeler WHERE kelime = ?", ('kelimeler',)),
+    ('köke göre kelimeler', "SELECT kelime FROM kelimeler WHERE kok = ?", ('kelimeler',)),
+    ('lemmaya göre kelimeler', "SELECT kelime FROM kelimeler WHERE lemma = ?", ('kelimeler',)),
+    ('sözlükte kök arama', "SELECT * FROM sozluk WHERE kok = ?", ('sozluk',)),
+    ('sözlükte harf duyarsız detay arama',
+     f"SELECT * FROM sozluk WHERE {turkce.sql_kucult('detay')} = {turkce.sql_kucult('?')}", ('sozluk',)),
+    ('sozluk_initializer artımlı güncelleme',
+     "SELECT 1 FROM sozluk s WHERE s.detay = ? AND s.tip IS ?", ('sozluk', 's')),
+    ('geo_bulk_aktarim güncelleme',
+     "UPDATE sozluk SET anlam = ?, kaynak = ?, attempted = 1 WHERE detay = ?", ('sozluk',)),
+    ('db_loader ön eleme',
+     "SELECT a.kelime FROM temp.aday_kelimeler a "
+     "WHERE NOT EXISTS (SELECT 1 FROM kelimeler k WHERE k.kelime = a.kelime) ORDER BY a.sira",
+     ('kelimeler', 'k')),
+    # kelime_arama.py (yalnızca 'kelime_arama.py kur' ile kelime_ters kolonu eklendiyse)
+    ('kelime_arama sonek arama',
+     "SELECT kelime FROM kelimeler WHERE kelime_ters >= ? AND kelime_ters < ? ORDER BY kelime_ters LIMIT ?",
+     ('kelimeler',)),
+)
+
+# Bu kadar veya daha fazla satırı olan tablonun taranması --kontrol'de hata sayılır
+BUYUK_TABLO_ESIGI = 10000
+
+
+def mevcut_tablolar(conn: sqlite3.Connection) -> set:
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+def indeksleri_olustur(conn: sqlite3.Connection, tablolar: Optional[Iterable[str]] = None,
+                       analiz: bool = True) -> List[str]:
+    """
+    INDEKSLER'deki eksik indeksleri kurar (yalnızca var olan tablolar için; tablolar verilirse
+    yalnızca onlar için). analiz=True ise ardından ANALYZE çalıştırılır.
+    Kurulan indekslerin adlarını döndürür.
+    """
+    var_olanlar = mevcut_tablolar(conn)
+    if tablolar is not None:
+        var_olanlar &= set(tablolar)
+    mevcut_indeksler = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    kurulanlar = []
+    for ad, tablo, kolonlar in INDEKSLER:
+        if tablo not in var_olanlar or ad in mevcut_indeksler:
+            continue
+        t0 = time.time()
+        conn.execute(f'CREATE INDEX IF NOT EXISTS "{ad}" ON "{tablo}" ({", ".join(kolonlar)})')
+        kurulanlar.append(ad)
+        gosterim = ', '.join(k if k.isidentifier() else '<ifade>' for k in kolonlar)
+        print(f"-> İndeks kuruldu: {ad} ({tablo}: {gosterim}) ({time.time() - t0:.2f} sn)")
+    if analiz and var_olanlar:
+        t0 = time.time()
+        for tablo in sorted(var_olanlar):
+            conn.execute(f'ANALYZE "{tablo}"')
+        print(f"-> ANALYZE tamamlandı ({time.time() - t0:.2f} sn).")
+    conn.commit()
+    return kurulanlar
+
+
+def kok_kolonlari_tanimi(tur: str = 'STORED') -> str:
+    """CREATE TABLE kelimeler içine eklenecek kok_detay/kok_tipi üretilmiş kolon tanımları."""
+    return ',\n'.join(f"{ad} TEXT GENERATED ALWAYS AS ({ifade}) {tur}" for ad, ifade in KOK_KOLONLARI)
+
+
+def kok_kolonlarini_ekle(conn: sqlite3.Connection) -> List[str]:
+    """
+    Eski şemalı kelimeler tablosuna eksik kok_detay/kok_tipi kolonlarını ekler.
+    ALTER TABLE yalnızca VIRTUAL üretilmiş kolon ekleyebilir (değer okunurken hesaplanır);
+    yeni oluşturulan tablolarda kolonlar STORED'dır. Eklenen kolonların adlarını döndürür.
+    """
+    tur = conn.execute("SELECT type FROM sqlite_master WHERE name = 'kelimeler'").fetchone()
+    if tur is None or tur[0] != 'table':
+        raise sqlite3.OperationalError("kelimeler bir tablo değil (normalleştirilmiş şemada kök kolonları eklenmez)")
+    # table_xinfo üretilmiş (gizli) kolonları da listeler
+    mevcut = {row[1] for row in conn.execute("PRAGMA table_xinfo(kelimeler)")}
+    eklenenler = []
+    for ad, ifade in KOK_KOLONLARI:
+        if ad not in mevcut:
+            conn.execute(f"ALTER TABLE kelimeler ADD COLUMN {ad} TEXT GENERATED ALWAYS AS ({ifade}) VIRTUAL")
+            eklenenler.append(ad)
+    return eklenenler
+
+
+def veritabani_indekslerini_olustur(db_path: str, tablolar: Optional[Iterable[str]] = None) -> List[str]:
+    """indeksleri_olustur'un dosya yolu alan hali (yükleyicilerin sonunda çağrılır)."""
+    with turkce.baglan(db_path) as conn:
+        return indeksleri_olustur(conn, tablolar)
+
+
+def tablo_boyutu(conn: sqlite3.Connection, tablo: str) -> int:
+    """Yaklaşık satır sayısı: MAX(rowid) (rowid indeksinden okunur, tablo taranmaz)."""
+    return conn.execute(f'SELECT COALESCE(MAX(rowid), 0) FROM "{tablo}"').fetchone()[0]
+
+
+def sorgu_plani(conn: sqlite3.Connection, sql: str) -> List[str]:
+    """EXPLAIN QUERY PLAN satırlarının açıklama (detail) kolonları."""
+    parametre_sayisi = sql.count('?')
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", (None,) * parametre_sayisi)]
+
+
+def taranan_adlar(plan: Iterable[str]) -> List[str]:
+    """Plandaki 'SCAN <ad>' adımlarının tablo/takma adları (ör. 'SCAN kelimeler', 'SCAN k')."""
+    adlar = []
+    for detay in plan:
+        eslesme = re.match(r'SCAN (?:TABLE )?(\w+)', detay)
+        if eslesme:
+            adlar.append(eslesme.group(1))
+    return adlar
+
+
+def planlari_denetle(conn: sqlite3.Connection, esik: int = BUYUK_TABLO_ESIGI) -> bool:
+    """
+    BILINEN_SORGULAR'ın planlarını yazdırır. Büyük bir tabloyu tarayan sorgu varsa False döner.
+    Tablosu bulunmayan sorgular atlanır.
+    """
+    tablolar = mevcut_tablolar(conn)
+    # db_loader.veritabaninda_olmayanlar'ın kullandığı geçici tablo
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS aday_kelimeler (sira INTEGER PRIMARY KEY, kelime TEXT NOT NULL)")
+    boyutlar = {korunanlar[0]: tablo_boyutu(conn, korunanlar[0])
+                for _, _, korunanlar in BILINEN_SORGULAR if korunanlar[0] in tablolar}
+    basarili = True
+    for ad, sql, korunanlar in BILINEN_SORGULAR:
+        tablo = korunanlar[0]
+        if tablo not in tablolar:
+            print(f"   [ATLANDI] {ad}: '{tablo}' tablosu yok.")
+            continue
+        try:
+            plan = sorgu_plani(conn, sql)
+        except sqlite3.Error as e:
+            print(f"   [ATLANDI] {ad}: {e}")
+            continue
+        taramalar = [t for t in taranan_adlar(plan) if t in korunanlar]
+        if not taramalar:
+            durum = 'TAMAM'
+        elif boyutlar[tablo] >= esik:
+            durum = 'HATA'
+            basarili = False
+        else:
+            durum = 'UYARI'   # Tablo şimdilik küçük; büyüdüğünde tarama pahalılaşır
+        print(f"   [{durum}] {ad} ({tablo}: ~{boyutlar[tablo]} satır)")
+        for detay in plan:
+            print(f"          {detay}")
+    return basarili
+
+
+def main(db_path: str, kontrol: bool, esik: int):
+    if not os.path.exists(db_path):
+        print(f"HATA: Veritabanı '{db_path}' bulunamadı.", file=sys.stderr)
+        sys.exit(1)
+    with turkce.baglan(db_path) as conn:
+        if not kontrol:
+            kurulanlar = indeksleri_olustur(conn)
+            print(f"-> {len(kurulanlar)} yeni indeks kuruldu.")
+        print("-> Bilinen sorguların planları:")
+        if not planlari_denetle(conn, esik):
+            print(f"HATA: En az bir sorgu {esik} satırdan büyük bir tabloyu tam tarıyor "
+                  f"(indeksleri kurmak için: python lexicon_sema.py {db_path}).", file=sys.stderr)
+            sys.exit(1)
+    print("-> Sorgu planları uygun.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="lexicon.db indekslerini kurar ve sorgu planlarını denetler.")
+    parser.add_argument('db', nargs='?', default=DATABASE_NAME, help="Veritabanı dosyası")
+    parser.add_argument('--kontrol', action='store_true',
+                        help="İndeks kurmadan yalnızca EXPLAIN QUERY PLAN denetimi yap (tarama varsa çıkış kodu 1)")
+    parser.add_argument('--esik', type=int, default=BUYUK_TABLO_ESIGI,
+                        help="Taranması hata sayılacak en küçük tablo boyutu (satır)")
+    args = parser.parse_args()
+    main(args.db, args.kontrol, args.esik)
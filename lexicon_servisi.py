@@ -0,0 +1,330 @@
+# lexicon_servisi.py
+# Amaç: lexicon.db üzerinde yüksek istek hızına uygun, salt okunur yerel sorgu servisi
+# (eski-versiyon/apim.py'nin yerine; "bu kelime geçerli mi, kökü/analizi ne?").
+#
+#   - asyncio tabanlı küçük bir HTTP/1.1 sunucusu (ek bağımlılık yok, keep-alive destekli),
+#   - salt okunur (mode=ro) SQLite bağlantı havuzu; sorgular iş parçacıklarında çalışır,
+#     olay döngüsü bloklanmaz. Veritabanı WAL kipine alınır: yükleyiciler yazarken okumalar sürer,
+#   - sık sorulan kelimeler için LRU önbellek (bulunamayan kelimeler de önbelleğe alınır;
+#     yeni yüklenen kelimelerin görünmesi için kayıtlar ONBELLEK_SURESI saniye sonra tazelenir),
+#   - uç nokta başına gecikme ölçümleri (p50/p90/p99) ve önbellek isabet oranı.
+#
+# Uç noktalar (JSON):
+#   GET  /kelime/<kelime>                 -> {"kelime": ..., "var": true, "lemma": ..., "kok": ..., ...} (yoksa 404)
+#   POST /toplu   {"kelimeler": [...]}    -> {"sonuclar": {kelime: {...} | null, ...}}
+#   GET  /metrikler                       -> istek sayıları, gecikmeler, önbellek
+#   GET  /saglik                          -> {"durum": "ok"}
+#
+# Kullanım:
+#   python lexicon_servisi.py                            (127.0.0.1:8765)
+#   python lexicon_servisi.py --db lexicon.db --havuz 8 --onbellek 200000
+#   curl http://127.0.0.1:8765/kelime/kitaplar
+#   python lexicon_yuk_testi.py                          (yük testi)
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sqlite3
+import sys
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import unquote
+
+import sistem_kaynaklari
+
+# --- KONFİGÜRASYON ---
+DATABASE_NAME = 'lexicon.db'
+VARSAYILAN_ADRES = '127.0.0.1'
+VARSAYILAN_PORT = 8765
+ONBELLEK_KAPASITESI = 100_000
+ONBELLEK_SURESI = 300.0          # sn; bulunamayan kelimeler bu süreden sonra yeniden sorulur
+TOPLU_AZAMI_KELIME = 1000        # /toplu isteği başına en fazla kelime
+SORGU_PARCASI = 500              # IN (...) sorgusu başına kelime
+OLCUM_PENCERESI = 10_000         # Gecikme yüzdelikleri için uç nokta başına son N istek
+AZAMI_GOVDE = 1024 * 1024        # bayt
+MMAP_BOYUTU = 256 * 1024 * 1024  # Okuyucu bağlantıları için PRAGMA mmap_size
+
+KOLONLAR = ('kelime', 'lemma', 'kok', 'ekler', 'analiz', 'yontem', 'onay')
+SORGU = f"SELECT {', '.join(KOLONLAR)} FROM kelimeler WHERE kelime IN ({{}})"
+
+DURUM_METINLERI = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                   413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class BaglantiHavuzu:
+    """Salt okunur SQLite bağlantıları; her sorgu boştaki bir bağlantıyla bir iş parçacığında çalışır."""
+
+    def __init__(self, db_path: str, boyut: int):
+        self.boyut = boyut
+        self._executor = ThreadPoolExecutor(max_workers=boyut, thread_name_prefix='lexicon-okuyucu')
+        self._bostakiler: asyncio.Queue = asyncio.Queue()
+        for _ in range(boyut):
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+            conn.execute("PRAGMA query_only = 1")
+            conn.execute(f"PRAGMA mmap_size = {MMAP_BOYUTU}")
+            self._bostakiler.put_nowait(conn)
+
+    @staticmethod
+    def _sorgula(conn: sqlite3.Connection, words: Sequence[str]) -> Dict[str, dict]:
+        bulunanlar = {}
+        for i in range(0, len(words), SORGU_PARCASI):
+            parca = words[i:i + SORGU_PARCASI]
+            for row in conn.execute(SORGU.format(', '.join('?' * len(parca))), parca):
+                bulunanlar[row[0]] = dict(zip(KOLONLAR, row))
+        return bulunanlar
+
+    async def bul(self, words: Sequence[str]) -> Dict[str, dict]:
+        conn = await self._bostakiler.get()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, self._sorgula, conn, words)
+        finally:
+            self._bostakiler.put_nowait(conn)
+
+    def kapat(self):
+        self._executor.shutdown(wait=True)
+        while not self._bostakiler.empty():
+            self._bostakiler.get_nowait().close()
+
+
+class LruOnbellek:
+    """Süreli LRU önbellek; yalnızca olay döngüsünden kullanılır (kilit gerekmez)."""
+
+    def __init__(self, kapasite: int, sure: float):
+        self.kapasite = kapasite
+        self.sure = sure
+        self._veri: OrderedDict = OrderedDict()   # kelime -> (zaman, sonuç veya None)
+        self.isabet = 0
+        self.iska = 0
+
+    def al(self, word: str):
+        """(bulundu_mu, sonuç); sonuç None ise kelime veritabanında yok demektir."""
+        kayit = self._veri.get(word)
+        if kayit is None or time.monotonic() - kayit[0] > self.sure:
+            self.iska += 1
+            return False, None
+        self._veri.move_to_end(word)
+        self.isabet += 1
+        return True, kayit[1]
+
+    def koy(self, word: str, sonuc: Optional[dict]):
+        if self.kapasite <= 0:
+            return
+        self._veri[word] = (time.monotonic(), sonuc)
+        self._veri.move_to_end(word)
+        while len(self._veri) > self.kapasite:
+            self._veri.popitem(last=False)
+
+    def __len__(self):
+        return len(self._veri)
+
+
+class Olcumler:
+    """Uç nokta başına istek sayısı ve son OLCUM_PENCERESI isteğin gecikme yüzdelikleri."""
+
+    def __init__(self):
+        self.baslangic = time.monotonic()
+        self.sayilar: Dict[str, int] = {}
+        self.hatalar = 0
+        self._sureler: Dict[str, deque] = {}
+
+    def ekle(self, uc: str, sure: float, hata: bool = False):
+        self.sayilar[uc] = self.sayilar.get(uc, 0) + 1
+        self._sureler.setdefault(uc, deque(maxlen=OLCUM_PENCERESI)).append(sure)
+        if hata:
+            self.hatalar += 1
+
+    @staticmethod
+    def yuzdelik(sirali: List[float], oran: float) -> float:
+        if not sirali:
+            return 0.0
+        return sirali[min(len(sirali) - 1, int(oran * len(sirali)))]
+
+    def ozet(self) -> dict:
+        gecen = time.monotonic() - self.baslangic
+        uclar = {}
+        for uc, sureler in self._sureler.items():
+            sirali = sorted(sureler)
+            uclar[uc] = {
+                'istek': self.sayilar[uc],
+                **{f'p{int(oran * 100)}_ms': round(self.yuzdelik(sirali, oran) * 1000, 3)
+                   for oran in (0.5, 0.9, 0.99)},
+                'en_cok_ms': round(sirali[-1] * 1000, 3),
+            }
+        toplam = sum(self.sayilar.values())
+        return {'calisma_suresi_sn': round(gecen, 1), 'toplam_istek': toplam, 'hata': self.hatalar,
+                'istek_sn': round(toplam / gecen, 1) if gecen else 0.0, 'uc_noktalar': uclar}
+
+
+class LexiconServisi:
+    def __init__(self, db_path: str, havuz_boyutu: int, onbellek_kapasitesi: int):
+        self.havuz = BaglantiHavuzu(db_path, havuz_boyutu)
+        self.onbellek = LruOnbellek(onbellek_kapasitesi, ONBELLEK_SURESI)
+        self.olcumler = Olcumler()
+
+    async def kelimeleri_bul(self, words: Sequence[str]) -> Dict[str, Optional[dict]]:
+        """Önce önbellek, eksikler tek bir IN sorgusuyla veritabanından."""
+        sonuclar = {}
+        eksikler = []
+        for word in dict.fromkeys(words):
+            bulundu, sonuc = self.onbellek.al(word)
+            if bulundu:
+                sonuclar[word] = sonuc
+            else:
+                eksikler.append(word)
+        if eksikler:
+            bulunanlar = await self.havuz.bul(eksikler)
+            for word in eksikler:
+                sonuc = bulunanlar.get(word)
+                self.onbellek.koy(word, sonuc)
+                sonuclar[word] = sonuc
+        return sonuclar
+
+    async def isle(self, yontem: str, yol: str, govde: bytes):
+        """(durum kodu, JSON nesnesi, ölçüm adı)"""
+        if yol.startswith('/kelime/'):
+            if yontem != 'GET':
+                return 405, {'hata': 'GET bekleniyor'}, 'kelime'
+            word = unquote(yol[len('/kelime/'):]).strip()
+            if not word:
+                return 400, {'hata': 'kelime boş'}, 'kelime'
+            sonuc = (await self.kelimeleri_bul([word]))[word]
+            if sonuc is None:
+                return 404, {'kelime': word, 'var': False}, 'kelime'
+            return 200, {**sonuc, 'var': True}, 'kelime'
+        if yol == '/toplu':
+            if yontem != 'POST':
+                return 405, {'hata': 'POST bekleniyor'}, 'toplu'
+            try:
+                words = json.loads(govde)['kelimeler']
+                if not isinstance(words, list) or not all(isinstance(w, str) for w in words):
+                    raise ValueError
+            except (ValueError, KeyError, TypeError):
+                return 400, {'hata': 'Gövde {"kelimeler": [...]} biçiminde olmalı'}, 'toplu'
+            if len(words) > TOPLU_AZAMI_KELIME:
+                return 413, {'hata': f'En fazla {TOPLU_AZAMI_KELIME} kelime'}, 'toplu'
+            return 200, {'sonuclar': await self.kelimeleri_bul(words)}, 'toplu'
+        if yol == '/metrikler':
+            toplam = self.onbellek.isabet + self.onbellek.iska
+            return 200, {**self.olcumler.ozet(),
+                         'onbellek': {'kayit': len(self.onbellek), 'kapasite': self.onbellek.kapasite,
+                                      'isabet_orani': round(self.onbellek.isabet / toplam, 4) if toplam else 0.0},
+                         'havuz': self.havuz.boyut}, 'metrikler'
+        if yol == '/saglik':
+            return 200, {'durum': 'ok'}, 'saglik'
+        return 404, {'hata': 'Bilinmeyen uç nokta'}, 'diger'
+
+    async def baglanti(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Bir istemci bağlantısı: keep-alive ile ardışık istekler."""
+        try:
+            while True:
+                try:
+                    baslik = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                t0 = time.perf_counter()
+                satirlar = baslik.decode('latin-1').split('\r\n')
+                try:
+                    yontem, hedef, surum = satirlar[0].split(' ', 2)
+                except ValueError:
+                    return
+                basliklar = {}
+                for satir in satirlar[1:]:
+                    if ':' in satir:
+                        ad, deger = satir.split(':', 1)
+                        basliklar[ad.strip().lower()] = deger.strip()
+                try:
+                    uzunluk = int(basliklar.get('content-length', 0) or 0)
+                except ValueError:
+                    uzunluk = -1
+                if uzunluk < 0:
+                    # Gövdenin nerede bittiği bilinmiyor: yanıt verip bağlantıyı kapat
+                    durum, yanit, uc = 400, {'hata': 'Geçersiz Content-Length'}, 'diger'
+                    acik_kalsin = False
+                elif uzunluk > AZAMI_GOVDE:
+                    durum, yanit, uc = 413, {'hata': 'Gövde çok büyük'}, 'diger'
+                    acik_kalsin = False
+                else:
+                    govde = await reader.readexactly(uzunluk) if uzunluk else b''
+                    baglanti_basligi = basliklar.get('connection', '').lower()
+                    acik_kalsin = baglanti_basligi != 'close' and (surum != 'HTTP/1.0' or baglanti_basligi == 'keep-alive')
+                    try:
+                        durum, yanit, uc = await self.isle(yontem, hedef.split('?', 1)[0], govde)
+                    except Exception as e:
+                        print(f"HATA: İstek işlenemedi ({hedef}): {e}", file=sys.stderr)
+                        durum, yanit, uc = 500, {'hata': 'Sunucu hatası'}, 'diger'
+
+                icerik = json.dumps(yanit, ensure_ascii=False).encode('utf-8')
+                writer.write(f"HTTP/1.1 {durum} {DURUM_METINLERI.get(durum, '')}\r\n"
+                             f"Content-Type: application/json; charset=utf-8\r\n"
+                             f"Content-Length: {len(icerik)}\r\n"
+                             f"Connection: {'keep-alive' if acik_kalsin else 'close'}\r\n\r\n".encode('latin-1')
+                             + icerik)
+                await writer.drain()
+                # 404 "kelime yok" normal bir yanıttır; hata sayılmaz
+                self.olcumler.ekle(uc, time.perf_counter() - t0, hata=durum >= 500)
+                if not acik_kalsin:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def kapat(self):
+        self.havuz.kapat()
+
+
+def wal_kipine_al(db_path: str):
+    """Okuyucular yazıcıları (db_loader vb.) bloklamasın diye veritabanını WAL kipine alır (kalıcı ayar)."""
+    try:
+        with sqlite3.connect(db_path) as conn:
+            kip = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        if kip.lower() != 'wal':
+            print(f"UYARI: Veritabanı WAL kipine alınamadı (kip: {kip}).", file=sys.stderr)
+    except sqlite3.Error as e:
+        print(f"UYARI: Veritabanı WAL kipine alınamadı: {e}", file=sys.stderr)
+
+
+async def calistir(args):
+    servis = LexiconServisi(args.db, args.havuz, args.onbellek)
+    sunucu = await asyncio.start_server(servis.baglanti, args.adres, args.port, backlog=1024)
+    durdur = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sinyal in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sinyal, durdur.set)
+    print(f"-> Servis dinliyor: http://{args.adres}:{args.port} (havuz: {args.havuz} bağlantı, "
+          f"önbellek: {args.onbellek:,} kelime). Durdurmak için Ctrl+C")
+    async with sunucu:
+        await durdur.wait()
+    servis.kapat()
+    ozet = servis.olcumler.ozet()
+    print(f"\n-> Toplam {ozet['toplam_istek']:,} istek ({ozet['istek_sn']:,} istek/sn).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="lexicon.db için salt okunur HTTP sorgu servisi.")
+    parser.add_argument('--db', default=DATABASE_NAME)
+    parser.add_argument('--adres', default=VARSAYILAN_ADRES)
+    parser.add_argument('--port', type=int, default=VARSAYILAN_PORT)
+    parser.add_argument('--havuz', type=int, default=max(2, sistem_kaynaklari.cpu_sayisi()),
+                        help="Salt okunur bağlantı (ve okuyucu iş parçacığı) sayısı")
+    parser.add_argument('--onbellek', type=int, default=ONBELLEK_KAPASITESI,
+                        help="LRU önbellek kapasitesi (kelime; 0: kapalı)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"HATA: Veritabanı '{args.db}' bulunamadı.", file=sys.stderr)
+        sys.exit(1)
+    wal_kipine_al(args.db)
+    try:
+        asyncio.run(calistir(args))
+    except OSError as e:
+        print(f"HATA: Servis başlatılamadı: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
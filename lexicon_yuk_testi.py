@@ -0,0 +1,158 @@
+# lexicon_yuk_testi.py
+# Amaç: Yerelde çalışan lexicon_servisi.py'ye yük bindirip gecikme (p50/p90/p99) ve
+# istek hızını ölçmek.
+#
+# Sorgulanan kelimeler veritabanından rastgele örneklenir; --yok-orani kadarı veritabanında
+# bulunmayan uydurma kelimelerdir. Kelimeler Zipf benzeri bir dağılımla tekrar eder
+# (gerçek trafikte olduğu gibi sık kelimeler önbellekten döner).
+#
+# Kullanım:
+#   python lexicon_servisi.py &
+#   python lexicon_yuk_testi.py                              (20 bağlantı, 10 sn, GET /kelime)
+#   python lexicon_yuk_testi.py --baglanti 50 --sure 30
+#   python lexicon_yuk_testi.py --toplu 100                  (POST /toplu, istek başına 100 kelime)
+
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import sys
+import time
+from itertools import accumulate
+from typing import List
+from urllib.parse import quote
+
+import lexicon_servisi
+
+ORNEK_SAYISI = 50_000
+HARFLER = 'abcçdefgğhıijklmnoöprsştuüvyz'
+
+
+def kelime_ornekle(db_path: str, n: int, yok_orani: float, tohum: int = 42) -> List[str]:
+    """Veritabanından rastgele n kelime (+ yok_orani kadar uydurma kelime)."""
+    rnd = random.Random(tohum)
+    with sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) as conn:
+        en_buyuk = conn.execute("SELECT COALESCE(MAX(id), 0) FROM kelimeler").fetchone()[0]
+        if not en_buyuk:
+            return []
+        kimlikler = [rnd.randint(1, en_buyuk) for _ in range(n)]
+        words = []
+        for i in range(0, len(kimlikler), 500):
+            parca = kimlikler[i:i + 500]
+            words += [row[0] for row in conn.execute(
+                f"SELECT kelime FROM kelimeler WHERE id IN ({', '.join('?' * len(parca))})", parca)]
+    uydurma = int(len(words) * yok_orani / (1 - yok_orani)) if yok_orani < 1 else len(words)
+    words += [''.join(rnd.choice(HARFLER) for _ in range(rnd.randint(5, 12))) + 'xq' for _ in range(uydurma)]
+    rnd.shuffle(words)
+    return words
+
+
+class Istemci:
+    """Tek bir keep-alive HTTP bağlantısı."""
+
+    def __init__(self, adres: str, port: int):
+        self.adres = adres
+        self.port = port
+
+    async def ac(self):
+        self.reader, self.writer = await asyncio.open_connection(self.adres, self.port)
+
+    async def istek(self, yontem: str, yol: str, govde: bytes = b'') -> int:
+        self.writer.write(f"{yontem} {yol} HTTP/1.1\r\nHost: {self.adres}\r\n"
+                          f"Content-Length: {len(govde)}\r\n\r\n".encode('latin-1') + govde)
+        await self.writer.drain()
+        baslik = await self.reader.readuntil(b'\r\n\r\n')
+        satirlar = baslik.decode('latin-1').split('\r\n')
+        durum = int(satirlar[0].split(' ', 2)[1])
+        uzunluk = 0
+        for satir in satirlar[1:]:
+            if satir.lower().startswith('content-length:'):
+                uzunluk = int(satir.split(':', 1)[1])
+        await self.reader.readexactly(uzunluk)
+        return durum
+
+    async def kapat(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def yuk_bindir(args, words: List[str]):
+    rnd = random.Random(7)
+    # Zipf benzeri: düşük sıradaki kelimeler çok daha sık sorulur
+    # (birikimli ağırlıklar bir kez hesaplanır; choices her çağrıda yeniden toplamasın)
+    birikimli = list(accumulate(1 / (i + 1) ** args.zipf for i in range(len(words))))
+    bitis = time.monotonic() + args.sure
+    sureler: List[float] = []
+    durumlar = {}
+    istemciler = [Istemci(args.adres, args.port) for _ in range(args.baglanti)]
+    await asyncio.gather(*(istemci.ac() for istemci in istemciler))
+
+    async def calis(istemci: Istemci):
+        while time.monotonic() < bitis:
+            if args.toplu:
+                secim = rnd.choices(words, cum_weights=birikimli, k=args.toplu)
+                govde = json.dumps({'kelimeler': secim}, ensure_ascii=False).encode('utf-8')
+                t0 = time.perf_counter()
+                durum = await istemci.istek('POST', '/toplu', govde)
+            else:
+                word = rnd.choices(words, cum_weights=birikimli)[0]
+                t0 = time.perf_counter()
+                durum = await istemci.istek('GET', '/kelime/' + quote(word))
+            sureler.append(time.perf_counter() - t0)
+            durumlar[durum] = durumlar.get(durum, 0) + 1
+
+    t0 = time.monotonic()
+    await asyncio.gather(*(calis(istemci) for istemci in istemciler))
+    gecen = time.monotonic() - t0
+    await asyncio.gather(*(istemci.kapat() for istemci in istemciler))
+
+    metrikler_istemcisi = Istemci(args.adres, args.port)
+    await metrikler_istemcisi.ac()
+    metrikler_istemcisi.writer.write(b"GET /metrikler HTTP/1.1\r\nConnection: close\r\n\r\n")
+    yanit = await metrikler_istemcisi.reader.read()
+    await metrikler_istemcisi.kapat()
+    return sureler, durumlar, gecen, json.loads(yanit.split(b'\r\n\r\n', 1)[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="lexicon_servisi.py yük testi (gecikme ve istek hızı).")
+    parser.add_argument('--db', default=lexicon_servisi.DATABASE_NAME, help="Kelime örneklemi için veritabanı")
+    parser.add_argument('--adres', default=lexicon_servisi.VARSAYILAN_ADRES)
+    parser.add_argument('--port', type=int, default=lexicon_servisi.VARSAYILAN_PORT)
+    parser.add_argument('--baglanti', type=int, default=20, help="Eş zamanlı keep-alive bağlantı sayısı")
+    parser.add_argument('--sure', type=float, default=10.0, help="Test süresi (sn)")
+    parser.add_argument('--toplu', type=int, default=0, help="0: GET /kelime; N: POST /toplu ile istek başına N kelime")
+    parser.add_argument('--yok-orani', type=float, default=0.1, help="Veritabanında olmayan kelime oranı")
+    parser.add_argument('--zipf', type=float, default=1.0, help="Kelime tekrar dağılımının üssü (0: düzgün)")
+    args = parser.parse_args()
+
+    words = kelime_ornekle(args.db, ORNEK_SAYISI, args.yok_orani)
+    if not words:
+        print(f"HATA: '{args.db}' içinde örneklenecek kelime yok.", file=sys.stderr)
+        sys.exit(1)
+    print(f"-> {len(words):,} kelimelik örneklem; {args.baglanti} bağlantı, {args.sure:.0f} sn "
+          f"({'POST /toplu x' + str(args.toplu) if args.toplu else 'GET /kelime'})...")
+    try:
+        sureler, durumlar, gecen, metrikler = asyncio.run(yuk_bindir(args, words))
+    except OSError as e:
+        print(f"HATA: Servise bağlanılamadı ({args.adres}:{args.port}): {e}", file=sys.stderr)
+        sys.exit(1)
+
+    sirali = sorted(sureler)
+    yuzdelik = lexicon_servisi.Olcumler.yuzdelik
+    print(f"\nİstek: {len(sureler):,} ({len(sureler) / gecen:,.0f} istek/sn"
+          + (f", {len(sureler) * args.toplu / gecen:,.0f} kelime/sn" if args.toplu else "") + ")")
+    print("Durum kodları: " + ", ".join(f"{k}: {v:,}" for k, v in sorted(durumlar.items())))
+    print("İstemci gecikmesi (ms): " + ", ".join(
+        f"p{int(oran * 100)} {yuzdelik(sirali, oran) * 1000:.2f}" for oran in (0.5, 0.9, 0.99))
+          + f", en çok {sirali[-1] * 1000:.2f}")
+    print(f"Sunucu: önbellek isabet oranı {metrikler['onbellek']['isabet_orani']:.1%}, "
+          + ", ".join(f"{uc} p99 {m['p99_ms']} ms" for uc, m in metrikler['uc_noktalar'].items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,98 +3,71 @@
 
 import sqlite3
 import os
+import argparse
 import sys
 import time
 from typing import List, Tuple, Optional
 
-# Zemberek ve Jpype kütüphaneleri
-try:
-    from jpype import startJVM, getDefaultJVMPath, JClass, JString, shutdownJVM
-except ImportError:
-    print("HATA: jpype1 kütüphanesi kurulu değil. Lütfen kontrol edin.", file=sys.stderr)
-    sys.exit(1)
+import morfoloji
+import db_loader
+import lexicon_sema
 
 # --- KONFİGÜRASYON ---
 DATABASE_NAME = 'lexicon.db'
 INPUT_FILE = 'yeni_adaylar.txt'
 ZEMBEREK_PATH = os.path.abspath('zemberek-full.jar')
+# Morfoloji arka ucu (morfoloji.py): 'oto', 'jpype', 'servis', 'python' veya 'bos'.
+# 'oto': morfoloji servisi çalışıyorsa servis, çalışmıyorsa jpype.
+# DERLEM_MORFOLOJI ortam değişkeniyle değiştirilebilir.
+MORFOLOJI_ARKA_UCU = 'oto'
+# Analizciye tek seferde gönderilen kelime sayısı
+ANALIZ_BATCH_BOYUTU = 5000
 
-# Global Zemberek nesneleri (Sequential işlem için)
-morphology = None
-TurkishMorphology = None
+# Global analizci (Sequential işlem için)
+analizci = None
 
 # --- ZEMBEREK VE JVM AYARLARI ---
 
 def setup_jvm_and_zemberek():
-    """JVM'yi başlatır ve Zemberek'i belleğe yükler."""
-    global morphology, TurkishMorphology
+    """Morfoloji arka ucunu (jpype için JVM + Zemberek) belleğe yükler."""
+    global analizci
     
-    if not os.path.exists(ZEMBEREK_PATH):
-        print(f"HATA: Zemberek JAR dosyası bulunamadı: {ZEMBEREK_PATH}", file=sys.stderr)
-        sys.exit(1)
-        
     try:
-        print("-> JVM Başlatılıyor...")
+        print("-> Morfoloji arka ucu başlatılıyor...")
         # Küçük veri seti için daha düşük Xmx ayarı kullanılabilir
-        startJVM(getDefaultJVMPath(), '-ea', f'-Djava.class.path={ZEMBEREK_PATH}', '-Xmx2g')
-        
-        TurkishMorphology = JClass('zemberek.morphology.TurkishMorphology')
-        morphology = TurkishMorphology.createWithDefaults()
-        print("-> Zemberek TurkishMorphology yüklendi.")
+        analizci = morfoloji.analizci_olustur(varsayilan=MORFOLOJI_ARKA_UCU, jar_path=ZEMBEREK_PATH)
+        print(f"-> Zemberek ({analizci.ad}) yüklendi.")
         return True
+    except FileNotFoundError as e:
+        print(f"HATA: {e}", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"KRİTİK HATA: JVM başlatılırken veya Zemberek yüklenirken bir sorun oluştu: {e}", file=sys.stderr)
         return False
 
 # --- YARDIMCI FONKSİYONLAR ---
 
-def format_morphemes(analysis):
-    """Analizden eklerin yüzey formlarını (surface forms) birleştirir (data_loader.py'den alınmıştır)."""
-    morpheme_data_list = analysis.getMorphemeDataList()
-    if morpheme_data_list.size() <= 1:
-        return ""
-    
-    # Kök hariç morpheme'lerin yüzey formlarını al ve birleştir
-    surface_forms = [str(morpheme_data_list.get(i).surface) for i in range(1, morpheme_data_list.size())]
-    return f"({'-'.join(surface_forms)})"
-
-def analyze_word(word: str) -> Optional[Tuple]:
-    """Verilen kelimeyi analiz eder ve veritabanına yazılacak formata dönüştürür."""
-    global morphology
-    if morphology is None:
-        return None
-
-    try:
-        j_word = JString(word.strip())
-        analysis = morphology.analyze(j_word)
-        results = analysis.getAnalysisResults()
-        
-        # Analiz sonucu yoksa, None döndür
-        if results.isEmpty():
-             return None
-
-        # En iyi sonucu al (Zemberek genellikle ilk sonucu en olası kabul eder)
-        best_result = results.get(0)
-        
-        # Analiz bileşenlerini çek
-        kelime = word.strip()
-        lemma = str(best_result.getLemmas()[0])
-        kok = str(best_result.getStems()[0])
-        ekler = format_morphemes(best_result)
-        analiz = str(best_result.formatLong()) # Tam Zemberek analiz formatı
-        yontem = 'zemberek'
-        
+def analyze_words(words: List[str]) -> List[Tuple]:
+    """Verilen kelimeleri analiz eder; sadece başarılı analizleri veritabanı formatında döndürür."""
+    if analizci is None:
+        return []
+
+    basarili = []
+    for sonuc in analizci.analyze_batch([word.strip() for word in words]):
+        # Analiz sonucu yoksa atla
+        if sonuc is None:
+            continue
+        if sonuc[5] != 'zemberek':
+            # Analiz sırasında JVM hatası/çökmesi oluşursa (nadir)
+            print(f"UYARI: '{sonuc[0]}' kelimesi analiz edilirken hata oluştu: {sonuc[4]}", file=sys.stderr)
+            continue
         # kelime, lemma, kok, ekler, analiz, yontem (kelimeler tablosunun ilk 6 kolonu)
-        return (kelime, lemma, kok, ekler, analiz, yontem)
-
-    except Exception as e:
-        # Analiz sırasında JVM hatası/çökmesi oluşursa (nadir)
-        print(f"UYARI: '{word}' kelimesi analiz edilirken hata oluştu: {type(e).__name__}", file=sys.stderr)
-        return None
+        basarili.append(sonuc)
+    return basarili
 
 def ensure_kelimeler_table_exists():
     """'kelimeler' tablosunu db_loader.py şemasına göre oluşturur (Yoksa)."""
-    script = """
+    script = f"""
         CREATE TABLE IF NOT EXISTS kelimeler (
             id INTEGER PRIMARY KEY,
             kelime TEXT NOT NULL UNIQUE,
@@ -105,6 +78,7 @@ def ensure_kelimeler_table_exists():
             yontem TEXT,
             aciklama TEXT,
             onay INTEGER DEFAULT 0,
+            {lexicon_sema.kok_kolonlari_tanimi()},
             CHECK (LENGTH(kelime) > 0)
         );
     """
@@ -118,15 +92,11 @@ def ensure_kelimeler_table_exists():
 
 # --- ANA AKIŞ ---
 
-def main():
+def main(guncelle: bool = False):
     print("--- Zemberek Mini Analiz ve Doğrudan Veritabanı Yükleyici ---")
     start_time = time.time()
     
-    # 1. JVM ve Zemberek Kurulumu
-    if not setup_jvm_and_zemberek():
-        return
-        
-    # 2. Kelime Adaylarını Oku
+    # 1. Kelime Adaylarını Oku
     if not os.path.exists(INPUT_FILE):
         print(f"HATA: Giriş dosyası '{INPUT_FILE}' bulunamadı.", file=sys.stderr)
         return
@@ -143,25 +113,38 @@ def main():
         print(f"HATA: Giriş dosyası okunurken sorun oluştu: {e}", file=sys.stderr)
         return
 
-    # 3. Veritabanı Kurulumu
+    # 2. Veritabanı Kurulumu
     ensure_kelimeler_table_exists()
 
-    # 4. Analiz ve Toplu Veri Toplama
+    # 3. Ön eleme: kelimeler tablosunda zaten bulunan adaylar analiz edilmez
+    #    (güncelleme modunda hepsi yeniden analiz edilir)
+    if guncelle:
+        candidate_list = sorted(candidate_words)
+    else:
+        candidate_list = db_loader.veritabaninda_olmayanlar(DATABASE_NAME, sorted(candidate_words))
+        print(f"-> {total_candidates - len(candidate_list)} kelime veritabanında zaten var, atlandı. "
+              f"Analiz edilecek: {len(candidate_list)}")
+    total_candidates = len(candidate_list)
+    if not candidate_list:
+        print("-> Analiz edilecek yeni kelime yok.")
+        return
+
+    # 4. JVM ve Zemberek Kurulumu (yalnızca analiz edilecek kelime varsa)
+    if not setup_jvm_and_zemberek():
+        return
+
+    # 5. Analiz ve Toplu Veri Toplama
     print("-> Zemberek analizleri başlıyor ve veriler toplanıyor...")
     analysis_data_for_db = []
     
-    for i, word in enumerate(candidate_words):
-        result = analyze_word(word)
-        if result:
-            analysis_data_for_db.append(result)
-            
-        if (i + 1) % 5000 == 0:
-            print(f"   İlerleme: {i + 1}/{total_candidates} kelime analiz edildi...")
+    for i in range(0, total_candidates, ANALIZ_BATCH_BOYUTU):
+        analysis_data_for_db.extend(analyze_words(candidate_list[i:i + ANALIZ_BATCH_BOYUTU]))
+        print(f"   İlerleme: {min(i + ANALIZ_BATCH_BOYUTU, total_candidates)}/{total_candidates} kelime analiz edildi...")
             
     success_count = len(analysis_data_for_db)
     print(f"-> Analiz tamamlandı. Başarılı analiz sayısı: {success_count}")
 
-    # 5. Veritabanına Doğrudan Toplu Yazma
+    # 6. Veritabanına Doğrudan Toplu Yazma
     if not analysis_data_for_db:
         print("-> Veritabanına yazılacak analiz sonucu yok.")
         return
@@ -174,17 +157,18 @@ def main():
         cursor.execute("PRAGMA journal_mode = WAL")
         cursor.execute("PRAGMA synchronous = OFF") 
 
-        # INSERT OR IGNORE ile sadece mevcut olmayan kelimeler eklenir
-        sql_insert = """
-        INSERT OR IGNORE INTO kelimeler (kelime, lemma, kok, ekler, analiz, yontem)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """
+        # INSERT OR IGNORE ile sadece mevcut olmayan kelimeler eklenir;
+        # güncelleme modunda analizi değişen mevcut kelimeler de güncellenir (aciklama/onay korunur)
+        sql_insert = db_loader.UPSERT_SQL if guncelle else db_loader.INSERT_SQL
         
+        sayac = db_loader.DegisiklikSayaci(conn)
         cursor.executemany(sql_insert, analysis_data_for_db)
-        inserted_count = cursor.rowcount
         conn.commit()
+        inserted_count, updated_count, unchanged_count = sayac.ozet(success_count)
         
         print(f"\n✅ Başarıyla veritabanına eklenen yeni (non-duplicate) kayıt sayısı: {inserted_count}")
+        if guncelle:
+            print(f"   Güncellenen: {updated_count}, değişmeyen: {unchanged_count}")
         print(f"   (Toplam analiz edilen kayıt: {success_count})")
         
     except sqlite3.Error as e:
@@ -199,11 +183,15 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="yeni_adaylar.txt kelimelerini analiz edip kelimeler tablosuna yazar.")
+    parser.add_argument('--guncelle', action='store_true',
+                        help="Tablodaki kelimeleri de yeniden analiz et ve değişen analizleri güncelle")
+    args = parser.parse_args()
+    main(guncelle=args.guncelle)
     
-    # İşlem bittiğinde JVM'yi kapat
+    # İşlem bittiğinde arka ucu (JVM) kapat
     try:
-        shutdownJVM()
-        # print("-> JVM başarıyla kapatıldı.") # Zaten main içinde yazdırıldığı için burada kapatıldı
+        if analizci is not None:
+            analizci.kapat()
     except Exception as e:
         print(f"UYARI: JVM kapatılırken sorun oluştu: {e}", file=sys.stderr)
@@ -0,0 +1,435 @@
+# morfoloji.py
+# Amaç: Zemberek morfolojik analizi için ortak ve değiştirilebilir arka uçlar.
+# yeni_kelime_tara.py, data_loader.py ve mini_loader.py aynı arayüzü kullanır:
+#
+#     analizci = analizci_olustur('jpype')
+#     sonuclar = analizci.analyze_batch(['kitaplar', 'geliyorum'])
+#
+# Her sonuç, kelimeler tablosunun ilk 6 kolonuyla aynı sıradadır:
+#     (kelime, lemma, kok, ekler, analiz, yontem)
+# Zemberek kelimeyi tanımıyorsa sonuç None'dır.
+# Analiz sırasında hata oluşursa yontem = 'zemberek_hata' olur.
+#
+# Arka uç seçimi: analizci_olustur() parametresi > DERLEM_MORFOLOJI ortam değişkeni > betiğin varsayılanı.
+#   'python' : saf Python zemberek paketi (pip install zemberek-python)
+#   'jpype'  : zemberek-full.jar, tek JVM (pip install jpype1)
+#   'bos'    : analiz yapmaz (morfoloji devre dışı)
+#   'servis' : morfoloji_servisi.py ile çalışan yerel analiz servisi (sıcak JVM, Unix soketi)
+#   'oto'    : servis çalışıyorsa 'servis', çalışmıyorsa 'jpype'
+# 'jpype' her zaman kendi JVM'sini başlatır; servise yalnızca 'servis' ve 'oto' ile geçilir.
+# onbellek > 0 verilirse seçilen arka uç bir LRU önbelleğiyle sarılır.
+
+import importlib.util
+import os
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+AnalizSonucu = Tuple[str, str, str, str, str, str]
+
+ZEMBEREK_PATH = os.path.abspath(os.environ.get('ZEMBEREK_JAR', 'zemberek-full.jar'))
+JVM_ARGUMANLARI = ('-ea', '-Xmx2g')
+ARKA_UCLAR = ('python', 'jpype', 'bos', 'servis', 'oto')
+
+# morfoloji_servisi.py'nin dinlediği Unix soketi
+SERVIS_SOKETI = os.environ.get('DERLEM_MORFOLOJI_SOKETI', os.path.abspath('morfoloji_servisi.sock'))
+
+# Java tarafı toplu analiz yardımcısı (java/derlem/BatchAnalizci.java).
+# İlk kullanımda javac ile JAVA_DERLEME_DIZINI altına derlenir.
+_KOK_DIZIN = os.path.dirname(os.path.abspath(__file__))
+JAVA_KAYNAK = os.path.join(_KOK_DIZIN, 'java', 'derlem', 'BatchAnalizci.java')
+JAVA_DERLEME_DIZINI = os.path.join(_KOK_DIZIN, 'java', 'build')
+JAVA_SINIF_ADI = 'derlem.BatchAnalizci'
+
+
+def hata_sonucu(word: str, e) -> AnalizSonucu:
+    """Analiz hatası için data_loader.py'nin TSV formatındaki hata satırını üretir."""
+    return (word, word, "", "", f"HATA: Analiz Hatası ({e})", "zemberek_hata")
+
+
+# --- Paketlenmiş Sonuç Biçimi ---
+# Java yardımcısı (BatchAnalizci) ve morfoloji servisi aynı biçimi kullanır.
+# Kelime başına bir satır, girdi sırasıyla:
+#   +\tlemma\tkok\tekler\tanaliz   |   -  (tanınmadı)   |   !\thata mesajı
+
+def _temizle(alan: str) -> str:
+    return alan.replace('\t', ' ').replace('\n', ' ').replace('\r', ' ')
+
+
+def sonuclari_paketle(sonuclar: Sequence[Optional[AnalizSonucu]]) -> str:
+    """Analiz sonuçlarını paketlenmiş satır biçimine çevirir."""
+    satirlar = []
+    for sonuc in sonuclar:
+        if sonuc is None:
+            satirlar.append('-')
+        elif sonuc[5] == 'zemberek':
+            satirlar.append('+\t' + '\t'.join(_temizle(alan) for alan in sonuc[1:5]))
+        else:
+            satirlar.append('!\t' + _temizle(sonuc[4]))
+    return ''.join(satir + '\n' for satir in satirlar)
+
+
+def paketi_coz(words: Sequence[str], paket: str) -> List[Optional[AnalizSonucu]]:
+    """
+    Paketlenmiş satırları, words sırasıyla analiz sonuçlarına çevirir.
+    Satır sayısı kelime sayısını tutmazsa ValueError: kelimeler sessizce kaybolmaz, görev hata
+    verir (analiz_denetcisi görevi ikiye bölerek yeniden dener).
+    """
+    satirlar = paket.split('\n')
+    if satirlar and satirlar[-1] == '':
+        satirlar.pop()
+    if len(satirlar) != len(words):
+        raise ValueError(f"Paketlenmiş sonuç {len(satirlar)} satır içeriyor, {len(words)} kelime bekleniyordu.")
+    sonuclar = []
+    for word, satir in zip(words, satirlar):
+        durum = satir[:1]
+        if durum == '+':
+            _, lemma, kok, ekler, analiz = satir.split('\t', 4)
+            sonuclar.append((word, lemma, kok, ekler, analiz, 'zemberek'))
+        elif durum == '-':
+            sonuclar.append(None)
+        else:
+            sonuclar.append(hata_sonucu(word, satir[2:]))
+    return sonuclar
+
+
+class Analizci:
+    """Tüm morfoloji arka uçlarının ortak arayüzü."""
+
+    ad = 'temel'
+
+    def analyze_batch(self, words: Sequence[str]) -> List[Optional[AnalizSonucu]]:
+        """Kelime listesini analiz eder; sonuçlar girdi sırasıyla döner."""
+        raise NotImplementedError
+
+    def analyze(self, word: str) -> Optional[AnalizSonucu]:
+        return self.analyze_batch([word])[0]
+
+    def kapat(self):
+        """Arka ucun kaynaklarını bırakır (varsa)."""
+        pass
+
+
+class BosAnalizci(Analizci):
+    """Hiçbir kelimeyi tanımayan arka uç. Zemberek kurulu değilken kullanılır."""
+
+    ad = 'bos'
+
+    def analyze_batch(self, words: Sequence[str]) -> List[Optional[AnalizSonucu]]:
+        return [None] * len(words)
+
+
+class ZemberekPythonAnalizci(Analizci):
+    """Saf Python zemberek paketiyle analiz (JVM gerektirmez, yavaştır)."""
+
+    ad = 'python'
+
+    def __init__(self):
+        from zemberek import TurkishMorphology
+        self.morphology = TurkishMorphology.create_with_defaults()
+
+    def analyze_batch(self, words: Sequence[str]) -> List[Optional[AnalizSonucu]]:
+        sonuclar = []
+        for word in words:
+            try:
+                results = self.morphology.analyze(word).analysis_results
+                if not results:
+                    sonuclar.append(None)
+                    continue
+                best_result = results[0]
+                surface_forms = [m.surface for m in best_result.morpheme_data_list[1:]]
+                ekler = f"({'-'.join(surface_forms)})" if surface_forms else ""
+                sonuclar.append((word, str(best_result.get_lemmas()[0]), str(best_result.get_stems()[0]),
+                                 ekler, str(best_result.format_long()), 'zemberek'))
+            except Exception as e:
+                sonuclar.append(hata_sonucu(word, e))
+        return sonuclar
+
+
+def java_yardimcisini_derle(jar_path: str = ZEMBEREK_PATH) -> Optional[str]:
+    """
+    BatchAnalizci.java'yı (gerekirse) derler ve sınıf dizinini döndürür.
+    javac yoksa veya derleme başarısızsa None döner; çağıran kelime kelime analize düşer.
+    """
+    sinif_dosyasi = os.path.join(JAVA_DERLEME_DIZINI, 'derlem', 'BatchAnalizci.class')
+    if os.path.exists(sinif_dosyasi) and os.path.getmtime(sinif_dosyasi) >= os.path.getmtime(JAVA_KAYNAK):
+        return JAVA_DERLEME_DIZINI
+
+    javac = shutil.which('javac')
+    if javac is None:
+        print("UYARI: javac bulunamadı; Java toplu analiz yardımcısı kullanılamıyor.", file=sys.stderr)
+        return None
+    # Birden fazla işçi aynı anda derleyebilir: geçici dizine derle, sınıf dosyasını atomik taşı.
+    os.makedirs(os.path.dirname(sinif_dosyasi), exist_ok=True)
+    gecici_dizin = tempfile.mkdtemp(prefix='derleme_', dir=JAVA_DERLEME_DIZINI)
+    try:
+        subprocess.run([javac, '-encoding', 'UTF-8', '-cp', jar_path, '-d', gecici_dizin, JAVA_KAYNAK],
+                       check=True, capture_output=True, text=True)
+        os.replace(os.path.join(gecici_dizin, 'derlem', 'BatchAnalizci.class'), sinif_dosyasi)
+    except subprocess.CalledProcessError as e:
+        print(f"UYARI: BatchAnalizci derlenemedi: {e.stderr.strip()}", file=sys.stderr)
+        return None
+    finally:
+        shutil.rmtree(gecici_dizin, ignore_errors=True)
+    return JAVA_DERLEME_DIZINI
+
+
+class JPypeAnalizci(Analizci):
+    """
+    zemberek-full.jar ile JPype üzerinden analiz.
+    JVM süreç başına bir kez başlatılır; aynı süreçte ikinci bir örnek JVM'yi paylaşır.
+    Java toplu analiz yardımcısı varsa her batch tek bir JNI çağrısıyla analiz edilir,
+    yoksa kelime kelime analize düşülür.
+    thread_sayisi > 1 ise batch, aynı TurkishMorphology örneğini paylaşan iş parçacıklarıyla
+    analiz edilir (Java tarafı havuz; yardımcı yoksa GIL'i JVM çağrılarında bırakan Python thread'leri).
+    """
+
+    ad = 'jpype'
+
+    def __init__(self, jar_path: str = ZEMBEREK_PATH, jvm_args: Iterable[str] = JVM_ARGUMANLARI,
+                 java_yardimcisi: bool = True, thread_sayisi: int = 1):
+        import jpype
+
+        if not os.path.exists(jar_path):
+            raise FileNotFoundError(f"Zemberek JAR dosyası bulunamadı: {jar_path}")
+        if not jpype.isJVMStarted():
+            class_path = [jar_path]
+            sinif_dizini = java_yardimcisini_derle(jar_path) if java_yardimcisi else None
+            if sinif_dizini:
+                class_path.append(sinif_dizini)
+            jpype.startJVM(jpype.getDefaultJVMPath(), *jvm_args,
+                           f'-Djava.class.path={os.pathsep.join(class_path)}')
+        self._JString = jpype.JString
+        self._JStringArray = jpype.JArray(jpype.JString)
+        TurkishMorphology = jpype.JClass('zemberek.morphology.TurkishMorphology')
+        self.morphology = TurkishMorphology.createWithDefaults()
+
+        self._batch_sinifi = None
+        if java_yardimcisi:
+            try:
+                self._batch_sinifi = jpype.JClass(JAVA_SINIF_ADI)
+            except Exception:
+                # JVM yardımcı sınıf olmadan başlatılmış (javac yok ya da JVM önceden açılmış)
+                self._batch_sinifi = None
+        if self._batch_sinifi is not None:
+            self.ad = 'jpype-batch'
+
+        self.thread_sayisi = max(1, thread_sayisi)
+        self._thread_havuzu = None
+        if self.thread_sayisi > 1:
+            self.ad += f'-{self.thread_sayisi}t'
+            if self._batch_sinifi is None:
+                self._thread_havuzu = ThreadPoolExecutor(max_workers=self.thread_sayisi)
+
+    def _java_batch_analiz(self, words: Sequence[str]) -> List[Optional[AnalizSonucu]]:
+        """Tüm batch'i tek bir String[] olarak Java'ya gönderir ve paketlenmiş sonucu çözer."""
+        j_words = self._JStringArray(list(words))
+        if self.thread_sayisi > 1:
+            paket = str(self._batch_sinifi.analyzeBatchParallel(self.morphology, j_words, self.thread_sayisi))
+        else:
+            paket = str(self._batch_sinifi.analyzeBatch(self.morphology, j_words))
+        return paketi_coz(words, paket)
+
+    @staticmethod
+    def format_morphemes(analysis) -> str:
+        """Ekleri (iyor-um) formatında çıkarır."""
+        morpheme_data_list = analysis.getMorphemeDataList()
+        if morpheme_data_list.size() <= 1:
+            return ""
+        surface_forms = [str(morpheme_data_list.get(i).surface) for i in range(1, morpheme_data_list.size())]
+        return f"({'-'.join(surface_forms)})"
+
+    def analyze_batch(self, words: Sequence[str]) -> List[Optional[AnalizSonucu]]:
+        if self._batch_sinifi is not None and words:
+            return self._java_batch_analiz(words)
+        if self._thread_havuzu is not None and len(words) >= self.thread_sayisi * 16:
+            dilim = -(-len(words) // self.thread_sayisi)
+            parcalar = [words[i:i + dilim] for i in range(0, len(words), dilim)]
+            return [s for parca in self._thread_havuzu.map(self._kelime_kelime_analiz, parcalar) for s in parca]
+        return self._kelime_kelime_analiz(words)
+
+    def _kelime_kelime_analiz(self, words: Sequence[str]) -> List[Optional[AnalizSonucu]]:
+        sonuclar = []
+        for word in words:
+            try:
+                results = self.morphology.analyze(self._JString(word)).getAnalysisResults()
+                if results.isEmpty():
+                    sonuclar.append(None)
+                    continue
+                best_result = results.get(0)
+                sonuclar.append((word, str(best_result.getLemmas()[0]), str(best_result.getStems()[0]),
+                                 self.format_morphemes(best_result), str(best_result.formatLong()), 'zemberek'))
+            except Exception as e:
+                sonuclar.append(hata_sonucu(word, e))
+        return sonuclar
+
+    def kapat(self):
+        """JVM'yi kapatır. DİKKAT: JPype, aynı süreçte JVM'nin yeniden başlatılmasına izin vermez."""
+        import jpype
+        if self._thread_havuzu is not None:
+            self._thread_havuzu.shutdown()
+        if jpype.isJVMStarted():
+            jpype.shutdownJVM()
+
+
+# --- Morfoloji Servisi İstemcisi ---
+# Çerçeve: 4 baytlık (big-endian) uzunluk + UTF-8 veri.
+# İstek verisi '\n' ile ayrılmış kelimeler, yanıt paketlenmiş sonuç satırlarıdır.
+# Boş istek çerçevesi "ping"dir; servis boş çerçeveyle yanıt verir.
+
+def cerceve_gonder(sock: socket.socket, veri: bytes):
+    sock.sendall(struct.pack('>I', len(veri)) + veri)
+
+
+def cerceve_al(sock: socket.socket) -> Optional[bytes]:
+    """Bir çerçeve okur; bağlantı kapandıysa None döner."""
+    baslik = _tam_oku(sock, 4)
+    if baslik is None:
+        return None
+    (uzunluk,) = struct.unpack('>I', baslik)
+    return _tam_oku(sock, uzunluk) if uzunluk else b''
+
+
+def _tam_oku(sock: socket.socket, n: int) -> Optional[bytes]:
+    parcalar = []
+    while n:
+        parca = sock.recv(min(n, 1 << 20))
+        if not parca:
+            return None
+        parcalar.append(parca)
+        n -= len(parca)
+    return b''.join(parcalar)
+
+
+def servis_calisiyor_mu(soket_yolu: str = SERVIS_SOKETI, zaman_asimi: float = 0.5) -> bool:
+    """Morfoloji servisinin soketi dinleyip ping'e yanıt verip vermediğini denetler."""
+    if not os.path.exists(soket_yolu):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(zaman_asimi)
+            sock.connect(soket_yolu)
+            cerceve_gonder(sock, b'')
+            return cerceve_al(sock) == b''
+    except OSError:
+        return False
+
+
+class ServisAnalizcisi(Analizci):
+    """Analizleri çalışan morfoloji_servisi.py'ye yaptırır (JVM başlatma maliyeti yok)."""
+
+    ad = 'servis'
+
+    def __init__(self, soket_yolu: str = SERVIS_SOKETI):
+        self.soket_yolu = soket_yolu
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(soket_yolu)
+
+    def analyze_batch(self, words: Sequence[str]) -> List[Optional[AnalizSonucu]]:
+        # Boş kelimeler gönderilmez: tek boş kelimelik istek boş çerçeveye (ping) dönüşür.
+        # Zemberek boş kelimeyi zaten tanımaz, sonuçları None'dır.
+        dolular = [word for word in words if word]
+        if not dolular:
+            return [None] * len(words)
+        # Satır ayırıcı kelimenin içinde olamaz
+        istek = '\n'.join(word.replace('\n', ' ') for word in dolular)
+        cerceve_gonder(self._sock, istek.encode('utf-8'))
+        yanit = cerceve_al(self._sock)
+        if yanit is None:
+            raise ConnectionError("Morfoloji servisi bağlantıyı kapattı.")
+        sonuclar = iter(paketi_coz(dolular, yanit.decode('utf-8')))
+        return [next(sonuclar) if word else None for word in words]
+
+    def kapat(self):
+        self._sock.close()
+
+
+class OnbellekliAnalizci(Analizci):
+    """Başka bir arka ucu LRU önbelleğiyle sarar; tekrar eden kelimeler yeniden analiz edilmez."""
+
+    def __init__(self, ic_analizci: Analizci, kapasite: int = 100_000):
+        self.ic = ic_analizci
+        self.kapasite = kapasite
+        self.ad = f'{ic_analizci.ad}+onbellek'
+        self._onbellek = OrderedDict()
+        self.isabet = 0
+        self.iska = 0
+
+    def analyze_batch(self, words: Sequence[str]) -> List[Optional[AnalizSonucu]]:
+        onbellek = self._onbellek
+        eksikler = [w for w in dict.fromkeys(words) if w not in onbellek]
+        if eksikler:
+            for word, sonuc in zip(eksikler, self.ic.analyze_batch(eksikler)):
+                onbellek[word] = sonuc
+            while len(onbellek) > self.kapasite:
+                onbellek.popitem(last=False)
+        self.iska += len(eksikler)
+        self.isabet += len(words) - len(eksikler)
+
+        sonuclar = []
+        for word in words:
+            # Kapasiteden büyük bir batch'te kelime, bu çağrıda eklenip atılmış olabilir
+            if word in onbellek:
+                onbellek.move_to_end(word)
+                sonuclar.append(onbellek[word])
+            else:
+                sonuclar.append(self.ic.analyze(word))
+        return sonuclar
+
+    def kapat(self):
+        self.ic.kapat()
+
+
+def arka_ucu_denetle(arka_uc: Optional[str] = None, varsayilan: str = 'jpype', jar_path: str = ZEMBEREK_PATH):
+    """
+    Arka ucun gereksinimlerini (kütüphane, JAR) analizciyi başlatmadan denetler.
+    İşçi süreçleri başlatılmadan önce ana süreçte çağrılır; eksik varsa ImportError/FileNotFoundError fırlatır.
+    """
+    secim = arka_uc or os.environ.get('DERLEM_MORFOLOJI') or varsayilan
+    if secim not in ARKA_UCLAR:
+        raise ValueError(f"Bilinmeyen morfoloji arka ucu: {secim} (geçerli: {', '.join(ARKA_UCLAR)})")
+    if secim in ('servis', 'oto') and servis_calisiyor_mu():
+        return
+    if secim == 'servis':
+        raise ConnectionError(f"Morfoloji servisi çalışmıyor: {SERVIS_SOKETI} (python morfoloji_servisi.py)")
+    if secim == 'oto':
+        secim = 'jpype'
+    modul = {'python': 'zemberek', 'jpype': 'jpype'}.get(secim)
+    if modul and importlib.util.find_spec(modul) is None:
+        raise ImportError(f"'{secim}' arka ucu için '{modul}' kütüphanesi kurulu değil.")
+    if secim == 'jpype' and not os.path.exists(jar_path):
+        raise FileNotFoundError(f"Zemberek JAR dosyası bulunamadı: {jar_path}")
+
+
+def analizci_olustur(arka_uc: Optional[str] = None, varsayilan: str = 'jpype', onbellek: int = 0,
+                     **kwargs) -> Analizci:
+    """
+    Yapılandırmaya göre bir analizci oluşturur.
+    arka_uc verilmezse DERLEM_MORFOLOJI ortam değişkenine, o da yoksa varsayilan'a bakılır.
+    kwargs, JPypeAnalizci'ye (jar_path, jvm_args, thread_sayisi) aktarılır.
+    'oto' için morfoloji servisi çalışıyorsa JVM başlatılmaz, ServisAnalizcisi döner
+    (kwargs yalnızca JVM başlatılırsa kullanılır); 'jpype' her zaman JVM başlatır.
+    """
+    secim = arka_uc or os.environ.get('DERLEM_MORFOLOJI') or varsayilan
+    if secim == 'oto':
+        secim = 'servis' if servis_calisiyor_mu() else 'jpype'
+    if secim == 'python':
+        analizci = ZemberekPythonAnalizci()
+    elif secim == 'servis':
+        analizci = ServisAnalizcisi()
+    elif secim == 'jpype':
+        analizci = JPypeAnalizci(**kwargs)
+    elif secim == 'bos':
+        analizci = BosAnalizci()
+    else:
+        raise ValueError(f"Bilinmeyen morfoloji arka ucu: {secim} (geçerli: {', '.join(ARKA_UCLAR)})")
+
+    if onbellek > 0:
+        analizci = OnbellekliAnalizci(analizci, onbellek)
+    return analizci
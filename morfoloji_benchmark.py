@@ -0,0 +1,137 @@
+# morfoloji_benchmark.py
+# Amaç: morfoloji.py arka uçlarının aynı kelime listesi üzerindeki hızını (kelime/sn) karşılaştırmak.
+#
+# Kullanım:
+#   python morfoloji_benchmark.py yeni_adaylar.txt
+#   python morfoloji_benchmark.py tr_lexicon.txt --limit 20000 --arka-uclar jpype python
+#   python morfoloji_benchmark.py tr_lexicon.txt --limit 200000 --yukleyici-modlari
+#     (data_loader.py 'havuz' ve 'tek_jvm' modlarının bellek ve hız karşılaştırması)
+#
+# Not: jpype arka ucu JVM'yi başlatır; JVM aynı süreçte kapatılıp yeniden açılamadığı için
+# her arka uç ayrı bir alt süreçte ölçülür.
+
+import argparse
+import multiprocessing as mp
+import time
+from typing import List
+
+import morfoloji
+
+BATCH_BOYUTU = 5000
+
+
+def kelimeleri_oku(dosya_yolu: str, limit: int) -> List[str]:
+    """Kelime listesini (satır başına bir kelime) okur."""
+    with open(dosya_yolu, 'r', encoding='utf-8') as f:
+        kelimeler = [line.strip() for line in f if line.strip()]
+    return kelimeler[:limit] if limit else kelimeler
+
+
+def arka_ucu_olc(arka_uc: str, kelimeler: List[str], onbellek: int, sonuc_kuyrugu):
+    """Bir arka ucu (alt süreçte) başlatır, kelime listesini iki tur analiz eder ve ölçümleri döndürür."""
+    try:
+        t0 = time.perf_counter()
+        analizci = morfoloji.analizci_olustur(arka_uc, onbellek=onbellek)
+        baslatma = time.perf_counter() - t0
+
+        turlar = []
+        taninan = 0
+        # İkinci tur, önbellekli arka uçlarda sıcak önbellek performansını gösterir
+        for _ in range(2):
+            t0 = time.perf_counter()
+            taninan = 0
+            for i in range(0, len(kelimeler), BATCH_BOYUTU):
+                sonuclar = analizci.analyze_batch(kelimeler[i:i + BATCH_BOYUTU])
+                taninan += sum(1 for s in sonuclar if s is not None and s[5] == 'zemberek')
+            turlar.append(time.perf_counter() - t0)
+
+        sonuc_kuyrugu.put((analizci.ad, baslatma, turlar, taninan, None))
+    except Exception as e:
+        sonuc_kuyrugu.put((arka_uc, 0.0, [], 0, f"{type(e).__name__}: {e}"))
+
+
+def yukleyici_modunu_olc(mod: str, kelimeler: List[str], num_processes: int, sonuc_kuyrugu):
+    """data_loader.AnalizMotoru'nu (alt süreçte) verilen modda çalıştırır; hız ve tepe belleği ölçer."""
+    import data_loader
+    try:
+        if mod == 'tek_jvm' or data_loader.MORFOLOJI_ARKA_UCU in ('jpype', 'oto'):
+            morfoloji.java_yardimcisini_derle(data_loader.ZEMBEREK_PATH)
+        t0 = time.perf_counter()
+        with data_loader.AnalizMotoru(mod, num_processes) as motor:
+            # İlk batch, işçilerin/JVM'nin hazır olmasını bekler (başlatma süresi)
+            motor.analiz_et(kelimeler[:num_processes])
+            baslatma = time.perf_counter() - t0
+            tepe_bellek = motor.bellek_mb()
+            t0 = time.perf_counter()
+            for i in range(0, len(kelimeler), BATCH_BOYUTU):
+                motor.analiz_et(kelimeler[i:i + BATCH_BOYUTU])
+                tepe_bellek = max(tepe_bellek, motor.bellek_mb())
+            sure = time.perf_counter() - t0
+        sonuc_kuyrugu.put((mod, baslatma, sure, tepe_bellek, None))
+    except Exception as e:
+        sonuc_kuyrugu.put((mod, 0.0, 0.0, 0.0, f"{type(e).__name__}: {e}"))
+
+
+def yukleyici_modlarini_karsilastir(kelimeler: List[str], num_processes: int):
+    """data_loader.py analiz modlarını aynı kelime listesi üzerinde karşılaştırır."""
+    import data_loader
+
+    sonuc_kuyrugu = mp.Queue()
+    satirlar = []
+    for mod in data_loader.ANALIZ_MODLARI:
+        p = mp.Process(target=yukleyici_modunu_olc, args=(mod, kelimeler, num_processes, sonuc_kuyrugu))
+        p.start()
+        satirlar.append(sonuc_kuyrugu.get())
+        p.join()
+
+    print(f"\n{'Mod':<10} {'Başlatma':>10} {'kelime/sn':>12} {'Tepe bellek':>14}")
+    for mod, baslatma, sure, tepe_bellek, hata in satirlar:
+        if hata:
+            print(f"{mod:<10} ÇALIŞTIRILAMADI: {hata}")
+            continue
+        hiz = len(kelimeler) / sure if sure > 0 else float('inf')
+        print(f"{mod:<10} {baslatma:>9.2f}s {hiz:>12,.0f} {tepe_bellek:>11,.0f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Morfoloji arka uçlarının hız karşılaştırması.")
+    parser.add_argument('kelime_dosyasi', nargs='?', default='yeni_adaylar.txt')
+    parser.add_argument('--limit', type=int, default=10000, help="Kullanılacak kelime sayısı (0: tümü)")
+    # 'oto', 'servis' ya da 'jpype' ile aynı ölçümü verir; varsayılan listede yer almaz
+    parser.add_argument('--arka-uclar', nargs='+', default=[a for a in morfoloji.ARKA_UCLAR if a != 'oto'],
+                        choices=morfoloji.ARKA_UCLAR)
+    parser.add_argument('--onbellek', type=int, default=0, help="LRU önbellek kapasitesi (0: kapalı)")
+    parser.add_argument('--yukleyici-modlari', action='store_true',
+                        help="Arka uçlar yerine data_loader.py analiz modlarını (havuz / tek_jvm) karşılaştır")
+    parser.add_argument('--islem-sayisi', type=int, default=min(mp.cpu_count(), 6),
+                        help="havuz modundaki işçi / tek_jvm modundaki iş parçacığı sayısı")
+    args = parser.parse_args()
+
+    kelimeler = kelimeleri_oku(args.kelime_dosyasi, args.limit)
+    if args.yukleyici_modlari:
+        print(f"--- data_loader Analiz Modu Karşılaştırması: {len(kelimeler):,} kelime, "
+              f"{args.islem_sayisi} işçi/iş parçacığı ---")
+        yukleyici_modlarini_karsilastir(kelimeler, args.islem_sayisi)
+        return
+
+    print(f"--- Morfoloji Arka Uç Karşılaştırması: {len(kelimeler):,} kelime ---")
+
+    sonuc_kuyrugu = mp.Queue()
+    satirlar = []
+    for arka_uc in args.arka_uclar:
+        p = mp.Process(target=arka_ucu_olc, args=(arka_uc, kelimeler, args.onbellek, sonuc_kuyrugu))
+        p.start()
+        satirlar.append(sonuc_kuyrugu.get())
+        p.join()
+
+    print(f"\n{'Arka uç':<20} {'Başlatma':>10} {'1. tur kel/sn':>15} {'2. tur kel/sn':>15} {'Tanınan':>10}")
+    for ad, baslatma, turlar, taninan, hata in satirlar:
+        if hata:
+            print(f"{ad:<20} ÇALIŞTIRILAMADI: {hata}")
+            continue
+        hizlar = [len(kelimeler) / t if t > 0 else float('inf') for t in turlar]
+        print(f"{ad:<20} {baslatma:>9.2f}s {hizlar[0]:>15,.0f} {hizlar[1]:>15,.0f} {taninan:>10,}")
+
+
+if __name__ == '__main__':
+    main()
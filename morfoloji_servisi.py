@@ -0,0 +1,125 @@
+# morfoloji_servisi.py
+# Amaç: JVM'yi ve Zemberek'i sürekli sıcak tutan yerel morfoloji analiz servisi.
+# mini_loader.py, data_loader.py ve yeni_kelime_tara.py ('oto' veya 'servis' arka ucuyla) bu servis
+# çalışıyorsa JVM başlatmak yerine analizleri servise yaptırır (bkz. morfoloji.ServisAnalizcisi).
+#
+# Kullanım:
+#   python morfoloji_servisi.py                 (arka planda bırakın: ... &)
+#   python morfoloji_servisi.py --thread 8 --onbellek 500000
+#
+# Protokol (Unix soketi, morfoloji.SERVIS_SOKETI):
+#   İstek : 4 bayt uzunluk + '\n' ile ayrılmış kelimeler (UTF-8)
+#   Yanıt : 4 bayt uzunluk + kelime başına bir paketlenmiş sonuç satırı (morfoloji.sonuclari_paketle)
+#   Boş istek "ping"dir ve boş yanıt alır.
+
+import argparse
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+from multiprocessing import cpu_count
+
+import morfoloji
+
+ZEMBEREK_PATH = os.path.abspath('zemberek-full.jar')
+# Tek JVM tüm istemcilere hizmet eder
+JVM_ARGUMANLARI = ('-ea', '-Xmx4g')
+
+
+class MorfolojiIstegi(socketserver.BaseRequestHandler):
+    """Bir istemci bağlantısı: bağlantı kapanana kadar çerçeve çerçeve istek işler."""
+
+    def handle(self):
+        sunucu = self.server
+        while True:
+            try:
+                istek = morfoloji.cerceve_al(self.request)
+            except OSError:
+                return
+            if istek is None:
+                return
+            if not istek:
+                morfoloji.cerceve_gonder(self.request, b'')
+                continue
+
+            words = istek.decode('utf-8').split('\n')
+            t0 = time.perf_counter()
+            # Analizci (ve önbelleği) tek kilitle korunur; paralellik Java iş parçacıklarındadır.
+            with sunucu.kilit:
+                sonuclar = sunucu.analizci.analyze_batch(words)
+            sunucu.istatistik_ekle(len(words), time.perf_counter() - t0)
+            morfoloji.cerceve_gonder(self.request, morfoloji.sonuclari_paketle(sonuclar).encode('utf-8'))
+
+
+class MorfolojiSunucusu(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, soket_yolu: str, analizci: morfoloji.Analizci):
+        self.analizci = analizci
+        self.kilit = threading.Lock()
+        self.toplam_kelime = 0
+        self.toplam_sure = 0.0
+        super().__init__(soket_yolu, MorfolojiIstegi)
+
+    def istatistik_ekle(self, kelime_sayisi: int, sure: float):
+        self.toplam_kelime += kelime_sayisi
+        self.toplam_sure += sure
+
+
+def analizci_hazirla(arka_uc: str, thread_sayisi: int, onbellek: int) -> morfoloji.Analizci:
+    """Servisin kendi analizcisini başlatır (servisin kendisine bağlanmaması için doğrudan)."""
+    if arka_uc == 'jpype':
+        morfoloji.java_yardimcisini_derle(ZEMBEREK_PATH)
+        analizci = morfoloji.JPypeAnalizci(ZEMBEREK_PATH, JVM_ARGUMANLARI, thread_sayisi=thread_sayisi)
+        if onbellek > 0:
+            analizci = morfoloji.OnbellekliAnalizci(analizci, onbellek)
+        return analizci
+    return morfoloji.analizci_olustur(arka_uc, onbellek=onbellek)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sıcak Zemberek ile yerel morfoloji analiz servisi.")
+    parser.add_argument('--soket', default=morfoloji.SERVIS_SOKETI)
+    parser.add_argument('--arka-uc', default='jpype', choices=('jpype', 'python', 'bos'))
+    parser.add_argument('--thread', type=int, default=cpu_count(), help="Java analiz iş parçacığı sayısı")
+    parser.add_argument('--onbellek', type=int, default=0, help="LRU önbellek kapasitesi (0: kapalı)")
+    args = parser.parse_args()
+
+    if morfoloji.servis_calisiyor_mu(args.soket):
+        print(f"HATA: {args.soket} üzerinde zaten çalışan bir servis var.", file=sys.stderr)
+        sys.exit(1)
+    if os.path.exists(args.soket):
+        # Önceki çalışmadan kalmış, yanıt vermeyen soket dosyası
+        os.remove(args.soket)
+
+    t0 = time.time()
+    print(f"-> Morfoloji arka ucu ({args.arka_uc}) başlatılıyor...")
+    try:
+        analizci = analizci_hazirla(args.arka_uc, args.thread, args.onbellek)
+    except Exception as e:
+        print(f"KRİTİK HATA: Analizci başlatılamadı: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"-> {analizci.ad} hazır ({time.time() - t0:.1f} sn).")
+
+    sunucu = MorfolojiSunucusu(args.soket, analizci)
+    # SIGTERM ile de düzgün kapan (soket dosyası silinsin)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=sunucu.shutdown).start())
+    print(f"-> Servis dinliyor: {args.soket} (Durdurmak için Ctrl+C)")
+    try:
+        sunucu.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sunucu.server_close()
+        if os.path.exists(args.soket):
+            os.remove(args.soket)
+        if sunucu.toplam_sure > 0:
+            print(f"\n-> Toplam {sunucu.toplam_kelime:,} kelime analiz edildi "
+                  f"({sunucu.toplam_kelime / sunucu.toplam_sure:,.0f} kelime/sn).")
+        analizci.kapat()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,693 @@
+# oneri_motoru.py
+# Amaç: Sözlükte bulunmayan bir kelimeye (yeni_kelime_tara.py'nin OLASI adayları, kullanıcı
+# sorguları) en yakın bilinen kelimeleri hızla bulmak (yazım önerisi, SymSpell yöntemi).
+# 2 milyonluk bir kelime listesinde her sorguda düzenleme uzaklığı hesaplamak Python'da çok
+# yavaştır; bunun yerine kelimelerin "silme" biçimleri önceden indekslenir ve sorguda yalnızca
+# indeksin gösterdiği birkaç kelime grubunun uzaklığı hesaplanır.
+#
+# Kullanım:
+#   python oneri_motoru.py olustur --db lexicon.db -o kelimeler.oneri
+#   python oneri_motoru.py olustur --db lexicon.db --frekans yeni_kesin_turkce_adaylari_frekans.tsv -o kelimeler.oneri
+#   python oneri_motoru.py olustur kelimeler.txt -o kelimeler.oneri
+#   python oneri_motoru.py oner kelimeler.oneri kitablar cicek gozluk --mesafe 2
+#   python oneri_motoru.py toplu kelimeler.oneri yeni_olasi_turkce_adaylari.txt -o oneriler.tsv
+#   python oneri_motoru.py bilgi kelimeler.oneri
+#   python oneri_motoru.py olc kelimeler.oneri
+#
+# Yöntem:
+#   - Karşılaştırma Türkçe küçük harfle yapılır. İndeks anahtarı kelimenin ASCII'ye indirilmiş
+#     (turkce.asciye_katla: ç -> c, ı -> i, ğ -> g ...) ilk ONEK_UZUNLUGU harfidir; aynı anahtarlı
+#     kelimeler bir grup oluşturur.
+#   - Her grup anahtarından EN_FAZLA_MESAFE harf silinerek elde edilen biçimler indekslenir
+#     (ONEK_UZUNLUGU'ndan kısa anahtarlarda 0..EN_FAZLA_MESAFE silme). Sorguda aynı işlem sorgunun
+#     anahtarına uygulanır; ortak silme biçimi olan gruplar aday olur. İki kelimenin uzaklığı <= m
+#     ise önekleri de her iki taraftan en çok m silmeyle eşitlenir, dolayısıyla bu yöntem hiçbir
+#     sonucu kaçırmaz.
+#   - Önek uzunluğu hız ile dosya boyutu arasındaki dengedir: uzun önek grupları küçültür (daha az
+#     aday) ama indeks kaydı sayısını artırır (bkz. olustur --onek, olc).
+#   - Aday kelimelerin uzaklığı Damerau-Levenshtein (bitişik harf yer değiştirmesi dahil) ile
+#     hesaplanır; Türkçe harfin ASCII karşılığıyla yer değiştirmesi (c/ç, g/ğ, i/ı, o/ö, s/ş,
+#     u/ü, a/â ...) BENZER_HARF_MALIYETI sayılır: 'cicek' -> 'çiçek' uzaklığı 1.0'dır.
+#   - Sonuçlar uzaklığa, sonra frekansa (varsa) göre sıralanır.
+#
+# Dosya yapısı (.oneri, tüm tamsayılar little-endian uint32):
+#   [SIHIRLI_BAYTLAR][başlık] [kova başlangıçları] [indeks kayıtları] [grup bayt ofsetleri]
+#   [grup ilk kelime no'ları] [kelime imzaları] [frekanslar] [kelimeler]
+#   - Silme biçiminin crc32 değerinin alt bitleri kovayı seçer; kayıt = (crc32'nin üst 8 biti << 24) | grup no.
+#     Üst 8 bit aynı kovaya düşen başka silme biçimlerinin gruplarını büyük ölçüde eler.
+#   - Kelime imzası: ASCII'ye indirilmiş kelimede geçen harflerin bit maskesi (a-z, diğerleri tek bit)
+#     ve uzunluk. Uzaklığı <= m olan iki kelimenin uzunluk farkı ve yalnızca birinde geçen harf
+#     sayısı en çok m'dir; bu koşulu sağlamayan adaylar metin çözülmeden ve uzaklık hesaplanmadan elenir.
+#   - Kelimeler grup sırasıyla, her biri '\n' ile biten UTF-8 satırlar olarak saklanır:
+#     küçük harfli hali<TAB>ASCII hali (küçük harfliyle aynıysa boş)[<TAB>özgün hali (farklıysa)].
+#     Sorguda Türkçe küçültme/ASCII'ye indirme (str.translate) adaylar için tekrarlanmaz.
+
+import argparse
+import array
+import heapq
+import math
+import mmap
+import os
+import random
+import sqlite3
+import struct
+import sys
+import time
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import sozluk_paketi
+import turkce
+
+# --- KONFİGÜRASYON ---
+DATABASE_NAME = 'lexicon.db'
+SIHIRLI_BAYTLAR = b'DRLMONR1'
+SURUM = 1
+UZANTI = '.oneri'
+ONEK_UZUNLUGU = 13
+EN_FAZLA_MESAFE = 2
+BENZER_HARF_MALIYETI = 0.5
+ONERI_LIMITI = 10
+# Kova başına ortalama kayıt sayısı (kova dizisi boyutu ile taranan kayıt sayısı arasındaki denge)
+KOVA_DOLULUGU = 8
+# Grup no'su kaydın alt 24 bitinde tutulur
+EN_FAZLA_GRUP = 1 << 24
+EN_BUYUK_FREKANS = 0xFFFFFFFF
+# İmzada uzunluk üst 5 bitte tutulur (daha uzun kelimeler bu değere kırpılır)
+IMZA_UZUNLUK_KAYDIRMA = 27
+IMZA_EN_BUYUK_UZUNLUK = 31
+
+# Başlık: sürüm, önek uzunluğu, en fazla mesafe, kova sayısı, kayıt sayısı, grup sayısı, kelime sayısı
+BASLIK = struct.Struct('<IIIIQQQ')
+VERI_BASI = len(SIHIRLI_BAYTLAR) + BASLIK.size
+
+Oneri = Tuple[str, float, int]  # (kelime, uzaklık, frekans)
+
+
+# --- UZAKLIK ---
+
+def _uzaklik(a: str, fa: str, b: str, fb: str, sinir: float) -> float:
+    """
+    a ile b (Türkçe küçük harfli) arasındaki ağırlıklı Damerau-Levenshtein (OSA) uzaklığı;
+    fa/fb ASCII'ye indirilmiş halleridir. Uzaklık sinir'i aşarsa math.inf döner.
+    Tablo (DP) yerine sınırlı arama yapılır: ilk farklı harfte değiştirme/silme/ekleme/yer
+    değiştirme denenir ve kalan bütçeyle devam edilir. Sinir küçük (<= 2) olduğundan dallanma azdır
+    ve karşılaştırmaların çoğu C hızındaki dizgi eşitliğiyle biter.
+    """
+    if a == b:
+        return 0
+    la, lb = len(a), len(b)
+    if abs(la - lb) > sinir:
+        return math.inf
+    if sinir < 1:
+        # Yalnızca benzer harf (c/ç, ı/i ...) değişimleri yapılabilir
+        if la != lb or fa != fb:
+            return math.inf
+        maliyet = sum(x != y for x, y in zip(a, b)) * BENZER_HARF_MALIYETI
+        return maliyet if maliyet <= sinir else math.inf
+    n = min(la, lb)
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    if i == n:
+        return abs(la - lb)
+    j = i + 1
+    maliyet = BENZER_HARF_MALIYETI if fa[i] == fb[i] else 1
+    kalan = sinir - 1
+    if kalan < BENZER_HARF_MALIYETI:
+        # Tek düzenlemeden sonra kalan bütçe yalnızca birebir eşitliğe yeter: alt aramalar yerine
+        # dizgi karşılaştırması yapılır
+        if maliyet < 1:
+            en_iyi = maliyet + _uzaklik(a[j:], fa[j:], b[j:], fb[j:], sinir - maliyet)
+            if en_iyi <= maliyet:
+                return en_iyi
+        elif a[j:] == b[j:]:
+            return 1
+        else:
+            en_iyi = math.inf
+        if (a[j:] == b[i:] or a[i:] == b[j:]
+                or (j < n and a[i] == b[j] and a[j] == b[i] and a[j + 1:] == b[j + 1:])):
+            return 1
+        return en_iyi if en_iyi <= sinir else math.inf
+    en_iyi = maliyet + _uzaklik(a[j:], fa[j:], b[j:], fb[j:], sinir - maliyet)
+    if en_iyi <= maliyet:
+        return en_iyi
+    d = 1 + _uzaklik(a[j:], fa[j:], b[i:], fb[i:], kalan)  # a[i] silinir
+    if d < en_iyi:
+        en_iyi = d
+    d = 1 + _uzaklik(a[i:], fa[i:], b[j:], fb[j:], kalan)  # b[i] eklenir
+    if d < en_iyi:
+        en_iyi = d
+    # Bitişik iki harfin yer değiştirmesi (kitpa -> kitap)
+    if j < n and a[i] == b[j] and a[j] == b[i]:
+        d = 1 + _uzaklik(a[j + 1:], fa[j + 1:], b[j + 1:], fb[j + 1:], kalan)
+        if d < en_iyi:
+            en_iyi = d
+    return en_iyi if en_iyi <= sinir else math.inf
+
+
+def uzaklik(a: str, b: str, sinir: float = math.inf) -> float:
+    """
+    Türkçe ağırlıklı düzenleme uzaklığı (büyük/küçük harf farkı gözetilmez):
+    uzaklik('cicek', 'çiçek') -> 1.0, uzaklik('kitpa', 'kitap') -> 1.
+    Uzaklık sinir'i aşarsa math.inf döner.
+    """
+    a, b = turkce.kucult(a), turkce.kucult(b)
+    return _uzaklik(a, turkce.asciye_katla(a), b, turkce.asciye_katla(b), sinir)
+
+
+# --- İNDEKS ---
+
+def imza(katlanmis: str) -> int:
+    """ASCII'ye indirilmiş kelimenin imzası: geçen harflerin bit maskesi | (uzunluk << 27)."""
+    maske = 0
+    for harf in katlanmis:
+        kod = ord(harf) - 97
+        maske |= 1 << (kod if 0 <= kod < 26 else 26)
+    return maske | min(len(katlanmis), IMZA_EN_BUYUK_UZUNLUK) << IMZA_UZUNLUK_KAYDIRMA
+
+
+def anahtar(kelime: str, onek_uzunlugu: int = ONEK_UZUNLUGU) -> str:
+    """Kelimenin indeks anahtarı: ASCII'ye indirilmiş ilk onek_uzunlugu harfi."""
+    return turkce.asciye_katla(kelime[:onek_uzunlugu])[:onek_uzunlugu]
+
+
+def silmeler(metin: str, mesafe: int) -> Set[str]:
+    """metin'den en çok mesafe harf silinerek elde edilen tüm biçimler (metin dahil)."""
+    sonuc = {metin}
+    katman = {metin}
+    for _ in range(mesafe):
+        katman = {s[:i] + s[i + 1:] for s in katman for i in range(len(s))}
+        sonuc |= katman
+    return sonuc
+
+
+def anahtar_silmeleri(a: str, onek_uzunlugu: int, mesafe: int) -> Set[str]:
+    """
+    İndekslenen/sorgulanan silme biçimleri. Tam uzunluktaki (onek_uzunlugu harfli) iki anahtarın
+    ortak bir silme biçimi varsa, ikisinden aynı harfler silinerek tam mesafe derinlikte de ortak
+    biçim bulunur; bu yüzden tam anahtarlar için yalnızca son katman yeterlidir. Kısa anahtarlar
+    (kısa kelimeler) farklı uzunluktaki anahtarlarla eşleşebildiğinden tüm katmanları kullanır.
+    """
+    if len(a) < onek_uzunlugu:
+        return silmeler(a, mesafe)
+    katman = {a}
+    for _ in range(min(mesafe, len(a))):
+        katman = {s[:i] + s[i + 1:] for s in katman for i in range(len(s))}
+    return katman
+
+
+def _silme_sayisi_ust_siniri(uzunluk: int, onek_uzunlugu: int, mesafe: int) -> int:
+    if uzunluk >= onek_uzunlugu:
+        return math.comb(uzunluk, min(mesafe, uzunluk))
+    return sum(math.comb(uzunluk, k) for k in range(min(mesafe, uzunluk) + 1))
+
+
+def _diziyi_yaz(f, dizi: array.array):
+    if sys.byteorder != 'little':
+        dizi = array.array('I', dizi)
+        dizi.byteswap()
+    dizi.tofile(f)
+
+
+def indeks_olustur(kelimeler: Iterable[str], oneri_path: str, frekanslar: Optional[Dict[str, int]] = None,
+                   onek_uzunlugu: int = ONEK_UZUNLUGU, en_fazla_mesafe: int = EN_FAZLA_MESAFE) -> Tuple[int, int, int]:
+    """
+    Kelimelerden .oneri dosyası oluşturur. (kelime, grup, kayıt) sayılarını döndürür.
+    frekanslar: kelime -> frekans (eksik kelimelerin frekansı 0).
+    """
+    frekanslar = frekanslar or {}
+    gruplar: Dict[str, List[str]] = {}
+    for kelime in kelimeler:
+        if not kelime or '\t' in kelime or '\n' in kelime:
+            continue
+        gruplar.setdefault(anahtar(turkce.kucult(kelime), onek_uzunlugu), []).append(kelime)
+    anahtarlar = sorted(gruplar)
+    if len(anahtarlar) > EN_FAZLA_GRUP:
+        raise ValueError(f"Grup sayısı ({len(anahtarlar):,}) {EN_FAZLA_GRUP:,} sınırını aşıyor; "
+                         f"önek uzunluğunu kısaltın.")
+
+    # Kova sayısı: ikinin kuvveti, alt 24 bit ile sınırlı (üst 8 bit kayıtta süzgeç olarak kullanılır)
+    tahmin = sum(_silme_sayisi_ust_siniri(len(a), onek_uzunlugu, en_fazla_mesafe) for a in anahtarlar)
+    kova_sayisi = 1
+    while kova_sayisi * KOVA_DOLULUGU < tahmin and kova_sayisi < EN_FAZLA_GRUP:
+        kova_sayisi <<= 1
+    maske = kova_sayisi - 1
+
+    # 1. geçiş: her kaydın kovası ve değeri; kova başına kayıt sayısı
+    kovalar = array.array('I')
+    degerler = array.array('I')
+    sayilar = array.array('I', bytes(4 * (kova_sayisi + 1)))
+    for grup_no, a in enumerate(anahtarlar):
+        for silme in anahtar_silmeleri(a, onek_uzunlugu, en_fazla_mesafe):
+            h = zlib.crc32(silme.encode('utf-8'))
+            kova = h & maske
+            kovalar.append(kova)
+            degerler.append((h >> 24) << 24 | grup_no)
+            sayilar[kova + 1] += 1
+
+    # 2. geçiş: kayıtları kovalarına yerleştir (sayma sıralaması)
+    for i in range(1, kova_sayisi + 1):
+        sayilar[i] += sayilar[i - 1]
+    baslangiclar = array.array('I', sayilar)
+    kayitlar = array.array('I', bytes(4 * len(degerler)))
+    konumlar = sayilar
+    for kova, deger in zip(kovalar, degerler):
+        k = konumlar[kova]
+        kayitlar[k] = deger
+        konumlar[kova] = k + 1
+    del kovalar, degerler, konumlar, sayilar
+
+    grup_ofsetleri = array.array('I', [0])
+    grup_ilkleri = array.array('I', [0])
+    imzalar = array.array('I')
+    frekans_dizisi = array.array('I')
+    metin = bytearray()
+    for a in anahtarlar:
+        for kelime in gruplar[a]:
+            kucuk = turkce.kucult(kelime)
+            ascii_hali = turkce.asciye_katla(kucuk)
+            satir = kucuk + '\t' + (ascii_hali if ascii_hali != kucuk else '')
+            if kelime != kucuk:
+                satir += '\t' + kelime
+            metin += satir.encode('utf-8') + b'\n'
+            imzalar.append(imza(ascii_hali))
+            frekans_dizisi.append(min(frekanslar.get(kelime, 0), EN_BUYUK_FREKANS))
+        if len(metin) > 0xFFFFFFFF:
+            raise ValueError("Kelime metni 4 GB sınırını aşıyor.")
+        grup_ofsetleri.append(len(metin))
+        grup_ilkleri.append(len(frekans_dizisi))
+
+    # Yarım kalan dosya asıl adı almasın: geçici adla yaz, atomik olarak taşı
+    gecici = oneri_path + '.tmp'
+    try:
+        with open(gecici, 'wb') as f:
+            f.write(SIHIRLI_BAYTLAR + BASLIK.pack(SURUM, onek_uzunlugu, en_fazla_mesafe, kova_sayisi,
+                                                  len(kayitlar), len(anahtarlar), len(frekans_dizisi)))
+            for dizi in (baslangiclar, kayitlar, grup_ofsetleri, grup_ilkleri, imzalar, frekans_dizisi):
+                _diziyi_yaz(f, dizi)
+            f.write(metin)
+        os.replace(gecici, oneri_path)
+    except BaseException:
+        if os.path.exists(gecici):
+            os.remove(gecici)
+        raise
+    return len(frekans_dizisi), len(anahtarlar), len(kayitlar)
+
+
+def _satiri_coz(satir: str) -> Tuple[str, str, str]:
+    """Kelime satırından (özgün, küçük harfli, ASCII'ye indirilmiş) halleri."""
+    parcalar = satir.split('\t')
+    kucuk = parcalar[0]
+    return (parcalar[2] if len(parcalar) > 2 else kucuk), kucuk, parcalar[1] or kucuk
+
+
+class OneriMotoru:
+    """
+    .oneri dosyasını mmap ile okur ve yazım önerisi üretir.
+        motor = OneriMotoru('kelimeler.oneri')
+        motor.oner('kitablar')                  -> [('kitaplar', 1, 0), ...]
+        motor.toplu_oner(['cicek', 'gozluk'])   -> {'cicek': [...], 'gozluk': [...]}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, 'rb')
+        self._gorunumler = []
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._f.close()
+            raise ValueError(f"{path} boş bir dosya.")
+        if self._mm[:len(SIHIRLI_BAYTLAR)] != SIHIRLI_BAYTLAR or len(self._mm) < VERI_BASI:
+            self.kapat()
+            raise ValueError(f"{path} bir öneri indeksi (.oneri) dosyası değil.")
+        (surum, self.onek_uzunlugu, self.en_fazla_mesafe, self.kova_sayisi,
+         self.kayit_sayisi, self.grup_sayisi, self.kelime_sayisi) = BASLIK.unpack_from(self._mm, len(SIHIRLI_BAYTLAR))
+        if surum != SURUM:
+            self.kapat()
+            raise ValueError(f"{path} desteklenmeyen sürümde (dosya: {surum}, beklenen: {SURUM}).")
+        konum = VERI_BASI
+        diziler = []
+        for uzunluk in (self.kova_sayisi + 1, self.kayit_sayisi, self.grup_sayisi + 1,
+                        self.grup_sayisi + 1, self.kelime_sayisi, self.kelime_sayisi):
+            diziler.append(self._dizi(konum, uzunluk))
+            konum += 4 * uzunluk
+        (self._kovalar, self._kayitlar, self._grup_ofsetleri, self._grup_ilkleri,
+         self._imzalar, self._frekanslar) = diziler
+        self._metin_basi = konum
+        if konum > len(self._mm) or konum + self._grup_ofsetleri[-1] != len(self._mm):
+            self.kapat()
+            raise ValueError(f"{path} eksik yazılmış (bölüm boyutları tutmuyor).")
+        self._maske = self.kova_sayisi - 1
+
+    def _dizi(self, konum: int, uzunluk: int):
+        if konum + 4 * uzunluk > len(self._mm):
+            return array.array('I', [0])
+        if sys.byteorder == 'little':
+            gorunum = memoryview(self._mm)[konum:konum + 4 * uzunluk]
+            self._gorunumler.append(gorunum)
+            dizi = gorunum.cast('I')
+            self._gorunumler.append(dizi)
+            return dizi
+        dizi = array.array('I', self._mm[konum:konum + 4 * uzunluk])
+        dizi.byteswap()
+        return dizi
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.kapat()
+        return False
+
+    def kapat(self):
+        # mmap, üzerindeki memoryview'lar bırakılmadan kapatılamaz
+        for gorunum in reversed(self._gorunumler):
+            gorunum.release()
+        self._gorunumler = []
+        if getattr(self, '_mm', None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._f.close()
+
+    def __len__(self):
+        return self.kelime_sayisi
+
+    def _grup_metni(self, grup_no: int) -> str:
+        bas = self._metin_basi + self._grup_ofsetleri[grup_no]
+        son = self._metin_basi + self._grup_ofsetleri[grup_no + 1]
+        return self._mm[bas:son].decode('utf-8')
+
+    def _grup_satirlari(self, grup_no: int) -> List[str]:
+        return self._grup_metni(grup_no).split('\n')
+
+    def _grup(self, grup_no: int) -> List[str]:
+        """Grubun kelimeleri (özgün halleriyle)."""
+        return [_satiri_coz(satir)[0] for satir in self._grup_satirlari(grup_no)[:-1]]
+
+    def _aday_gruplar(self, sorgu_anahtari: str) -> Set[int]:
+        kovalar, kayitlar, maske = self._kovalar, self._kayitlar, self._maske
+        gruplar = set()
+        for silme in anahtar_silmeleri(sorgu_anahtari, self.onek_uzunlugu, self.en_fazla_mesafe):
+            h = zlib.crc32(silme.encode('utf-8'))
+            kova = h & maske
+            parmak_izi = h >> 24
+            for kayit in kayitlar[kovalar[kova]:kovalar[kova + 1]]:
+                if kayit >> 24 == parmak_izi:
+                    gruplar.add(kayit & 0xFFFFFF)
+        return gruplar
+
+    def _oner(self, kelime: str, mesafe: float, limit: Optional[int],
+              grup_onbellegi: Optional[Dict[int, List[str]]] = None) -> List[Oneri]:
+        if mesafe > self.en_fazla_mesafe:
+            raise ValueError(f"Mesafe en çok {self.en_fazla_mesafe} olabilir (indeks bu mesafeyle oluşturuldu).")
+        sorgu = turkce.kucult(kelime)
+        sorgu_ascii = turkce.asciye_katla(sorgu)
+        sorgu_imzasi = imza(sorgu_ascii)
+        sorgu_maskesi = sorgu_imzasi & ((1 << IMZA_UZUNLUK_KAYDIRMA) - 1)
+        sorgu_uzunlugu = sorgu_imzasi >> IMZA_UZUNLUK_KAYDIRMA
+        imzalar, grup_ilkleri = self._imzalar, self._grup_ilkleri
+        sonuclar = []
+        # limit verildiğinde, bulunan en iyi limit sonucun en büyük uzaklığından daha uzak adaylar
+        # listeye giremez: arama bütçesi bu değere indirilir (en_iyiler: eksi uzaklıklarla yığın)
+        butce = mesafe
+        tam_mesafe = math.floor(butce)
+        en_iyiler: List[float] = []
+        for grup_no in self._aday_gruplar(sorgu_ascii[:self.onek_uzunlugu]):
+            ilk = grup_ilkleri[grup_no]
+            # İmza süzgeci: uzunluk farkı ve yalnızca birinde geçen harf sayısı en çok tam_mesafe
+            gecenler = []
+            for i, aday_imzasi in enumerate(imzalar[ilk:grup_ilkleri[grup_no + 1]]):
+                if abs((aday_imzasi >> IMZA_UZUNLUK_KAYDIRMA) - sorgu_uzunlugu) > tam_mesafe:
+                    continue
+                aday_maskesi = aday_imzasi & ((1 << IMZA_UZUNLUK_KAYDIRMA) - 1)
+                if ((sorgu_maskesi & ~aday_maskesi).bit_count() > tam_mesafe
+                        or (aday_maskesi & ~sorgu_maskesi).bit_count() > tam_mesafe):
+                    continue
+                gecenler.append(i)
+            if not gecenler:
+                continue
+            if grup_onbellegi is None:
+                satirlar = self._grup_satirlari(grup_no)
+            else:
+                satirlar = grup_onbellegi.get(grup_no)
+                if satirlar is None:
+                    satirlar = grup_onbellegi[grup_no] = self._grup_satirlari(grup_no)
+            for i in gecenler:
+                aday, aday_kucuk, aday_ascii = _satiri_coz(satirlar[i])
+                d = _uzaklik(sorgu, sorgu_ascii, aday_kucuk, aday_ascii, butce)
+                if d > butce:
+                    continue
+                sonuclar.append((aday, float(d), self._frekanslar[ilk + i]))
+                if limit is not None:
+                    if len(en_iyiler) < limit:
+                        heapq.heappush(en_iyiler, -d)
+                    elif d < -en_iyiler[0]:
+                        heapq.heapreplace(en_iyiler, -d)
+                    if len(en_iyiler) == limit:
+                        butce = -en_iyiler[0]
+                        tam_mesafe = math.floor(butce)
+        sirala = lambda o: (o[1], -o[2], turkce.sirala_anahtari(o[0]))
+        if limit is not None and len(sonuclar) > limit:
+            return heapq.nsmallest(limit, sonuclar, key=sirala)
+        return sorted(sonuclar, key=sirala)
+
+    def oner(self, kelime: str, mesafe: float = EN_FAZLA_MESAFE, limit: Optional[int] = ONERI_LIMITI) -> List[Oneri]:
+        """
+        kelime'ye uzaklığı en çok mesafe olan kelimeler: (kelime, uzaklık, frekans) listesi,
+        uzaklığa, sonra frekansa göre sıralı. Kelimenin kendisi sözlükteyse uzaklığı 0'dır.
+        """
+        return self._oner(kelime, mesafe, limit)
+
+    def toplu_oner(self, kelimeler: Iterable[str], mesafe: float = EN_FAZLA_MESAFE,
+                   limit: Optional[int] = ONERI_LIMITI) -> Dict[str, List[Oneri]]:
+        """
+        Birden çok kelime için oner(). Tekrarlanan kelimeler bir kez sorgulanır; sorgular
+        anahtar sırasıyla işlenir, böylece ortak öneki olan kelimeler çözülmüş grupları paylaşır.
+        """
+        tekiller = sorted(set(kelimeler), key=lambda k: turkce.asciye_katla(k))
+        onbellek: Dict[int, List[str]] = {}
+        sonuc = {}
+        onceki_anahtar = None
+        for kelime in tekiller:
+            a = anahtar(turkce.kucult(kelime), self.onek_uzunlugu)
+            if a[:3] != onceki_anahtar:
+                # Grup önbelleği yalnızca yakın anahtarlar arasında paylaşılır (bellek sınırlı kalsın)
+                onbellek.clear()
+                onceki_anahtar = a[:3]
+            sonuc[kelime] = self._oner(kelime, mesafe, limit, onbellek)
+        return sonuc
+
+    def __iter__(self) -> Iterator[str]:
+        for grup_no in range(self.grup_sayisi):
+            yield from self._grup(grup_no)
+
+
+# --- KAYNAKLAR ---
+
+def frekanslari_oku(paths: Sequence[str]) -> Dict[str, int]:
+    """'kelime<TAB>frekans' satırları (yeni_kelime_tara.py'nin *_frekans.tsv çıktıları); frekanslar toplanır."""
+    frekanslar: Dict[str, int] = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for satir in f:
+                parcalar = satir.rstrip('\n').split('\t')
+                if len(parcalar) < 2 or not parcalar[0]:
+                    continue
+                try:
+                    frekans = int(parcalar[1])
+                except ValueError:
+                    continue  # başlık satırı vb.
+                frekanslar[parcalar[0]] = frekanslar.get(parcalar[0], 0) + frekans
+    return frekanslar
+
+
+def metin_kelimeleri(paths: Sequence[str]) -> Dict[str, int]:
+    """
+    Satır başına bir kelime içeren dosyalardaki tekil kelimeler. 'kelime<TAB>frekans' satırlarında
+    frekans da okunur. Dönüş: kelime -> frekans (frekanssız satırlar için 0).
+    """
+    kelimeler: Dict[str, int] = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for satir in f:
+                parcalar = satir.strip().split('\t')
+                if not parcalar[0]:
+                    continue
+                frekans = int(parcalar[1]) if len(parcalar) > 1 and parcalar[1].isdigit() else 0
+                kelimeler[parcalar[0]] = kelimeler.get(parcalar[0], 0) + frekans
+    return kelimeler
+
+
+# --- ÖLÇÜM ---
+
+def _boz(kelime: str, mesafe: int, rnd: random.Random) -> str:
+    """Kelimeye rastgele mesafe düzenleme (değiştirme, silme, ekleme, yer değiştirme) uygular."""
+    for _ in range(mesafe):
+        islem = rnd.randrange(4)
+        i = rnd.randrange(len(kelime) + (islem == 2)) if kelime else 0
+        if islem == 0 and kelime:
+            kelime = kelime[:i] + rnd.choice(turkce.ALFABE) + kelime[i + 1:]
+        elif islem == 1 and len(kelime) > 1:
+            kelime = kelime[:i] + kelime[i + 1:]
+        elif islem == 3 and i + 1 < len(kelime):
+            kelime = kelime[:i] + kelime[i + 1] + kelime[i] + kelime[i + 2:]
+        else:
+            kelime = kelime[:i] + rnd.choice(turkce.ALFABE) + kelime[i:]
+    return kelime
+
+
+def olc(motor: OneriMotoru, n: int = 2000, mesafe: int = EN_FAZLA_MESAFE, limit: Optional[int] = ONERI_LIMITI,
+        tohum: int = 42) -> Dict[str, float]:
+    """
+    Rastgele n kelime, 1..mesafe düzenlemeyle bozulup sorgulanır. Ortalama/p50/p99 sorgu süresi (µs),
+    toplu_oner'in sorgu başına süresi ve özgün kelimenin (uzaklığı mesafe içinde kalıyorsa)
+    sınırsız öneri listesinde bulunma oranı (indeks tamlığı, 1.0 olmalı) döner.
+    """
+    rnd = random.Random(tohum)
+    ornekler = []
+    for _ in range(n):
+        grup = motor._grup(rnd.randrange(motor.grup_sayisi))
+        kelime = rnd.choice(grup)
+        ornekler.append((kelime, _boz(kelime, rnd.randint(1, mesafe), rnd)))
+    sureler = []
+    for _, bozuk in ornekler:
+        t0 = time.perf_counter()
+        motor.oner(bozuk, mesafe, limit)
+        sureler.append(time.perf_counter() - t0)
+    sureler.sort()
+    t0 = time.perf_counter()
+    motor.toplu_oner([bozuk for _, bozuk in ornekler], mesafe, limit)
+    toplu = time.perf_counter() - t0
+    # İki rastgele düzenleme (ör. yer değiştirilen harflerden birinin silinmesi) uzaklığı mesafeyi aşabilir
+    kapsanan = [(kelime, bozuk) for kelime, bozuk in ornekler if uzaklik(kelime, bozuk, mesafe) <= mesafe]
+    bulunan = sum(any(o[0] == kelime for o in motor.oner(bozuk, mesafe, limit=None)) for kelime, bozuk in kapsanan)
+    return {
+        'ortalama': sum(sureler) / n * 1e6,
+        'p50': sureler[n // 2] * 1e6,
+        'p99': sureler[min(n - 1, n * 99 // 100)] * 1e6,
+        'toplu': toplu / n * 1e6,
+        'bulma': bulunan / len(kapsanan) if kapsanan else 1.0,
+    }
+
+
+def _motoru_ac(path: str) -> OneriMotoru:
+    try:
+        return OneriMotoru(path)
+    except (OSError, ValueError) as e:
+        print(f"HATA: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _oneri_metni(oneriler: List[Oneri]) -> str:
+    return ', '.join(f"{k} ({d:g})" for k, d, _ in oneriler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sözlük üzerinde hızlı yazım önerisi (silme indeksi, .oneri).")
+    alt = parser.add_subparsers(dest='komut', required=True)
+    p = alt.add_parser('olustur', help="kelimeler tablosundan veya metin listelerinden .oneri indeksi oluştur")
+    p.add_argument('metinler', nargs='*', help="Satır başına bir kelime (isteğe bağlı <TAB>frekans) içeren dosyalar "
+                                               "(verilmezse --db)")
+    p.add_argument('--db', default=DATABASE_NAME, help="Kaynak veritabanı (metin dosyası verilmediğinde)")
+    p.add_argument('--onayli', action='store_true', help="Yalnızca onay = 1 olan kelimeler")
+    p.add_argument('--frekans', nargs='+', default=[], help="Sıralama için 'kelime<TAB>frekans' dosyaları")
+    p.add_argument('-o', '--cikti', default='kelimeler' + UZANTI)
+    p.add_argument('--onek', type=int, default=ONEK_UZUNLUGU, help="İndekslenen önek uzunluğu")
+    p.add_argument('--mesafe', type=int, default=EN_FAZLA_MESAFE, help="Desteklenecek en büyük uzaklık")
+    p = alt.add_parser('oner', help="Kelimeler için öneri göster")
+    p.add_argument('indeks')
+    p.add_argument('kelimeler', nargs='+')
+    p.add_argument('--mesafe', type=float, default=EN_FAZLA_MESAFE)
+    p.add_argument('--limit', type=int, default=ONERI_LIMITI)
+    p = alt.add_parser('toplu', help="Dosyadaki kelimeler için öneriler (TSV: kelime, en yakın uzaklık, öneriler)")
+    p.add_argument('indeks')
+    p.add_argument('girdi', help="Satır başına bir kelime (yeni_olasi_turkce_adaylari.txt, *_frekans.tsv)")
+    p.add_argument('-o', '--cikti', default='-', help="Çıktı dosyası (varsayılan: standart çıktı)")
+    p.add_argument('--mesafe', type=float, default=EN_FAZLA_MESAFE)
+    p.add_argument('--limit', type=int, default=5)
+    p = alt.add_parser('bilgi', help="İndeks istatistikleri")
+    p.add_argument('indeks')
+    p = alt.add_parser('olc', help="Sorgu sürelerini ölç (bozulmuş rastgele kelimelerle)")
+    p.add_argument('indeks')
+    p.add_argument('-n', type=int, default=2000, help="Sorgu sayısı")
+    p.add_argument('--mesafe', type=int, default=EN_FAZLA_MESAFE)
+    p.add_argument('--limit', type=int, default=ONERI_LIMITI, help="Sorgu başına öneri sayısı (0: tümü)")
+    args = parser.parse_args()
+
+    if args.komut == 'olustur':
+        if args.onek < 1 or args.mesafe < 0:
+            print("HATA: --onek en az 1, --mesafe en az 0 olmalı.", file=sys.stderr)
+            sys.exit(1)
+        kaynaklar = (args.metinler or [args.db]) + args.frekans
+        eksikler = [path for path in kaynaklar if not os.path.exists(path)]
+        if eksikler:
+            print(f"HATA: Kaynak dosya bulunamadı: {', '.join(eksikler)}", file=sys.stderr)
+            sys.exit(1)
+        start = time.time()
+        try:
+            if args.metinler:
+                frekanslar = metin_kelimeleri(args.metinler)
+                kelimeler = list(frekanslar)
+            else:
+                frekanslar = {}
+                kelimeler = sozluk_paketi.veritabani_kelimeleri(args.db, args.onayli)
+            for kelime, frekans in frekanslari_oku(args.frekans).items():
+                frekanslar[kelime] = frekanslar.get(kelime, 0) + frekans
+            kelime_sayisi, grup_sayisi, kayit_sayisi = indeks_olustur(kelimeler, args.cikti, frekanslar,
+                                                                      args.onek, args.mesafe)
+        except (sqlite3.Error, ValueError) as e:
+            print(f"HATA: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"-> {kelime_sayisi:,} kelime, {grup_sayisi:,} grup, {kayit_sayisi:,} indeks kaydı "
+              f"{args.cikti} dosyasına yazıldı ({time.time() - start:.1f} sn, "
+              f"{os.path.getsize(args.cikti) / 1e6:,.1f} MB).")
+        return
+
+    with _motoru_ac(args.indeks) as motor:
+        try:
+            if args.komut == 'oner':
+                for kelime in args.kelimeler:
+                    t0 = time.perf_counter()
+                    oneriler = motor.oner(kelime, args.mesafe, args.limit)
+                    sure = time.perf_counter() - t0
+                    print(f"{kelime}\t{_oneri_metni(oneriler) or '-'}\t({sure * 1e6:.0f} µs)")
+            elif args.komut == 'toplu':
+                kelimeler = list(metin_kelimeleri([args.girdi]))
+                t0 = time.perf_counter()
+                sonuclar = motor.toplu_oner(kelimeler, args.mesafe, args.limit)
+                sure = time.perf_counter() - t0
+                cikti = sys.stdout if args.cikti == '-' else open(args.cikti, 'w', encoding='utf-8')
+                try:
+                    # Girdi sırası korunur (frekans dosyalarında en sık geçen aday en üstte)
+                    for kelime in kelimeler:
+                        oneriler = sonuclar[kelime]
+                        en_yakin = f"{oneriler[0][1]:g}" if oneriler else '-'
+                        cikti.write(f"{kelime}\t{en_yakin}\t{_oneri_metni(oneriler)}\n")
+                finally:
+                    if cikti is not sys.stdout:
+                        cikti.close()
+                print(f"-> {len(kelimeler):,} kelime, {sure:.2f} sn "
+                      f"({sure / max(len(kelimeler), 1) * 1e6:.0f} µs/kelime).", file=sys.stderr)
+            elif args.komut == 'bilgi':
+                print(f"Sürüm: {SURUM} | Kelime: {len(motor):,} | Grup: {motor.grup_sayisi:,} "
+                      f"(önek {motor.onek_uzunlugu}) | En fazla mesafe: {motor.en_fazla_mesafe}")
+                print(f"İndeks: {motor.kova_sayisi:,} kova, {motor.kayit_sayisi:,} kayıt | "
+                      f"Boyut: {os.path.getsize(args.indeks) / 1e6:,.1f} MB")
+            else:
+                if not motor.grup_sayisi:
+                    print("HATA: İndeks boş.", file=sys.stderr)
+                    sys.exit(1)
+                sonuc = olc(motor, args.n, args.mesafe, args.limit or None)
+                print(f"Sorgu süresi (mesafe <= {args.mesafe}, limit {args.limit or 'yok'}): ortalama {sonuc['ortalama']:.0f} µs | "
+                      f"p50 {sonuc['p50']:.0f} µs | p99 {sonuc['p99']:.0f} µs | "
+                      f"toplu {sonuc['toplu']:.0f} µs/kelime")
+                print(f"Özgün kelimenin (sınırsız) önerilerde bulunma oranı: %{100 * sonuc['bulma']:.1f}")
+        except (OSError, ValueError) as e:
+            print(f"HATA: {e}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+# sistem_kaynaklari.py
+# Amaç: Yükleyicilerin bellek ve CPU ölçümleri için /proc tabanlı küçük yardımcılar (Linux).
+# /proc bulunmayan sistemlerde ölçümler 0 döner, betikler çalışmaya devam eder.
+
+import os
+from typing import Iterable
+
+
+def rss_mb(pid: int = None) -> float:
+    """Bir sürecin o anki fiziksel bellek kullanımını (VmRSS) MB olarak döndürür."""
+    pid = pid or os.getpid()
+    try:
+        with open(f'/proc/{pid}/status', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        pass
+    return 0.0
+
+
+def toplam_rss_mb(pids: Iterable[int]) -> float:
+    """Verilen süreçlerin toplam fiziksel bellek kullanımı (MB)."""
+    return sum(rss_mb(pid) for pid in pids)
+
+
+def kullanilabilir_bellek_mb() -> float:
+    """Yeni süreçlere ayrılabilecek bellek (/proc/meminfo MemAvailable) MB olarak; okunamazsa 0."""
+    try:
+        with open('/proc/meminfo', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) / 1024
+    except (FileNotFoundError, PermissionError):
+        pass
+    return 0.0
+
+
+def cpu_sayisi() -> int:
+    """Bu sürecin kullanabileceği CPU sayısı (CPU kısıtlaması/affinity dikkate alınır)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
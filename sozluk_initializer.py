@@ -1,95 +1,174 @@
-# sozluk_initializer.py - Sıfırdan Temizleme ve Detay Çekme Düzeltmesi
+# sozluk_initializer.py - kelimeler tablosundaki köklerden sozluk tablosunun oluşturulması/güncellenmesi
+#
+# Varsayılan (artımlı) kipte sozluk silinmez: yalnızca son çalıştırmadan bu yana eklenen veya
+# analizi değişen kelimeler satırlarının kökleri işlenir, sozluk'ta bulunmayan (detay, tip)
+# çiftleri eklenir. Mevcut satırlara (geo_bulk_aktarim.py'nin coğrafi anlamları, elle girilen
+# onay/anlam bilgileri) dokunulmaz.
+#   - Kök ve tipi kelimeler.kok_detay/kok_tipi kolonlarından okunur (bkz. lexicon_sema.KOK_KOLONLARI).
+#   - İşlenen en büyük kelimeler.id sozluk_durum tablosunda saklanır; daha yeni satırlar bir
+#     sonraki çalıştırmada işlenir.
+#   - Bu sınırın altındaki satırların analizi değişirse (db_loader.py --guncelle) veya böyle bir
+#     id yeniden kullanılırsa, tetikleyiciler satırı sozluk_kuyrugu tablosuna yazar.
+#
+# Kullanım:
+#   python sozluk_initializer.py           (artımlı güncelleme)
+#   python sozluk_initializer.py --tam     (kurtarma: sozluk'u silip tüm köklerden yeniden oluşturur)
 
+import argparse
 import sqlite3
 import sys
+import time
+
+import lexicon_sema
+import turkce
 
 DATABASE_NAME = 'lexicon.db'
 
-def initialize_sozluk_table_from_scratch():
+SOZLUK_SEMASI = """
+    CREATE TABLE IF NOT EXISTS sozluk (
+        id INTEGER PRIMARY KEY,
+        kok TEXT NOT NULL,
+        detay TEXT, -- Büyüklük/Küçüklük, İnceltme işaretleri vb. içerir
+        tip TEXT, -- isim, fiil, Adj, Noun, vb.
+        koken TEXT,
+        kaynak TEXT,
+        kullanim TEXT,
+        anlam TEXT,
+        aciklama TEXT,
+        attempted INTEGER DEFAULT 0,
+        failed INTEGER DEFAULT 0,
+        onay INTEGER DEFAULT 0,
+        UNIQUE(kok, tip, koken) -- Tekrarlayan kök girişlerini engeller
+    );
+"""
+
+TAKIP_SEMASI = """
+    CREATE TABLE IF NOT EXISTS sozluk_durum (
+        anahtar TEXT PRIMARY KEY,
+        deger INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS sozluk_kuyrugu (
+        kelime_id INTEGER PRIMARY KEY
+    );
+
+    -- Tetikleyicideki 'INSERT OR IGNORE' kullanılmaz: tetikleyen cümlenin çakışma kuralı (ör. db_loader
+    -- --guncelle'nin UPSERT'i, varsayılan ABORT) onu geçersiz kılar ve kuyrukta zaten olan satır yüklemeyi keser.
+    DROP TRIGGER IF EXISTS kelimeler_sozluk_ekle;
+    CREATE TRIGGER kelimeler_sozluk_ekle AFTER INSERT ON kelimeler
+    WHEN NEW.id <= (SELECT deger FROM sozluk_durum WHERE anahtar = 'son_kelime_id')
+         AND NOT EXISTS (SELECT 1 FROM sozluk_kuyrugu WHERE kelime_id = NEW.id)
+    BEGIN
+        INSERT INTO sozluk_kuyrugu (kelime_id) VALUES (NEW.id);
+    END;
+
+    DROP TRIGGER IF EXISTS kelimeler_sozluk_guncelle;
+    CREATE TRIGGER kelimeler_sozluk_guncelle AFTER UPDATE OF analiz ON kelimeler
+    WHEN OLD.analiz IS NOT NEW.analiz
+         AND NEW.id <= (SELECT deger FROM sozluk_durum WHERE anahtar = 'son_kelime_id')
+         AND NOT EXISTS (SELECT 1 FROM sozluk_kuyrugu WHERE kelime_id = NEW.id)
+    BEGIN
+        INSERT INTO sozluk_kuyrugu (kelime_id) VALUES (NEW.id);
+    END;
+"""
+
+# Yeni/değişen satırların sozluk'ta bulunmayan kökleri (detay + tip çifti bir sözlük girdisidir).
+# 'kok' alanı: detayın Türkçe küçük harfli ve şapkasız (yalın) hali ('İ' -> 'i', 'I' -> 'ı', 'â' -> 'a')
+ARTIMLI_SQL = f"""
+    INSERT OR IGNORE INTO sozluk (kok, detay, tip, kaynak)
+    SELECT {turkce.sql_katla('y.kok_detay')}, y.kok_detay, y.kok_tipi, 'Zemberek'
+    FROM (
+        SELECT kok_detay, kok_tipi FROM kelimeler WHERE id > :son AND id <= :en_buyuk
+        UNION
+        SELECT k.kok_detay, k.kok_tipi FROM sozluk_kuyrugu q JOIN kelimeler k ON k.id = q.kelime_id
+    ) y
+    WHERE y.kok_detay IS NOT NULL AND y.kok_detay <> ''
+      AND NOT EXISTS (SELECT 1 FROM sozluk s WHERE s.detay = y.kok_detay AND s.tip IS y.kok_tipi)
+"""
+
+
+def takibi_kur(conn: sqlite3.Connection):
+    """kok_detay/kok_tipi kolonlarını (eksikse), sozluk ile durum/kuyruk tablolarını ve tetikleyicileri kurar."""
+    eklenenler = lexicon_sema.kok_kolonlarini_ekle(conn)
+    if eklenenler:
+        print(f"-> kelimeler tablosuna kolon eklendi: {', '.join(eklenenler)}")
+    conn.executescript(SOZLUK_SEMASI + TAKIP_SEMASI)
+
+
+def sozlugu_guncelle(conn: sqlite3.Connection) -> int:
     """
-    sozluk tablosunu siler (DROP), yeniden oluşturur ve kelimeler tablosundaki 
-    kökleri, tip ve detay bilgisini analiz alanından doğru şekilde aktarır.
+    Son çalıştırmadan bu yana eklenen/değişen kelimeler satırlarının köklerini sozluk'a ekler.
+    İlk çalıştırmada tüm satırlar işlenir. Eklenen kök sayısını döndürür.
     """
-    
-    print(f"-> '{DATABASE_NAME}' veritabanı kullanılıyor...")
-    
+    takibi_kur(conn)
+    # NOT EXISTS (detay, tip) araması her aday için sozluk'u taramasın
+    lexicon_sema.indeksleri_olustur(conn, ['sozluk'], analiz=False)
+    conn.execute("BEGIN IMMEDIATE")
     try:
-        conn = sqlite3.connect(DATABASE_NAME)
-        cursor = conn.cursor()
-
-        # 1. Sözlük Tablosunu SİLME (Sıfırdan Başlangıç)
-        print("-> 'sozluk' tablosu siliniyor (Temiz başlangıç)...")
-        cursor.execute("DROP TABLE IF EXISTS sozluk;")
-        
-        # 2. Yeni Sözlük Tablosunu Oluşturma (Detay kolonu dahil)
-        print("-> Yeni ve doğru şemayla 'sozluk' tablosu oluşturuluyor...")
-        cursor.execute('''
-            CREATE TABLE sozluk (
-                id INTEGER PRIMARY KEY,
-                kok TEXT NOT NULL,
-                detay TEXT, -- Yeni/Doğru alan: Büyüklük/Küçüklük, İnceltme işaretleri vb. içerir
-                tip TEXT, -- isim, fiil, Adj, Noun, vb.
-                koken TEXT, 
-                kaynak TEXT, 
-                kullanim TEXT, 
-                anlam TEXT,
-                aciklama TEXT,
-                attempted INTEGER DEFAULT 0, 
-                failed INTEGER DEFAULT 0,
-                onay INTEGER DEFAULT 0,
-                UNIQUE(kok, tip, koken) -- Tekrarlayan kök girişlerini engeller
-            );
-        ''')
-        
-        # 3. kelimeler tablosundaki Kökleri sozluk tablosuna aktarma
-        print("-> 'kelimeler' tablosundaki benzersiz kökler 'sozluk' tablosuna aktarılıyor (Aksansız ve Yalın Kök Formu)...")
-
-        # Yeni ve düzeltilmiş SQL Sorgusu: detay alanını T1.analiz'den çekiyor ve kok'u normalleştiriyor.
-        sql_query = """
-        INSERT OR IGNORE INTO sozluk (kok, detay, tip, kaynak)
-        SELECT 
-            -- 'kok' alanı: LOWER() ve ardışık REPLACE'ler ile aksanları kaldırılmış, küçük harfli ve yalın hali.
-            REPLACE(REPLACE(REPLACE(
-                LOWER(
-                    -- Analiz alanından orijinal kökü çıkar
-                    SUBSTR(T1.analiz, 2, INSTR(T1.analiz, ':') - 2)
-                ),
-                'â', 'a'
-            ), 'î', 'i'), 'û', 'u') AS yalın_kok,
-            
-            -- 'detay' alanı: Orijinal (büyük/küçük harf duyarlı, şapkalı) kök bilgisi, analiz alanından çekildi
-            SUBSTR(
-                T1.analiz, 
-                2,
-                INSTR(T1.analiz, ':') - 2 
-            ) AS detay,
-            
-            -- Kök Tipini Belirleme: '[kok:tip]' kısmından 'tip' değerini çıkarır.
-            SUBSTR(
-                T1.analiz, 
-                INSTR(T1.analiz, ':') + 1, 
-                INSTR(T1.analiz, ']') - (INSTR(T1.analiz, ':') + 1)
-            ) AS tip,
-            
-            'Zemberek' AS kaynak
-        FROM kelimeler T1
-        GROUP BY 
-            SUBSTR(T1.analiz, 2, INSTR(T1.analiz, ':') - 2), -- Detay köke göre gruplandı
-            tip; 
-        """
-
-        cursor.execute(sql_query)
-        imported_count = conn.total_changes
-        conn.commit()
-        
-        print(f"-> 'sozluk' tablosuna {imported_count} adet benzersiz kök başarıyla aktarıldı (Detay analizin içinden çekildi).")
+        satir = conn.execute("SELECT deger FROM sozluk_durum WHERE anahtar = 'son_kelime_id'").fetchone()
+        son = satir[0] if satir else 0
+        en_buyuk = conn.execute("SELECT COALESCE(MAX(id), 0) FROM kelimeler").fetchone()[0]
+        eklenen = conn.execute(ARTIMLI_SQL, {'son': son, 'en_buyuk': en_buyuk}).rowcount
+        conn.execute("DELETE FROM sozluk_kuyrugu")
+        conn.execute("INSERT OR REPLACE INTO sozluk_durum (anahtar, deger) VALUES ('son_kelime_id', ?)",
+                     (max(son, en_buyuk),))
+        conn.execute("COMMIT")
+    except sqlite3.Error:
+        conn.execute("ROLLBACK")
+        raise
+    print(f"-> {max(en_buyuk - son, 0)} yeni kelimeler satırı işlendi, sozluk'a {eklenen} kök eklendi.")
+    return eklenen
+
 
+def initialize_sozluk_table_from_scratch(conn: sqlite3.Connection):
+    """
+    Kurtarma amaçlı tam yeniden oluşturma: sozluk tablosunu siler (DROP), yeniden oluşturur ve
+    kelimeler tablosundaki tüm kökleri, tip ve detay bilgisiyle aktarır.
+    DİKKAT: Coğrafi anlamlar ve elle girilen onay/anlam bilgileri silinir.
+    """
+    # 1. Sözlük Tablosunu SİLME (Sıfırdan Başlangıç)
+    print("-> 'sozluk' tablosu siliniyor (Temiz başlangıç)...")
+    conn.execute("DROP TABLE IF EXISTS sozluk;")
+
+    # 2. Yeni Sözlük Tablosunu Oluşturma (Detay kolonu dahil)
+    print("-> Yeni ve doğru şemayla 'sozluk' tablosu oluşturuluyor...")
+    conn.execute(SOZLUK_SEMASI)
+    conn.commit()
+
+    # 3. Tüm kelimeler satırlarını yeniden işle (durum sıfırlanır, kuyruk boşaltılır)
+    print("-> 'kelimeler' tablosundaki benzersiz kökler 'sozluk' tablosuna aktarılıyor (Aksansız ve Yalın Kök Formu)...")
+    takibi_kur(conn)
+    conn.execute("DELETE FROM sozluk_durum WHERE anahtar = 'son_kelime_id'")
+    conn.commit()
+    sozlugu_guncelle(conn)
+
+    # 4. DROP TABLE indeksleri de sildi: detay indeksi sozlugu_guncelle'de kuruldu, istatistikleri güncelle
+    lexicon_sema.indeksleri_olustur(conn, ['sozluk'])
+
+
+def main(tam: bool = False):
+    print(f"-> '{DATABASE_NAME}' veritabanı kullanılıyor...")
+    conn = None
+    try:
+        # BEGIN/COMMIT elle yönetilir (sozlugu_guncelle tek bir yazma işlemi açar)
+        conn = turkce.baglan(DATABASE_NAME, isolation_level=None)
+        start = time.time()
+        if tam:
+            initialize_sozluk_table_from_scratch(conn)
+        else:
+            sozlugu_guncelle(conn)
+        toplam = conn.execute("SELECT COUNT(*) FROM sozluk").fetchone()[0]
+        print(f"-> sozluk: {toplam} kök ({time.time() - start:.2f} sn).")
     except sqlite3.Error as e:
         print(f"KRİTİK HATA: Veritabanı işlemi sırasında bir hata oluştu: {e}")
         sys.exit(1)
     finally:
-        if 'conn' in locals() and conn:
+        if conn:
             conn.close()
 
+
 if __name__ == '__main__':
-    initialize_sozluk_table_from_scratch()
+    parser = argparse.ArgumentParser(description="kelimeler tablosundaki köklerden sozluk tablosunu günceller.")
+    parser.add_argument('--tam', action='store_true',
+                        help="Kurtarma: sozluk'u silip tüm köklerden yeniden oluştur (coğrafi/elle girilen veriler silinir)")
+    args = parser.parse_args()
+    main(args.tam)
@@ -0,0 +1,385 @@
+# sozluk_paketi.py
+# Amaç: Kelime listesini istemcilere gömülebilecek kompakt, sürümlü bir ikili dosyaya (.szp)
+# dönüştürmek ve bu dosyadan mmap ile doğrudan sorgu yapmak (kelime var mı, önek listesi, sıra).
+# lexicon.db'yi ya da kelimeler.txt/tr_lexicon.txt'yi taşıyıp belleğe set olarak yüklemek yerine
+# dosya açılır açılmaz kullanılabilir; yalnızca sorgunun dokunduğu sayfalar okunur.
+#
+# Kullanım:
+#   python sozluk_paketi.py olustur --db lexicon.db -o kelimeler.szp
+#   python sozluk_paketi.py olustur --db lexicon.db --onayli -o kelimeler.szp
+#   python sozluk_paketi.py olustur tr_lexicon.txt kelimeler.txt -o kelimeler.szp
+#   python sozluk_paketi.py bul kelimeler.szp kitaplarım kitapxq
+#   python sozluk_paketi.py onek kelimeler.szp kitap --limit 20
+#   python sozluk_paketi.py bilgi kelimeler.szp
+#   python sozluk_paketi.py olc kelimeler.szp
+#
+# Dosya yapısı:
+#   [SIHIRLI_BAYTLAR][başlık] [blok 0] [blok 1] ... [blok indeksi]
+#   - Kelimeler UTF-8 bayt sırasına göre (SQLite BINARY sıralaması) sıralı ve tekildir.
+#   - Her blok BLOK_KELIME_SAYISI kelime içerir ve önden kodludur (front coding): ilk kelime
+#     tam yazılır (uzunluk + baytlar), sonrakiler bir önceki kelimeyle ortak önek uzunluğu +
+#     kalan ek olarak yazılır. Uzunluklar LEB128 (varint) kodludur.
+#   - Blok indeksi her bloğun dosya ofsetini tutar (uint32); ikili arama blokların ilk
+#     kelimeleri üzerinde yapılır, ardından tek blok sırayla çözülür.
+
+import argparse
+import mmap
+import os
+import random
+import sqlite3
+import struct
+import sys
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# --- KONFİGÜRASYON ---
+DATABASE_NAME = 'lexicon.db'
+SIHIRLI_BAYTLAR = b'DRLMSZP1'
+SURUM = 1
+UZANTI = '.szp'
+BLOK_KELIME_SAYISI = 32
+
+# Başlık: sürüm, blok kelime sayısı, toplam kelime, blok sayısı, indeks ofseti
+BASLIK = struct.Struct('<IIQQQ')
+INDEKS_KAYDI = struct.Struct('<I')
+VERI_BASI = len(SIHIRLI_BAYTLAR) + BASLIK.size
+
+
+def _varint(n: int) -> bytes:
+    cikti = bytearray()
+    while n >= 0x80:
+        cikti.append((n & 0x7F) | 0x80)
+        n >>= 7
+    cikti.append(n)
+    return bytes(cikti)
+
+
+def _varint_oku(tampon, konum: int) -> Tuple[int, int]:
+    b = tampon[konum]
+    if b < 0x80:
+        return b, konum + 1
+    n, kaydir = b & 0x7F, 7
+    while True:
+        konum += 1
+        b = tampon[konum]
+        n |= (b & 0x7F) << kaydir
+        if b < 0x80:
+            return n, konum + 1
+        kaydir += 7
+
+
+def _ortak_onek(a: bytes, b: bytes) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class SozlukPaketiYazici:
+    """
+    UTF-8 bayt sırasına göre sıralı ve tekil kelimeleri .szp dosyasına yazar.
+    Bloklar doldukça diske yazılır; indeks ve başlık kapatılırken eklenir.
+    """
+
+    def __init__(self, path: str, blok_kelime_sayisi: int = BLOK_KELIME_SAYISI):
+        self.path = path
+        self.blok_kelime_sayisi = blok_kelime_sayisi
+        self.ofsetler: List[int] = []
+        self.toplam = 0
+        self._onceki: Optional[bytes] = None
+        self._f = None
+
+    def __enter__(self):
+        # Yarım kalan dosya asıl adı almasın: geçici adla yaz, kapatırken atomik olarak taşı
+        self._f = open(self.path + '.tmp', 'wb')
+        self._f.write(SIHIRLI_BAYTLAR + BASLIK.pack(SURUM, self.blok_kelime_sayisi, 0, 0, 0))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self._f.close()
+            os.remove(self.path + '.tmp')
+            return False
+        indeks_ofseti = self._f.tell()
+        self._f.write(b''.join(INDEKS_KAYDI.pack(ofset) for ofset in self.ofsetler))
+        self._f.seek(len(SIHIRLI_BAYTLAR))
+        self._f.write(BASLIK.pack(SURUM, self.blok_kelime_sayisi, self.toplam, len(self.ofsetler), indeks_ofseti))
+        self._f.close()
+        os.replace(self.path + '.tmp', self.path)
+        return False
+
+    def ekle(self, kelime: str):
+        ham = kelime.encode('utf-8')
+        if self._onceki is not None and ham <= self._onceki:
+            raise ValueError(f"Kelimeler UTF-8 sırasına göre sıralı ve tekil olmalı: "
+                             f"'{self._onceki.decode('utf-8')}' -> '{kelime}'")
+        if self.toplam % self.blok_kelime_sayisi == 0:
+            ofset = self._f.tell()
+            if ofset > 0xFFFFFFFF:
+                raise ValueError("Sözlük paketi 4 GB sınırını aşıyor.")
+            self.ofsetler.append(ofset)
+            self._f.write(_varint(len(ham)) + ham)
+        else:
+            ortak = _ortak_onek(self._onceki, ham)
+            self._f.write(_varint(ortak) + _varint(len(ham) - ortak) + ham[ortak:])
+        self._onceki = ham
+        self.toplam += 1
+
+
+class SozlukPaketi:
+    """
+    .szp dosyasını mmap ile okur; belleğe yalnızca başlık alınır.
+    'kelime in paket', paket.onek('kitap'), paket.sira('kitap') ve paket[i] desteklenir.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._f.close()
+            raise ValueError(f"{path} boş bir dosya.")
+        if self._mm[:len(SIHIRLI_BAYTLAR)] != SIHIRLI_BAYTLAR or len(self._mm) < VERI_BASI:
+            self.kapat()
+            raise ValueError(f"{path} bir sözlük paketi (.szp) dosyası değil.")
+        surum, self.blok_kelime_sayisi, self.toplam, self.blok_sayisi, self._indeks_ofseti = \
+            BASLIK.unpack_from(self._mm, len(SIHIRLI_BAYTLAR))
+        if surum != SURUM:
+            self.kapat()
+            raise ValueError(f"{path} desteklenmeyen sürümde (dosya: {surum}, beklenen: {SURUM}).")
+        if self._indeks_ofseti + self.blok_sayisi * INDEKS_KAYDI.size != len(self._mm):
+            self.kapat()
+            raise ValueError(f"{path} eksik yazılmış (indeks boyutu tutmuyor).")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.kapat()
+        return False
+
+    def kapat(self):
+        if getattr(self, '_mm', None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._f.close()
+
+    def __len__(self):
+        return self.toplam
+
+    def _blok_ofseti(self, i: int) -> int:
+        return INDEKS_KAYDI.unpack_from(self._mm, self._indeks_ofseti + i * INDEKS_KAYDI.size)[0]
+
+    def _ilk_kelime(self, i: int) -> bytes:
+        uzunluk, konum = _varint_oku(self._mm, self._blok_ofseti(i))
+        return self._mm[konum:konum + uzunluk]
+
+    def _blogu_coz(self, i: int) -> Iterator[bytes]:
+        """i. bloğun kelimeleri (UTF-8 bayt olarak, sırayla)."""
+        mm = self._mm
+        uzunluk, konum = _varint_oku(mm, self._blok_ofseti(i))
+        kelime = mm[konum:konum + uzunluk]
+        konum += uzunluk
+        yield kelime
+        for _ in range(min(self.blok_kelime_sayisi, self.toplam - i * self.blok_kelime_sayisi) - 1):
+            ortak, konum = _varint_oku(mm, konum)
+            uzunluk, konum = _varint_oku(mm, konum)
+            kelime = kelime[:ortak] + mm[konum:konum + uzunluk]
+            konum += uzunluk
+            yield kelime
+
+    def _alt_sinir(self, hedef: bytes) -> Tuple[int, bool]:
+        """hedeften küçük kelime sayısı ve hedefin pakette olup olmadığı."""
+        alt, ust = 0, self.blok_sayisi
+        while alt < ust:
+            orta = (alt + ust) // 2
+            if self._ilk_kelime(orta) <= hedef:
+                alt = orta + 1
+            else:
+                ust = orta
+        blok = alt - 1
+        if blok < 0:
+            return 0, False
+        for j, kelime in enumerate(self._blogu_coz(blok)):
+            if kelime >= hedef:
+                return blok * self.blok_kelime_sayisi + j, kelime == hedef
+        return min((blok + 1) * self.blok_kelime_sayisi, self.toplam), False
+
+    def __contains__(self, kelime: str) -> bool:
+        return self._alt_sinir(kelime.encode('utf-8'))[1]
+
+    def sira(self, kelime: str) -> int:
+        """Paketteki kelimeden küçük (UTF-8 sırasında önce gelen) kelime sayısı; kelime varsa onun sırası."""
+        return self._alt_sinir(kelime.encode('utf-8'))[0]
+
+    def __getitem__(self, sira: int) -> str:
+        if sira < 0:
+            sira += self.toplam
+        if not 0 <= sira < self.toplam:
+            raise IndexError(sira)
+        blok, j = divmod(sira, self.blok_kelime_sayisi)
+        for k, kelime in enumerate(self._blogu_coz(blok)):
+            if k == j:
+                return kelime.decode('utf-8')
+
+    def _sira_ile_baslayarak(self, sira: int) -> Iterator[bytes]:
+        blok, j = divmod(sira, self.blok_kelime_sayisi)
+        for i in range(blok, self.blok_sayisi):
+            for k, kelime in enumerate(self._blogu_coz(i)):
+                if i > blok or k >= j:
+                    yield kelime
+
+    def onek(self, onek: str, limit: Optional[int] = None) -> Iterator[str]:
+        """onek ile başlayan kelimeler (sıralı; limit verilirse en çok limit kelime)."""
+        hedef = onek.encode('utf-8')
+        sayi = 0
+        for kelime in self._sira_ile_baslayarak(self._alt_sinir(hedef)[0]):
+            if not kelime.startswith(hedef) or (limit is not None and sayi >= limit):
+                return
+            sayi += 1
+            yield kelime.decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        for kelime in self._sira_ile_baslayarak(0):
+            yield kelime.decode('utf-8')
+
+
+# --- DIŞA AKTARMA ---
+
+def veritabani_kelimeleri(db_path: str, onayli: bool = False) -> Iterator[str]:
+    """kelimeler tablosundaki (veya görünümündeki) kelimeler, BINARY (UTF-8 bayt) sırasıyla."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        kosul = "WHERE onay = 1" if onayli else ""
+        for (kelime,) in conn.execute(f"SELECT kelime FROM kelimeler {kosul} ORDER BY kelime"):
+            if kelime:
+                yield kelime
+    finally:
+        conn.close()
+
+
+def metin_kelimeleri(paths: Iterable[str]) -> List[str]:
+    """Satır başına bir kelime içeren metin dosyalarındaki tekil kelimeler, UTF-8 sırasıyla."""
+    kelimeler = set()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            kelimeler.update(satir.strip() for satir in f)
+    kelimeler.discard('')
+    return sorted(kelimeler, key=lambda k: k.encode('utf-8'))
+
+
+def paketle(kelimeler: Iterable[str], szp_path: str, blok_kelime_sayisi: int = BLOK_KELIME_SAYISI) -> int:
+    """Sıralı kelimeleri .szp dosyasına yazar; yazılan kelime sayısını döndürür."""
+    with SozlukPaketiYazici(szp_path, blok_kelime_sayisi) as yazici:
+        for kelime in kelimeler:
+            yazici.ekle(kelime)
+    return yazici.toplam
+
+
+def olc(paket: SozlukPaketi, n: int = 100_000, tohum: int = 42) -> Tuple[float, float, float]:
+    """Rastgele n var olan ve n uydurma kelime için ortalama sorgu süreleri (µs): var, yok, sıra->kelime."""
+    rnd = random.Random(tohum)
+    siralar = [rnd.randrange(len(paket)) for _ in range(n)]
+    t0 = time.perf_counter()
+    mevcutlar = [paket[s] for s in siralar]
+    t_getir = time.perf_counter() - t0
+    uydurmalar = [kelime + 'xq' for kelime in mevcutlar]
+    t0 = time.perf_counter()
+    for kelime in mevcutlar:
+        kelime in paket
+    t_var = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for kelime in uydurmalar:
+        kelime in paket
+    t_yok = time.perf_counter() - t0
+    return t_var / n * 1e6, t_yok / n * 1e6, t_getir / n * 1e6
+
+
+def _paketi_ac(path: str) -> SozlukPaketi:
+    try:
+        return SozlukPaketi(path)
+    except (OSError, ValueError) as e:
+        print(f"HATA: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gömülü kullanım için kompakt sözlük paketi (.szp) aracı.")
+    alt = parser.add_subparsers(dest='komut', required=True)
+    p = alt.add_parser('olustur', help="kelimeler tablosundan veya metin listelerinden .szp oluştur")
+    p.add_argument('metinler', nargs='*', help="Satır başına bir kelime içeren dosyalar (verilmezse --db)")
+    p.add_argument('--db', default=DATABASE_NAME, help="Kaynak veritabanı (metin dosyası verilmediğinde)")
+    p.add_argument('--onayli', action='store_true', help="Yalnızca onay = 1 olan kelimeler")
+    p.add_argument('-o', '--cikti', default='kelimeler' + UZANTI)
+    p.add_argument('--blok', type=int, default=BLOK_KELIME_SAYISI, help="Blok başına kelime sayısı")
+    p = alt.add_parser('bul', help="Kelimelerin pakette olup olmadığını ve sırasını göster")
+    p.add_argument('paket')
+    p.add_argument('kelimeler', nargs='+')
+    p = alt.add_parser('onek', help="Bu önekle başlayan kelimeler")
+    p.add_argument('paket')
+    p.add_argument('onek')
+    p.add_argument('--limit', type=int, default=100)
+    p = alt.add_parser('bilgi', help="Paket istatistikleri")
+    p.add_argument('paket')
+    p = alt.add_parser('olc', help="Sorgu sürelerini ölç")
+    p.add_argument('paket')
+    p.add_argument('-n', type=int, default=100_000, help="Sorgu sayısı")
+    args = parser.parse_args()
+
+    if args.komut == 'olustur':
+        if args.blok < 1:
+            print("HATA: --blok en az 1 olmalı.", file=sys.stderr)
+            sys.exit(1)
+        kaynaklar = args.metinler or [args.db]
+        eksikler = [path for path in kaynaklar if not os.path.exists(path)]
+        if eksikler:
+            print(f"HATA: Kaynak dosya bulunamadı: {', '.join(eksikler)}", file=sys.stderr)
+            sys.exit(1)
+        start = time.time()
+        try:
+            kelimeler = metin_kelimeleri(args.metinler) if args.metinler else veritabani_kelimeleri(args.db, args.onayli)
+            toplam = paketle(kelimeler, args.cikti, args.blok)
+        except (sqlite3.Error, ValueError) as e:
+            print(f"HATA: {e}", file=sys.stderr)
+            sys.exit(1)
+        szp_boyutu = os.path.getsize(args.cikti)
+        # Karşılaştırma için aynı kelimelerin satır başına bir kelime olarak metin boyutu
+        with _paketi_ac(args.cikti) as paket:
+            metin_boyutu = sum(len(kelime.encode('utf-8')) + 1 for kelime in paket)
+        print(f"-> {toplam:,} kelime {args.cikti} dosyasına yazıldı ({time.time() - start:.1f} sn).")
+        print(f"-> Boyut: metin listesi {metin_boyutu / 1e6:,.1f} MB -> SZP {szp_boyutu / 1e6:,.1f} MB "
+              f"(%{100 * szp_boyutu / metin_boyutu if metin_boyutu else 0:.0f})")
+        return
+
+    with _paketi_ac(args.paket) as paket:
+        if args.komut == 'bul':
+            for kelime in args.kelimeler:
+                sira = paket.sira(kelime)
+                if kelime in paket:
+                    print(f"{kelime}\tvar\t(sıra {sira:,})")
+                else:
+                    print(f"{kelime}\tyok\t({sira:,} kelimeden sonra gelirdi)")
+        elif args.komut == 'onek':
+            t0 = time.perf_counter()
+            sonuclar = list(paket.onek(args.onek, args.limit))
+            sure = time.perf_counter() - t0
+            for kelime in sonuclar:
+                print(kelime)
+            print(f"-> {len(sonuclar)} kelime ({sure * 1000:.2f} ms).", file=sys.stderr)
+        elif args.komut == 'bilgi':
+            print(f"Sürüm: {SURUM} | Kelime: {len(paket):,} | Blok: {paket.blok_sayisi:,} x "
+                  f"{paket.blok_kelime_sayisi} kelime | Boyut: {os.path.getsize(args.paket) / 1e6:,.2f} MB")
+            if len(paket):
+                print(f"İlk kelime: {paket[0]} | Son kelime: {paket[-1]}")
+        else:
+            if not len(paket):
+                print("HATA: Paket boş.", file=sys.stderr)
+                sys.exit(1)
+            var, yok, getir = olc(paket, args.n)
+            print(f"Ortalama sorgu süresi: var olan {var:.1f} µs | olmayan {yok:.1f} µs | sıra -> kelime {getir:.1f} µs")
+
+
+if __name__ == '__main__':
+    main()
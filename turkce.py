@@ -0,0 +1,121 @@
+# turkce.py
+# Amaç: Türkçeye uygun büyük/küçük harf dönüşümü, karşılaştırma ve alfabetik sıralama.
+#
+# str.lower()/upper() ve SQLite LOWER() Türkçede yanlış sonuç verir:
+#   'I'.lower() -> 'i' (doğrusu 'ı'), 'İ'.lower() -> 'i̇' (i + birleşik nokta), 'i'.upper() -> 'I',
+#   SQLite LOWER() yalnızca ASCII harfleri küçültür ('Ç', 'İ' olduğu gibi kalır).
+# sorted() ise kod noktası sırasını kullanır: ç, ğ, ı, ö, ş, ü harfleri z'den sonra gelir.
+#
+# Buradaki dönüşümler önceden derlenmiş çeviri tablolarıyla (str.translate) yapılır; yerel ayar
+# (locale) çağrısı gerekmez. SQLite için:
+#   - sql_kucult()/sql_katla() yalnızca yerleşik fonksiyonlardan (REPLACE, LOWER) oluşan ifadeler
+#     üretir; ifade indeksleri bunlarla kurulur, böylece fonksiyonu kaydetmemiş istemciler
+#     (sqlite3 komut satırı, başka araçlar) da tabloya yazabilir,
+#   - baglantiya_kaydet() tr_kucult/tr_katla/tr_buyut fonksiyonlarını ve TURKCE sıralamasını
+#     (collation) bağlantıya ekler: ... ORDER BY kelime COLLATE TURKCE
+#
+# Kullanım:
+#   import turkce
+#   turkce.kucult('IĞDIR İli')                     -> 'ığdır ili'
+#   sorted(kelimeler, key=turkce.sirala_anahtari)  -> a, b, c, ç, ..., z sırası
+#   conn = turkce.baglan('lexicon.db')
+
+import sqlite3
+
+BUYUK_HARFLER = 'ABCÇDEFGĞHIİJKLMNOÖPQRSŞTUÜVWXYZÂÎÛ'
+KUCUK_HARFLER = 'abcçdefgğhıijklmnoöpqrsştuüvwxyzâîû'
+# Klavyede Türkçe karakter bulunmadığında yerine yazılan harfler (ç -> c, ı -> i, ...)
+TURKCE_OZEL_HARFLER = 'çğıöşüâîû'
+ASCII_KARSILIKLARI = 'cgiosuaiu'
+# Sıralamada harfler bu sırayla gelir (q, w, x Latin alfabesindeki yerlerinde)
+ALFABE = 'abcçdefgğhıijklmnoöpqrsştuüvwxyz'
+# Alfabe harflerinin sıralama anahtarında eşlendiği aralık (Unicode özel kullanım alanı):
+# rakamlar ve noktalama harflerden önce gelir
+SIRA_BASLANGICI = 0xE000
+
+# Türkçe ve ASCII harfler tabloyla çevrilir; tabloda olmayanları ardından str.lower()/upper() çevirir
+_KUCULTME = str.maketrans(BUYUK_HARFLER, KUCUK_HARFLER)
+_BUYUTME = str.maketrans(KUCUK_HARFLER, BUYUK_HARFLER)
+# Şapkalı harfler eş değerlerine indirgenir
+_KATLAMA = str.maketrans(BUYUK_HARFLER + 'âîû', KUCUK_HARFLER[:-3] + 'aiu' + 'aiu')
+_ASCII = str.maketrans(TURKCE_OZEL_HARFLER, ASCII_KARSILIKLARI)
+# Büyük/küçük/şapkalı her harf doğrudan alfabedeki sırasına eşlenir (tek geçişte)
+_SIRA = str.maketrans({harf: chr(SIRA_BASLANGICI + ALFABE.index(katlanmis))
+                       for harf, katlanmis in zip(BUYUK_HARFLER + KUCUK_HARFLER,
+                                                  (BUYUK_HARFLER + KUCUK_HARFLER).translate(_KATLAMA))})
+
+
+def kucult(metin: str) -> str:
+    """Türkçe küçük harf: 'I' -> 'ı', 'İ' -> 'i' (şapkalı harfler korunur)."""
+    return metin.translate(_KUCULTME).lower()
+
+
+def buyut(metin: str) -> str:
+    """Türkçe büyük harf: 'i' -> 'İ', 'ı' -> 'I'."""
+    return metin.translate(_BUYUTME).upper()
+
+
+def katla(metin: str) -> str:
+    """Büyük/küçük harf ve şapka duyarsız karşılaştırma biçimi ('Kâtip' -> 'katip')."""
+    return metin.translate(_KATLAMA).lower()
+
+
+def asciye_katla(metin: str) -> str:
+    """
+    Türkçe harfleri ASCII karşılıklarına indirir ('Çiçekçi' -> 'cicekci', 'IŞIK' -> 'isik').
+    Uzunluk kucult() ile aynıdır: i. harf kucult(metin)[i]'nin karşılığıdır.
+    """
+    return kucult(metin).translate(_ASCII)
+
+
+def sirala_anahtari(metin: str) -> str:
+    """
+    Türkçe alfabetik sıralama anahtarı: sorted(..., key=sirala_anahtari).
+    Büyük/küçük harf ve şapka farkı gözetilmez (eşit anahtarlı kelimelerin sırası korunur).
+    Alfabe dışı harfler (é, ß, ...) kod noktası sırasıyla harflerden önce gelir.
+    """
+    return metin.translate(_SIRA).lower()
+
+
+def karsilastir(a: str, b: str) -> int:
+    """TURKCE sıralaması: önce sirala_anahtari, eşitse kod noktası sırası (toplam sıra)."""
+    ka, kb = sirala_anahtari(a), sirala_anahtari(b)
+    if ka != kb:
+        return -1 if ka < kb else 1
+    return (a > b) - (a < b)
+
+
+# --- SQLite ---
+
+def sql_kucult(ifade: str) -> str:
+    """kucult() ile aynı sonucu veren (Türkçe ve ASCII harfler için) yerleşik SQL ifadesi."""
+    for buyuk, kucuk in zip(BUYUK_HARFLER, KUCUK_HARFLER):
+        if not buyuk.isascii() or buyuk == 'I':
+            ifade = f"REPLACE({ifade}, '{buyuk}', '{kucuk}')"
+    # LOWER() kalan ASCII harfleri küçültür
+    return f"LOWER({ifade})"
+
+
+def sql_katla(ifade: str) -> str:
+    """katla() ile aynı sonucu veren (Türkçe ve ASCII harfler için) yerleşik SQL ifadesi."""
+    ifade = sql_kucult(ifade)
+    for sapkali, sapkasiz in (('â', 'a'), ('î', 'i'), ('û', 'u')):
+        ifade = f"REPLACE({ifade}, '{sapkali}', '{sapkasiz}')"
+    return ifade
+
+
+def _sql_fonksiyonu(fonksiyon):
+    return lambda metin: fonksiyon(metin) if isinstance(metin, str) else metin
+
+
+def baglantiya_kaydet(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """tr_kucult, tr_buyut, tr_katla fonksiyonlarını ve TURKCE sıralamasını bağlantıya ekler."""
+    for ad, fonksiyon in (('tr_kucult', kucult), ('tr_buyut', buyut), ('tr_katla', katla)):
+        conn.create_function(ad, 1, _sql_fonksiyonu(fonksiyon), deterministic=True)
+    conn.create_collation('TURKCE', karsilastir)
+    return conn
+
+
+def baglan(*args, **kwargs) -> sqlite3.Connection:
+    """sqlite3.connect + baglantiya_kaydet."""
+    return baglantiya_kaydet(sqlite3.connect(*args, **kwargs))
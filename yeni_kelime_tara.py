@@ -1,36 +1,42 @@
 # 
 
 import os
-import sqlite3
 import re
+import sys
+import json
+import hashlib
+import argparse
 import multiprocessing as mp
-from typing import List, Set, Dict, Tuple
+from typing import Iterator, List, Set, Dict, Tuple, Optional
 from tqdm import tqdm # İlerleme çubuğu için
-import itertools # İlerlemeyi daha iyi yönetmek için
 import math
 import time
+from collections import Counter
+import morfoloji
+import turkce
 from aktalib import show_time
 
-# Zemberek importu ve başlatılması
-# DİKKAT: Zemberek'in her alt süreçte (child process) yeniden başlatılması gerekir.
-try:
-    from zemberek import TurkishMorphology
-    
-    # Global değişkenler, multiprocessing'de her süreç için kopyalanır.
-    GLOBAL_MORPHOLOGY = None
-
-    def init_morphology():
-        """Her alt süreç için Zemberek'i başlatır."""
-        global GLOBAL_MORPHOLOGY
-        if GLOBAL_MORPHOLOGY is None:
-            # Sadece bir kere başlat
-            GLOBAL_MORPHOLOGY = TurkishMorphology.create_with_defaults()
-            # print(f"Zemberek başlatıldı (PID: {os.getpid()})")
-except ImportError:
-    print("Zemberek kütüphanesi bulunamadı. Morfolojik analiz devre dışı.")
-    GLOBAL_MORPHOLOGY = None
-    def init_morphology():
-        pass
+# Morfoloji arka ucu (morfoloji.py). DERLEM_MORFOLOJI ortam değişkeniyle değiştirilebilir:
+# 'python' (saf Python zemberek), 'jpype' (zemberek-full.jar) veya 'bos'.
+MORFOLOJI_ARKA_UCU = 'python'
+
+# Her işçiye tek seferde gönderilen kelime sayısı (bir analyze_batch çağrısı)
+KONTROL_GRUP_BOYUTU = 256
+
+# DİKKAT: Analizci her alt süreçte (child process) yeniden başlatılır.
+# Global değişkenler, multiprocessing'de her süreç için kopyalanır.
+GLOBAL_ANALIZCI = None
+
+def init_morphology():
+    """Her alt süreç için morfoloji arka ucunu başlatır."""
+    global GLOBAL_ANALIZCI
+    if GLOBAL_ANALIZCI is None:
+        # Sadece bir kere başlat
+        try:
+            GLOBAL_ANALIZCI = morfoloji.analizci_olustur(varsayilan=MORFOLOJI_ARKA_UCU)
+        except (ImportError, OSError) as e:
+            print(f"Zemberek arka ucu başlatılamadı ({e}). Morfolojik analiz devre dışı.")
+            GLOBAL_ANALIZCI = morfoloji.BosAnalizci()
 
 
 # --- Yapılandırma ve Eşik Değerleri (Aynı Kalıyor) ---
@@ -39,6 +45,26 @@ OY_UST_ESIK = 0.01044
 
 KESIN_TURKCE_CIKTI = 'yeni_kesin_turkce_adaylari.txt'
 OLASI_TURKCE_CIKTI = 'yeni_olasi_turkce_adaylari.txt'
+# Frekanslı çıktılar (kelime<TAB>frekans, en sık geçenden en aza sıralı)
+KESIN_FREKANS_CIKTI = 'yeni_kesin_turkce_adaylari_frekans.tsv'
+OLASI_FREKANS_CIKTI = 'yeni_olasi_turkce_adaylari_frekans.tsv'
+
+# --- Çalışma Defteri (Kaldığı Yerden Devam) ---
+# Sayımı biten her dosya (yol, boyut, mtime, içerik özeti ve kelime sayımlarıyla) ve
+# sınıflandırılan her aday parçası bu JSON-lines dosyasına eklenir.
+# --resume ile sayılmış dosyalar ve sınıflandırılmış kelimeler atlanır.
+CALISMA_DEFTERI = 'yeni_kelime_tara_defter.jsonl'
+
+# --- Frekans Budama ---
+# Tüm derlemde (bütün dosyaların toplamında) MIN_FREKANS'tan az geçen kelimeler
+# (tek seferlik yazım/OCR hataları) morfolojik analize hiç gönderilmez.
+MIN_FREKANS = 2
+# Analiz edilecek en fazla kelime sayısı (None: sınırsız).
+# Derlemde en sık geçen MAX_ADAY kelime tutulur.
+MAX_ADAY = None
+# Sınıflandırma bu kadar kelimelik parçalarla yapılır; her parçadan sonra çıktılar yazılır
+# ve sonuçlar deftere eklenir.
+SINIFLANDIRMA_PARCASI = 50000
 
 SESLI_HARFLER = set('aâeıiîoöuü')
 TURKISH_CHARS = set('çğıöşü')
@@ -66,7 +92,7 @@ def check_consecutive_vowels(word: str, max_vowels: int = 2) -> bool:
     Kelimenin max_vowels'tan fazla ardışık ünlü içerip içermediğini kontrol eder.
     Dönüş: True ise kurala aykırıdır (yani KÖTÜ), False ise uygundur (İYİ).
     """
-    word_lower = word.lower()
+    word_lower = turkce.kucult(word)
     consecutive_count = 0
     
     for char in word_lower:
@@ -139,7 +165,7 @@ def calculate_trigram_score(word: str) -> float:
     """Kelimenin 3-Gram Log-Olasılık Puanını hesaplar."""
     if not TR_MODEL: return 1.0 
         
-    word_lower = word.lower()
+    word_lower = turkce.kucult(word)
     
     trigrams_in_word = []
     # Kelimeyi sadece geçerli harflerle filtrele
@@ -170,7 +196,7 @@ def calculate_trigram_score(word: str) -> float:
 def calculate_ratios(word: str) -> Tuple[float, float]:
     """Türkçe ve Yabancı harf oranlarını hesaplar (Aynı)."""
     # ... (Önceki koddan calculate_ratios fonksiyonunu buraya kopyalayın)
-    word_lower = word.lower()
+    word_lower = turkce.kucult(word)
     only_letters = "".join(filter(str.isalpha, word_lower))
     total_letter_count = len(only_letters)
     
@@ -182,12 +208,13 @@ def calculate_ratios(word: str) -> Tuple[float, float]:
     
     return turkce_char_count / total_letter_count, foreign_char_count / total_letter_count
 
-def check_word_candidate(word: str) -> Tuple[str, str]:
+def check_word_candidate(word: str, is_zemberek_approved: Optional[bool] = None) -> Tuple[str, str]:
     """
     Bir kelimenin Türkçe olma olasılığını kontrol eder ve sınıflandırır.
     Zemberek, Ardışık Ünlü ve 3-Gram filtresi uygular.
+    is_zemberek_approved verilmişse (toplu analizden) Zemberek yeniden çağrılmaz.
     """
-    word = word.strip().lower()
+    word = turkce.kucult(word.strip())
     if len(word) < 4:
         return word, 'YOK'
 
@@ -198,30 +225,12 @@ def check_word_candidate(word: str) -> Tuple[str, str]:
         return word, 'YOK'
 
     # 2. Morfolojik Analiz (KESİN Aday Kontrolü)
-    is_zemberek_approved = False
-    
-    if GLOBAL_MORPHOLOGY:
-        try:
-            # Sadece bir kere analiz yap
-            analysis = GLOBAL_MORPHOLOGY.analyze(word)
-            
-            # API Kontrolü: Doğru sonuç listesi alanını bul
-            results_list = None
-            if hasattr(analysis, 'getAnalysisResults'):
-                results_list = analysis.getAnalysisResults()
-            elif hasattr(analysis, 'results'):
-                results_list = analysis.results
-            elif hasattr(analysis, 'get_results'):
-                 results_list = analysis.get_results()
-            elif hasattr(analysis, 'analysis_results'):
-                 results_list = analysis.analysis_results
-
-            # Kesin Kontrol: Analiz sonuçları listesi boş değilse Morfolojik Onay başarılıdır.
-            if results_list and len(results_list) > 0:
-                is_zemberek_approved = True
-                
-        except Exception:
-            pass
+    # Kesin Kontrol: Zemberek bir analiz sonucu döndürdüyse Morfolojik Onay başarılıdır.
+    if is_zemberek_approved is None:
+        is_zemberek_approved = False
+        if GLOBAL_ANALIZCI is not None:
+            sonuc = GLOBAL_ANALIZCI.analyze(word)
+            is_zemberek_approved = sonuc is not None and sonuc[5] == 'zemberek'
     
     # KESİN Filtreleme Uygulama: Zemberek + Ardışık Ünlü + 3-Gram
     if is_zemberek_approved:
@@ -249,75 +258,180 @@ def check_word_candidate(word: str) -> Tuple[str, str]:
 
     return word, 'YOK'
 
-def metin_dosyasindan_kelime_ayikla(file_path: str, lexicon: Set[str], pool: mp.Pool) -> Dict[str, Set[str]]:
-    """Metin dosyasından kelimeleri ayıklar, havuza gönderir ve sonuçları toplar."""
-    
+def check_word_batch(words: List[str]) -> List[Tuple[str, str]]:
+    """
+    Bir kelime grubunu tek bir analyze_batch çağrısıyla sınıflandırır.
+    Zemberek'e sadece uzunluk ve yabancı harf ön filtrelerini geçen kelimeler gider.
+    """
+    words = [turkce.kucult(word.strip()) for word in words]
+    gecenler = [word for word in words if len(word) >= 4 and calculate_ratios(word)[1] <= OY_UST_ESIK]
+
+    onaylar = {}
+    if GLOBAL_ANALIZCI is not None and gecenler:
+        for word, sonuc in zip(gecenler, GLOBAL_ANALIZCI.analyze_batch(gecenler)):
+            onaylar[word] = sonuc is not None and sonuc[5] == 'zemberek'
+
+    return [check_word_candidate(word, onaylar.get(word, False)) for word in words]
+
+def metin_dosyasindan_kelime_say(file_path: str, lexicon: Set[str]) -> Optional[Counter]:
+    """
+    Metin dosyasındaki kelimeleri sayar; lexicon'da olan ve kısa (< 4 harf) kelimeler atılır.
+    Budama burada yapılmaz: bir dosyada tek geçen kelime başka dosyalarda da geçebilir
+    (bkz. adaylari_sec). Dosya bulunamazsa None döner.
+    """
     WORD_REGEX = re.compile(r'[a-zçğıöşü]+')
-    words_to_check = []
-    
-    # 1. Tüm kelimeleri hızlıca oku ve filtrele (ana süreçte)
+    frekanslar = Counter()
+
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             for line in tqdm(f, desc=f"Dosya Okuma: {os.path.basename(file_path)}"):
-                line = line.lower()
-                words = WORD_REGEX.findall(line)
-                
-                for word in words:
-                    if word not in lexicon and len(word) >= 4:
-                        words_to_check.append(word)
-                        
+                frekanslar.update(WORD_REGEX.findall(turkce.kucult(line)))
     except FileNotFoundError:
         print(f"\nUyarı: Dosya bulunamadı: {file_path}")
-        return {'KESIN': set(), 'OLASI': set()}
+        return None
 
-    # Sadece benzersiz kelimeleri kontrol et (iş yükünü azaltır)
-    unique_words = list(set(words_to_check))
-    print(f"Kontrol edilecek benzersiz kelime sayısı: {len(unique_words):,}")
+    # Lexicon'da olan ve kısa kelimeleri sayımdan sonra tek seferde at (satır başına değil)
+    toplam_benzersiz = len(frekanslar)
+    sayim = Counter({word: count for word, count in frekanslar.items()
+                     if len(word) >= 4 and word not in lexicon})
+    print(f"Benzersiz kelime: {toplam_benzersiz:,}. Lexicon dışı: {len(sayim):,}")
+    return sayim
 
-    # 2. Kelime kontrolünü çoklu işlem havuzuna gönder
-    candidates = {'KESIN': set(), 'OLASI': set()}
-    
-    # tqdm ile ilerleme takibi
-    results = pool.imap(check_word_candidate, unique_words)
-    
-    # Sonuçları işleme
-    for word, result_type in tqdm(results, total=len(unique_words), desc="Kelime Kontrolü"):
-        if result_type == 'KESIN':
-            candidates['KESIN'].add(word)
-        elif result_type == 'OLASI':
-            candidates['OLASI'].add(word)
+def adaylari_sec(frekanslar: Counter, lexicon: Set[str], min_frekans: int = MIN_FREKANS,
+                 max_aday: Optional[int] = MAX_ADAY) -> List[Tuple[str, int]]:
+    """
+    Derlem genelindeki sayımlardan analiz edilecek adayları seçer: toplam frekansı min_frekans'tan
+    az olanlar budanır, kalanlar en sık geçenden başlayarak sıralanır.
+    (Defterden gelen sayımlar için lexicon'a sonradan eklenen kelimeler de burada atılır.)
+    """
+    adaylar = [(word, count) for word, count in frekanslar.items()
+               if count >= min_frekans and word not in lexicon]
+
+    # En sık geçenler önce: yarıda kalan bir çalışma bile en değerli adayları üretmiş olur
+    adaylar.sort(key=lambda item: item[1], reverse=True)
+    if max_aday is not None:
+        adaylar = adaylar[:max_aday]
+    return adaylar
 
+def adaylari_siniflandir(kelimeler: List[str], pool: mp.Pool) -> Iterator[Tuple[str, str]]:
+    """
+    Kelimeleri çoklu işlem havuzunda sınıflandırır; (kelime, tür) çiftlerini verir.
+    Kelimeler gruplar halinde gönderilir: her grup, işçide tek bir analyze_batch çağrısıdır.
+    imap sırayı korur, böylece en sık geçen kelimelerin sonuçları önce gelir.
+    """
+    gruplar = (kelimeler[i:i + KONTROL_GRUP_BOYUTU] for i in range(0, len(kelimeler), KONTROL_GRUP_BOYUTU))
+    with tqdm(total=len(kelimeler), desc="Kelime Kontrolü") as ilerleme:
+        for grup_sonucu in pool.imap(check_word_batch, gruplar):
+            yield from grup_sonucu
+            ilerleme.update(len(grup_sonucu))
+
+def adaylari_grupla(adaylar: List[Tuple[str, int]], siniflar: Dict[str, str]) -> Dict[str, Dict[str, int]]:
+    """Sınıflandırılmış adayları türlerine göre toplar: {'KESIN': {kelime: frekans}, 'OLASI': {...}}"""
+    candidates = {'KESIN': {}, 'OLASI': {}}
+    for word, count in adaylar:
+        tur = siniflar.get(word)
+        if tur in candidates:
+            candidates[tur][word] = count
     return candidates
 
 # --- Dosya Yazma ve Main Fonksiyonları (Optimize Edildi) ---
 
-def dosyaya_yaz_optimizeli(candidates: Dict[str, Set[str]]):
-    """Bulunan adayları dosyaya yazar (Var olanı silip yeniden yazar)."""
+def _adaylari_yaz(dosya_adi: str, frekans_dosyasi: str, adaylar: Dict[str, int], etiket: str) -> bool:
+    """Bir aday grubunu alfabetik (Türkçe sıralı) liste ve frekanslı TSV olarak yazar."""
+    try:
+        with open(dosya_adi, 'w', encoding='utf-8', errors='ignore') as f:
+            print(f"'{len(adaylar):,}' {etiket} adayı yazılıyor...")
+            f.write('\n'.join(sorted(adaylar, key=turkce.sirala_anahtari)) + '\n')
+
+        # Gözden geçirenler için: en sık geçen aday en üstte
+        with open(frekans_dosyasi, 'w', encoding='utf-8', errors='ignore') as f:
+            for word, count in sorted(adaylar.items(), key=lambda item: (-item[1], turkce.sirala_anahtari(item[0]))):
+                f.write(f"{word}\t{count}\n")
+    except Exception as e:
+        print(f"UYARI: {dosya_adi} dosyası işlenirken beklenmedik hata oluştu: {e}")
+        return False
+    return True
+
+def dosyaya_yaz_optimizeli(candidates: Dict[str, Dict[str, int]]):
+    """Bulunan adayları (frekanslarıyla) dosyaya yazar (Var olanı silip yeniden yazar)."""
     
     # Var olan çıktıları sil (tekrar yazmayı önlemek için)
-    if os.path.exists(KESIN_TURKCE_CIKTI): os.remove(KESIN_TURKCE_CIKTI)
-    if os.path.exists(OLASI_TURKCE_CIKTI): os.remove(OLASI_TURKCE_CIKTI)
+    for path in (KESIN_TURKCE_CIKTI, OLASI_TURKCE_CIKTI, KESIN_FREKANS_CIKTI, OLASI_FREKANS_CIKTI):
+        if os.path.exists(path): os.remove(path)
 
     # Kesin adayları yaz
-    try:
-        with open(KESIN_TURKCE_CIKTI, 'w', encoding='utf-8', errors='ignore') as f:
-            print(f"'{len(candidates['KESIN']):,}' kesin adayı yazılıyor...")
-            f.write('\n'.join(sorted(candidates['KESIN'])) + '\n')
-    except Exception as e:
-        print(f"UYARI: {KESIN_TURKCE_CIKTI} dosyası işlenirken beklenmedik hata oluştu: {e}")
-        return {'KESIN': set(), 'OLASI': set()}
+    if not _adaylari_yaz(KESIN_TURKCE_CIKTI, KESIN_FREKANS_CIKTI, candidates['KESIN'], 'kesin'):
+        return
     
-    try:
-        # Olası adayları yaz
-        with open(OLASI_TURKCE_CIKTI, 'w', encoding='utf-8', errors='ignore') as f:
-            print(f"'{len(candidates['OLASI']):,}' olası adayı yazılıyor...")
-            f.write('\n'.join(sorted(candidates['OLASI'])) + '\n')
-    except Exception as e:
-        print(f"UYARI: {OLASI_TURKCE_CIKTI} dosyası işlenirken beklenmedik hata oluştu: {e}")
-        return {'KESIN': set(), 'OLASI': set()}
+    # Olası adayları yaz
+    _adaylari_yaz(OLASI_TURKCE_CIKTI, OLASI_FREKANS_CIKTI, candidates['OLASI'], 'olası')
+
+# --- Çalışma Defteri Fonksiyonları ---
 
-def main(target: str, mode: str):
-    """Ana program akışını yönetir."""
+def dosya_ozeti(file_path: str, blok_boyutu: int = 1 << 20) -> str:
+    """Dosya içeriğinin SHA-256 özetini (büyük dosyalar için parça parça) hesaplar."""
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for blok in iter(lambda: f.read(blok_boyutu), b''):
+            h.update(blok)
+    return h.hexdigest()
+
+def defteri_yukle(defter_yolu: str) -> Tuple[Dict[str, dict], Dict[str, str]]:
+    """
+    Çalışma defterini okur: (dosya kayıtları, {kelime: sınıflandırma sonucu}).
+    Aynı dosya için en son kayıt geçerlidir.
+    """
+    kayitlar = {}
+    siniflar = {}
+    if not os.path.exists(defter_yolu):
+        return kayitlar, siniflar
+    with open(defter_yolu, 'r', encoding='utf-8') as f:
+        for satir in f:
+            try:
+                kayit = json.loads(satir)
+            except json.JSONDecodeError:
+                # Çökme anında yarım kalmış son satır: yok say, o dosya/parça yeniden işlenir.
+                continue
+            if 'siniflar' in kayit:
+                siniflar.update(kayit['siniflar'])
+            elif 'path' in kayit:
+                kayitlar[kayit['path']] = kayit
+    return kayitlar, siniflar
+
+def deftere_ekle(defter_yolu: str, kayit: dict):
+    """Tamamlanan dosyanın kaydını deftere ekler ve diske yazılmasını garantiler."""
+    with open(defter_yolu, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(kayit, ensure_ascii=False) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+def defter_kaydi_gecerli_mi(kayit: Optional[dict], file_path: str) -> bool:
+    """
+    Defterdeki kaydın dosyanın şimdiki haliyle uyumlu olup olmadığını kontrol eder.
+    Boyut ve mtime aynıysa özet hesaplanmaz; sadece mtime değiştiyse (ör. kopyalama)
+    içerik özetine bakılır. Kelime sayımı içermeyen (eski biçimli) kayıtlar geçersizdir.
+    """
+    if not kayit or 'frekanslar' not in kayit:
+        return False
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return False
+    if st.st_size != kayit['size']:
+        return False
+    if st.st_mtime == kayit['mtime']:
+        return True
+    return dosya_ozeti(file_path) == kayit['sha256']
+
+def main(target: str, mode: str, min_frekans: int = MIN_FREKANS, max_aday: Optional[int] = MAX_ADAY,
+         resume: bool = False, defter_yolu: str = CALISMA_DEFTERI):
+    """
+    Ana program akışını yönetir.
+    resume=True ise defterde sayımı tamamlanmış görünen (ve değişmemiş) dosyaların sayımları ve
+    daha önce sınıflandırılmış kelimelerin sonuçları defterden okunur; yeni eklenen veya değişen
+    dosyalar sayılır, kalan adaylar sınıflandırılır.
+    Frekans budaması (min_frekans) ve max_aday tüm dosyaların toplam sayımına bir kez uygulanır.
+    """
     t0 = time.time()    # Başlangıç zamanı
     
     # ... (Lexicon yükleme kısmı aynı kalır)
@@ -325,7 +439,7 @@ def main(target: str, mode: str):
     lexicon = set()
     try:
         with open('tr_lexicon.txt', 'r', encoding='utf-8') as f:
-            lexicon.update(line.strip().lower() for line in f if line.strip())
+            lexicon.update(turkce.kucult(line.strip()) for line in f if line.strip())
         print(f"'{len(lexicon)}' kelime mevcut lexikon'dan yüklendi.")
     except FileNotFoundError:
         print("tr_lexicon.txt dosyası bulunamadı. Boş bir lexicon ile devam ediliyor.")
@@ -339,41 +453,107 @@ def main(target: str, mode: str):
         print("Geçersiz mod belirlendi. (path veya folder olmalı)")
         return
     
-    load_trigram_model()
-    
-    # 2. Multiprocessing Havuzunu Başlat
-    cpu_count = mp.cpu_count()
-    print(f"Kullanılabilir CPU çekirdek sayısı: {cpu_count}")
-    # Zemberek'in başlatılması (her alt süreçte)
-    with mp.Pool(processes=cpu_count - 1 or 1, initializer=init_morphology) as pool:
-        
-        final_candidates = {'KESIN': set(), 'OLASI': set()}
-        
-        print(f"Toplam {len(all_files_to_process)} dosya işlenecek...")
-        
-        for file_path in all_files_to_process:
-            print(f"\n-> İŞLENİYOR: {file_path}")
-            new_candidates = metin_dosyasindan_kelime_ayikla(file_path, lexicon, pool)
-            
-            # Ana bellekte adayları birleştir
-            final_candidates['KESIN'].update(new_candidates['KESIN'])
-            final_candidates['OLASI'].update(new_candidates['OLASI'])
-            
-            # Burası aralıklı yazma noktasıdır (Dosya bazında yazma)
-            # İsteğe bağlı: Her dosya bittiğinde çıktıyı yazmak güvenilirliği artırır.
-            dosyaya_yaz_optimizeli(final_candidates)
-
+    defter, siniflar = {}, {}
+    if resume:
+        defter, siniflar = defteri_yukle(defter_yolu)
+    elif os.path.exists(defter_yolu):
+        # Yeni çalışma: eski defter geçersizdir
+        os.remove(defter_yolu)
+
+    # 2. Derlem genelinde kelime sayımı (ana süreçte; dosya başına budama yapılmaz)
+    toplam_frekanslar = Counter()
+    defterden = 0
+    for file_path in all_files_to_process:
+        kayit = defter.get(os.path.abspath(file_path))
+        if defter_kaydi_gecerli_mi(kayit, file_path):
+            toplam_frekanslar.update(kayit['frekanslar'])
+            defterden += 1
+            continue
+        print(f"\n-> SAYILIYOR: {file_path}")
+        # Dosya kimliği sayımdan ÖNCE alınır: sayım sırasında değişirse sonraki devamda yeniden sayılır.
+        try:
+            st = os.stat(file_path)
+            ozet = dosya_ozeti(file_path)
+        except FileNotFoundError:
+            print(f"\nUyarı: Dosya bulunamadı: {file_path}")
+            continue
+        sayim = metin_dosyasindan_kelime_say(file_path, lexicon)
+        if sayim is None:
+            continue
+        toplam_frekanslar.update(sayim)
+        deftere_ekle(defter_yolu, {
+            'path': os.path.abspath(file_path),
+            'size': st.st_size,
+            'mtime': st.st_mtime,
+            'sha256': ozet,
+            'frekanslar': sayim,
+        })
+    if resume:
+        print(f"Devam modu: {defterden} dosyanın sayımı defterden alındı, "
+              f"{len(all_files_to_process) - defterden} dosya sayıldı.")
+
+    # 3. Budama derlem toplamına bir kez uygulanır
+    adaylar = adaylari_sec(toplam_frekanslar, lexicon, min_frekans, max_aday)
+    print(f"{len(all_files_to_process)} dosyada lexicon dışı benzersiz kelime: {len(toplam_frekanslar):,}. "
+          f"Budama sonrası kontrol edilecek (toplam frekans >= {min_frekans}): {len(adaylar):,}")
+    del toplam_frekanslar
+
+    kalanlar = [word for word, _ in adaylar if word not in siniflar]
+    if resume and len(kalanlar) < len(adaylar):
+        print(f"Devam modu: {len(adaylar) - len(kalanlar):,} adayın sonucu defterden alındı.")
+
+    if not kalanlar:
+        dosyaya_yaz_optimizeli(adaylari_grupla(adaylar, siniflar))
+        print("Sınıflandırılacak yeni aday yok.")
+    else:
+        load_trigram_model()
 
-    # 3. Sonuçları Dosyalara Kaydet (Son durumda yazma)
-    # Bu zaten döngünün içinde yapıldı. Sadece özet verelim.
+        # Arka uç gereksinimleri işçiler başlamadan denetlenir; başlatıcısı hata veren
+        # bir havuz, ölen işçileri durmadan yeniden başlatır.
+        try:
+            morfoloji.arka_ucu_denetle(None, MORFOLOJI_ARKA_UCU)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"HATA: Morfoloji arka ucu kullanılamıyor: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        # 4. Multiprocessing Havuzunu Başlat
+        cpu_count = mp.cpu_count()
+        print(f"Kullanılabilir CPU çekirdek sayısı: {cpu_count}")
+        # Zemberek'in başlatılması (her alt süreçte)
+        with mp.Pool(processes=cpu_count - 1 or 1, initializer=init_morphology) as pool:
+            print(f"Toplam {len(kalanlar):,} aday sınıflandırılacak...")
+            for i in range(0, len(kalanlar), SINIFLANDIRMA_PARCASI):
+                parca = dict(adaylari_siniflandir(kalanlar[i:i + SINIFLANDIRMA_PARCASI], pool))
+                siniflar.update(parca)
+                # Aralıklı yazma noktası: çıktılar her parçadan sonra yazılır, ardından parça tamamlandı
+                # olarak deftere eklenir
+                dosyaya_yaz_optimizeli(adaylari_grupla(adaylar, siniflar))
+                deftere_ekle(defter_yolu, {'siniflar': parca})
+
+    final_candidates = adaylari_grupla(adaylar, siniflar)
+
+    # 5. Sonuçları Dosyalara Kaydet (Son durumda yazma)
+    # Bu zaten parça döngüsünde (veya yeni aday yoksa yukarıda) yapıldı. Sadece özet verelim.
     print("\n--- İşlem Özeti ---")
     print(f"Yeni KESİN Türkçe Adayı (Morfolojik onaylı): {len(final_candidates['KESIN']):,} kelime.")
     print(f"Yeni OLASI Türkçe Adayı (Kural uyumlu): {len(final_candidates['OLASI']):,} kelime.")
     print(f"Sonuçlar '{KESIN_TURKCE_CIKTI}' ve '{OLASI_TURKCE_CIKTI}' dosyalarında mevcuttur.")
+    print(f"Frekanslı listeler: '{KESIN_FREKANS_CIKTI}' ve '{OLASI_FREKANS_CIKTI}'.")
     # print(f"Toplam zaman: {time.time() - t0:.2f} saniye.")
     show_time("Toplam çalışma süresi", t0, t0)
 
 if __name__ == "__main__":
-    # Tekrar deneme amaçlı kullanım:
-    main('tr_corpus_wiki.txt', 'path')
-    # main('kaynak_metnler/', 'folder') 
+    # Örnekler:
+    #   python yeni_kelime_tara.py                                  (tr_corpus_wiki.txt)
+    #   python yeni_kelime_tara.py kaynak_metnler/ --mode folder
+    #   python yeni_kelime_tara.py kaynak_metnler/ --mode folder --resume
+    parser = argparse.ArgumentParser(description="Metinlerden yeni Türkçe kelime adaylarını çıkarır.")
+    parser.add_argument('target', nargs='?', default='tr_corpus_wiki.txt', help="Dosya veya klasör yolu")
+    parser.add_argument('--mode', choices=('path', 'folder'), default='path')
+    parser.add_argument('--resume', action='store_true',
+                        help="Defterde tamamlanmış görünen dosyaları atla, kalanları işle")
+    parser.add_argument('--min-frekans', type=int, default=MIN_FREKANS)
+    parser.add_argument('--max-aday', type=int, default=MAX_ADAY)
+    args = parser.parse_args()
+
+    main(args.target, args.mode, args.min_frekans, args.max_aday, resume=args.resume) 